@@ -0,0 +1,188 @@
+"""Benchmark the format parsers and API entry points.
+
+Times ``load``, ``loads``, ``determine_format``, and format ``parse`` methods
+over the files in ``tests/audio`` and large synthetic files.
+Reports the best time per call, throughput, peak traced memory during a call,
+and memory and allocated blocks still held by the result.
+
+Results are compared to a baseline saved in ``benchmarks/baseline.json``,
+and the exit status is 1 if any case is slower or uses more memory than the tolerance allows.
+Baseline timings are only comparable on the machine that recorded them,
+so the baseline isn't tracked; save a local one before making changes::
+
+	python -m benchmarks --save
+	python -m benchmarks
+
+Run with ``nox -s bench``, passing arguments after ``--``.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import warnings
+from itertools import chain
+from pathlib import Path
+
+from .cases import (
+	fixture_cases,
+	synthetic_cases,
+)
+
+BASELINE_FILEPATH = Path(__file__).resolve().parent / 'baseline.json'
+
+
+def measure(case, *, repeat):
+	timer = timeit.Timer(case.func)
+	number, _ = timer.autorange()
+	best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+	gc.collect()
+	tracemalloc.start()
+	try:
+		result = case.func()  # noqa: F841
+		retained, peak = tracemalloc.get_traced_memory()
+		blocks = sum(
+			stat.count
+			for stat in tracemalloc.take_snapshot().statistics('filename')
+		)
+	finally:
+		tracemalloc.stop()
+
+	return {
+		'time': best,
+		'throughput': case.size / best,
+		'peak': peak,
+		'retained': retained,
+		'blocks': blocks,
+	}
+
+
+def compare(result, baseline, tolerance):
+	regressions = []
+	for key in ['time', 'peak', 'retained']:
+		# Small absolute differences in memory are noise from interpreter internals.
+		if (
+			result[key] > baseline[key] * (1 + tolerance)
+			and (
+				key == 'time'
+				or result[key] - baseline[key] > 4096
+			)
+		):
+			regressions.append(f"{key} {result[key] / baseline[key]:.2f}x")
+
+	return regressions
+
+
+def format_row(name, result, regressions):
+	return (
+		f"{name:<60} "
+		f"{result['time'] * 1000:>10.3f} ms "
+		f"{result['throughput'] / 1024 / 1024:>9.1f} MiB/s "
+		f"{result['peak'] / 1024:>10.1f} KiB "
+		f"{result['retained'] / 1024:>10.1f} KiB "
+		f"{result['blocks']:>8}"
+		+ (f"  REGRESSION: {', '.join(regressions)}" if regressions else '')
+	)
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(
+		prog='python -m benchmarks',
+		description="Benchmark the audio-metadata format parsers and API entry points.",
+	)
+	parser.add_argument(
+		'-k',
+		dest='filters',
+		action='append',
+		default=[],
+		help="Only run cases with names containing this substring. Can be given multiple times.",
+	)
+	parser.add_argument(
+		'--repeat',
+		type=int,
+		default=3,
+		help="Number of timing runs per case; the best is reported. (Default: 3)",
+	)
+	parser.add_argument(
+		'--tolerance',
+		type=float,
+		default=0.25,
+		help="Allowed relative increase over the baseline before a case is a regression. (Default: 0.25)",
+	)
+	parser.add_argument(
+		'--baseline',
+		type=Path,
+		default=BASELINE_FILEPATH,
+		help="Baseline file to compare against or save to.",
+	)
+	parser.add_argument(
+		'--save',
+		action='store_true',
+		help="Save results to the baseline file instead of comparing. Results of cases not run are kept.",
+	)
+	args = parser.parse_args(argv)
+
+	baseline = {}
+	if args.baseline.exists():
+		baseline = json.loads(args.baseline.read_text())['results']
+
+	warnings.simplefilter('ignore')
+
+	print(
+		f"{'case':<60} {'time':>13} {'throughput':>15} {'peak':>14} {'retained':>14} {'blocks':>8}"
+	)
+
+	results = {}
+	num_regressions = 0
+	with tempfile.TemporaryDirectory() as directory:
+		for case in chain(fixture_cases(), synthetic_cases(directory)):
+			if args.filters and not any(f in case.name for f in args.filters):
+				continue
+
+			result = measure(case, repeat=args.repeat)
+			results[case.name] = result
+
+			regressions = []
+			if (
+				not args.save
+				and case.name in baseline
+			):
+				regressions = compare(result, baseline[case.name], args.tolerance)
+				num_regressions += bool(regressions)
+
+			print(format_row(case.name, result, regressions), flush=True)
+
+	if args.save:
+		# Keep baseline results for cases that weren't run.
+		baseline.update(results)
+
+		args.baseline.write_text(
+			json.dumps(
+				{
+					'python': platform.python_version(),
+					'platform': platform.platform(),
+					'results': baseline,
+				},
+				indent='\t',
+				sort_keys=True,
+			)
+			+ '\n'
+		)
+		print(f"\nSaved baseline to {args.baseline}.")
+	elif not baseline:
+		print("\nNo baseline to compare with. Save one with --save.")
+	elif num_regressions:
+		print(f"\n{num_regressions} case(s) regressed more than {args.tolerance:.0%} from the baseline.")
+
+		return 1
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,137 @@
+"""Benchmark cases over the test fixtures and synthetic files."""
+
+__all__ = [
+	'Case',
+	'fixture_cases',
+	'synthetic_cases',
+]
+
+import pickle
+import struct
+from collections import namedtuple
+from functools import partial
+from pathlib import Path
+
+from tbm_utils import DataReader
+
+from audio_metadata import (
+	FLAC,
+	MP3,
+	WAVE,
+	Format,
+	ID3v2,
+	OggOpus,
+	OggVorbis,
+	VorbisComments,
+	determine_format,
+	load,
+	loads,
+)
+from audio_metadata.utils import (
+	apply_unsynchronization,
+	remove_unsynchronization,
+)
+from . import synthetic
+
+AUDIO_DIR = Path(__file__).resolve().parent.parent / 'tests' / 'audio'
+
+Case = namedtuple('Case', ['name', 'func', 'size'])
+
+
+def _flac_vorbis_comments(b):
+	# Raw Vorbis comment block from the metadata blocks of a FLAC file.
+	offset = 4
+	while offset < len(b):
+		block_type = b[offset] & 0x7F
+		block_size = struct.unpack('>I', b'\x00' + b[offset + 1:offset + 4])[0]
+		offset += 4
+
+		if block_type == 4:
+			return b[offset:offset + block_size]
+
+		if b[offset - 4] & 0x80:
+			break
+
+		offset += block_size
+
+	return None
+
+
+def _id3v2_parse(b):
+	return ID3v2.parse(DataReader(b))
+
+
+def _cases(label, filepath, b, *, format_cls=None):
+	if format_cls is None:
+		format_cls = determine_format(b)
+
+	yield Case(f'load[{label}]', partial(load, filepath), len(b))
+	yield Case(f'loads[{label}]', partial(loads, b), len(b))
+	yield Case(f'determine_format[{label}]', partial(determine_format, b), len(b))
+	yield Case(f'{format_cls.__name__}.parse[{label}]', partial(format_cls.parse, b), len(b))
+
+	if format_cls in [OggOpus, OggVorbis]:
+		yield Case(
+			f'{format_cls.__name__}.parse(verify_crc=True)[{label}]',
+			partial(format_cls.parse, b, verify_crc=True),
+			len(b),
+		)
+
+	if b.startswith(b'ID3'):
+		yield Case(f'ID3v2.parse[{label}]', partial(_id3v2_parse, b), len(b))
+
+	if b.startswith(b'fLaC'):
+		comments = _flac_vorbis_comments(b)
+		if comments is not None:
+			yield Case(f'VorbisComments.parse[{label}]', partial(VorbisComments.parse, comments), len(comments))
+
+
+def _serialization_cases(label, filepath):
+	metadata = load(filepath)
+	b = metadata.to_bytes()
+	p = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+
+	# Sizes are those of the serialized object, so throughput also compares their sizes.
+	yield Case(f'Format.to_bytes[{label}]', metadata.to_bytes, len(b))
+	yield Case(f'Format.from_bytes[{label}]', partial(Format.from_bytes, b), len(b))
+	yield Case(f'pickle.dumps[{label}]', partial(pickle.dumps, metadata, protocol=pickle.HIGHEST_PROTOCOL), len(p))
+	yield Case(f'pickle.loads[{label}]', partial(pickle.loads, p), len(p))
+
+
+def fixture_cases():
+	"""Generate cases for the audio files in ``tests/audio``."""
+
+	for filepath in sorted(AUDIO_DIR.iterdir()):
+		yield from _cases(filepath.name, filepath, filepath.read_bytes())
+
+
+def synthetic_cases(directory):
+	"""Generate cases for synthetic files written to ``directory``."""
+
+	files = [
+		('huge-id3v2.mp3', MP3, partial(synthetic.mp3_huge_id3v2, 2000, 1024 * 1024)),
+		('10k-values-id3v2.mp3', MP3, partial(synthetic.mp3_multi_value_id3v2, 10000)),
+		('unsync-id3v2.mp3', MP3, partial(synthetic.mp3_unsync_id3v2, 5 * 1024 * 1024)),
+		('huge-id3v2.wav', WAVE, partial(synthetic.wave_huge_id3v2, 2000, 1024 * 1024)),
+		('vbr-2-hours.mp3', MP3, partial(synthetic.mp3_vbr, 2 * 60 * 60)),
+		('10k-comments.flac', FLAC, partial(synthetic.flac_vorbis_comments, 10000)),
+		('10k-comments.opus', OggOpus, partial(synthetic.ogg_opus_vorbis_comments, 10000)),
+		('10k-comments.ogg', OggVorbis, partial(synthetic.ogg_vorbis_vorbis_comments, 10000)),
+	]
+
+	for filename, format_cls, generate in files:
+		b = generate()
+		filepath = Path(directory) / filename
+		filepath.write_bytes(b)
+
+		yield from _cases(filename, filepath, b, format_cls=format_cls)
+		yield from _serialization_cases(filename, filepath)
+
+	comments = synthetic.vorbis_comments(10000)
+	yield Case('VorbisComments.parse[10k-comments]', partial(VorbisComments.parse, comments), len(comments))
+
+	# Picture-like data with a byte that needs unsynchronization every 256 bytes.
+	b = bytes(range(256)) * (5 * 1024 * 1024 // 256)
+	unsync = apply_unsynchronization(b)
+	yield Case('apply_unsynchronization[5MiB]', partial(apply_unsynchronization, b), len(b))
+	yield Case('remove_unsynchronization[5MiB]', partial(remove_unsynchronization, unsync), len(unsync))
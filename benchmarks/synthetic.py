@@ -0,0 +1,336 @@
+"""Generators for large synthetic audio files.
+
+The files only contain enough audio structure for the parsers:
+valid headers, framing, and metadata, with zeroed audio data.
+"""
+
+__all__ = [
+	'flac_vorbis_comments',
+	'mp3_huge_id3v2',
+	'mp3_multi_value_id3v2',
+	'mp3_unsync_id3v2',
+	'mp3_vbr',
+	'ogg_opus_vorbis_comments',
+	'ogg_vorbis_vorbis_comments',
+	'vorbis_comments',
+	'wave_huge_id3v2',
+]
+
+import re
+import struct
+import zlib
+
+
+def _ogg_crc_table():
+	table = []
+	for i in range(256):
+		crc = i << 24
+		for _ in range(8):
+			if crc & 0x80000000:
+				crc = ((crc << 1) ^ 0x04C11DB7) & 0xFFFFFFFF
+			else:
+				crc = (crc << 1) & 0xFFFFFFFF
+
+		table.append(crc)
+
+	return table
+
+
+_OGG_CRC_TABLE = _ogg_crc_table()
+
+
+def _ogg_crc(data):
+	crc = 0
+	for b in data:
+		crc = ((crc << 8) & 0xFFFFFFFF) ^ _OGG_CRC_TABLE[(crc >> 24) ^ b]
+
+	return crc
+
+
+def _synchsafe(num):
+	return bytes(
+		(num >> shift) & 0x7F
+		for shift in (21, 14, 7, 0)
+	)
+
+
+def _png(size):
+	ihdr = b'IHDR' + struct.pack('>IIBBBBB', 1000, 1000, 8, 2, 0, 0, 0)
+	png = b'\x89PNG\r\n\x1a\n' + struct.pack('>I', 13) + ihdr + struct.pack('>I', zlib.crc32(ihdr))
+
+	return png + bytes(size - len(png))
+
+
+def _id3v24_frame(frame_id, frame_data):
+	return frame_id + _synchsafe(len(frame_data)) + b'\x00\x00' + frame_data
+
+
+def _id3v24_tag(num_frames, picture_size):
+	frames = [
+		_id3v24_frame(b'TIT2', b'\x03Synthetic'),
+		_id3v24_frame(b'TPE1', b'\x03audio-metadata'),
+		_id3v24_frame(b'TRCK', b'\x031/1'),
+	]
+
+	for i in range(num_frames):
+		if i % 2:
+			frames.append(
+				_id3v24_frame(b'TXXX', b'\x03description %d\x00value %d' % (i, i)),
+			)
+		else:
+			frames.append(
+				_id3v24_frame(b'COMM', b'\x03eng%d\x00comment %d' % (i, i)),
+			)
+
+	if picture_size:
+		frames.append(
+			_id3v24_frame(
+				b'APIC',
+				b'\x03image/png\x00\x03Cover\x00' + _png(picture_size),
+			),
+		)
+
+	frame_data = b''.join(frames)
+
+	# Keep the tag an even size so it doesn't need padding in RIFF chunks.
+	if len(frame_data) % 2:
+		frame_data += b'\x00'
+
+	return b'ID3\x04\x00\x00' + _synchsafe(len(frame_data)) + frame_data
+
+
+def _unsynchronize(data):
+	data = re.sub(rb'\xFF(?=[\x00\xE0-\xFF])', b'\xFF\x00', data)
+
+	if data.endswith(b'\xFF'):
+		data += b'\x00'
+
+	return data
+
+
+def _id3v23_unsync_tag(picture_size):
+	# After the PNG header, every 256 bytes of picture data
+	# has a 0xFF 0x00 pair that needs unsynchronization.
+	png = _png(picture_size)
+	picture = png[:33] + (bytes(range(256)) * (picture_size // 256 + 1))[33:picture_size]
+	frames = [
+		(b'TIT2', b'\x00Synthetic'),
+		(b'TPE1', b'\x00audio-metadata'),
+		(b'APIC', b'\x00image/png\x00\x03Cover\x00' + picture),
+	]
+
+	frame_data = _unsynchronize(
+		b''.join(
+			frame_id + struct.pack('>IH', len(data), 0) + data
+			for frame_id, data in frames
+		)
+	)
+
+	return b'ID3\x03\x00\x80' + _synchsafe(len(frame_data)) + frame_data
+
+
+def _mpeg_frames(num_frames, *, xing=False):
+	# MPEG 2.5 Layer III, 8 kHz, mono, cycling through bitrates.
+	# 576 samples per frame, so about 13.9 frames per second.
+	bitrate_indexes = [1, 2, 3, 4, 3, 2]
+	bitrates = [None, 8, 16, 24, 32]
+
+	frames = []
+	for i in range(num_frames):
+		bitrate_index = bitrate_indexes[i % len(bitrate_indexes)]
+		frame_size = 72 * bitrates[bitrate_index] * 1000 // 8000
+		header = bytes([0xFF, 0xE3, (bitrate_index << 4) | (2 << 2), 0xC0])
+
+		if i == 0 and xing:
+			# Xing header with a frame count of 0 forces every frame to be counted.
+			body = bytes(9) + b'Xing' + struct.pack('>II', 1, 0)
+			frames.append(header + body + bytes(frame_size - 4 - len(body)))
+		else:
+			frames.append(header + bytes(frame_size - 4))
+
+	return b''.join(frames)
+
+
+def _ogg_pages(packets, serial_number):
+	pages = []
+	sequence_number = 0
+
+	for packet_index, (packet, position) in enumerate(packets):
+		lacing = [255] * (len(packet) // 255) + [len(packet) % 255]
+
+		offset = 0
+		is_continued = False
+		while lacing:
+			page_lacing, lacing = lacing[:255], lacing[255:]
+			page_size = sum(page_lacing)
+
+			flags = 0
+			if is_continued:
+				flags |= 1
+			if sequence_number == 0:
+				flags |= 2
+			if not lacing and packet_index == len(packets) - 1:
+				flags |= 4
+
+			header = struct.pack(
+				'<4sBBqIIIB',
+				b'OggS', 0, flags,
+				position if not lacing else -1,
+				serial_number, sequence_number, 0, len(page_lacing),
+			)
+			page = bytearray(header + bytes(page_lacing) + packet[offset:offset + page_size])
+			page[22:26] = struct.pack('<I', _ogg_crc(page))
+			pages.append(bytes(page))
+
+			offset += page_size
+			sequence_number += 1
+			is_continued = True
+
+	return b''.join(pages)
+
+
+def vorbis_comments(num_comments, *, vendor=b'audio-metadata'):
+	"""Build a Vorbis comment block with ``num_comments`` comments."""
+
+	comments = [b'TITLE=Synthetic', b'ARTIST=audio-metadata']
+	comments.extend(
+		b'COMMENT%d=comment value %d' % (i % 100, i)
+		for i in range(num_comments - len(comments))
+	)
+
+	return b''.join(
+		[
+			struct.pack('<I', len(vendor)),
+			vendor,
+			struct.pack('<I', len(comments)),
+			*(
+				struct.pack('<I', len(comment)) + comment
+				for comment in comments
+			),
+		]
+	)
+
+
+def flac_vorbis_comments(num_comments):
+	"""Build a FLAC file with a Vorbis comment block of ``num_comments`` comments."""
+
+	streaminfo = struct.pack(
+		'>HH3s3sQ16s',
+		4096,
+		4096,
+		b'\x00\x00\x00',
+		b'\x00\x00\x00',
+		# 44.1 kHz, 2 channels, 16 bits, 10 minutes of samples.
+		(44100 << 44) | (1 << 41) | (15 << 36) | (44100 * 600),
+		bytes(16),
+	)
+	comments = vorbis_comments(num_comments)
+	padding = bytes(8192)
+
+	return b''.join(
+		[
+			b'fLaC',
+			b'\x00' + len(streaminfo).to_bytes(3, 'big'),
+			streaminfo,
+			b'\x04' + len(comments).to_bytes(3, 'big'),
+			comments,
+			b'\x81' + len(padding).to_bytes(3, 'big'),
+			padding,
+			bytes(64 * 1024),
+		]
+	)
+
+
+def ogg_opus_vorbis_comments(num_comments):
+	"""Build an Ogg Opus file with ``num_comments`` comments."""
+
+	packets = [
+		(b'OpusHead' + struct.pack('<BBHIhB', 1, 2, 312, 48000, 0, 0), 0),
+		(b'OpusTags' + vorbis_comments(num_comments), 0),
+	]
+	# 10 minutes of 20 ms packets, 50 per page.
+	packets.extend(
+		(bytes(50 * 80), 312 + (i + 1) * 48000)
+		for i in range(600)
+	)
+
+	return _ogg_pages(packets, 1)
+
+
+def ogg_vorbis_vorbis_comments(num_comments):
+	"""Build an Ogg Vorbis file with ``num_comments`` comments."""
+
+	packets = [
+		(b'\x01vorbis' + struct.pack('<IB4iBB', 0, 2, 44100, 0, 32000, 0, 0xB8, 1), 0),
+		(b'\x03vorbis' + vorbis_comments(num_comments) + b'\x01', 0),
+		(b'\x05vorbis' + bytes(3000), 0),
+	]
+	# 10 minutes of audio, 1 second per page.
+	packets.extend(
+		(bytes(4000), (i + 1) * 44100)
+		for i in range(600)
+	)
+
+	return _ogg_pages(packets, 1)
+
+
+def mp3_huge_id3v2(num_frames, picture_size):
+	"""Build an MP3 file with an ID3v2.4 tag of ``num_frames`` frames and a cover of ``picture_size`` bytes."""
+
+	return _id3v24_tag(num_frames, picture_size) + _mpeg_frames(100)
+
+
+def mp3_multi_value_id3v2(num_values):
+	"""Build an MP3 file with an ID3v2.4 tag of UTF-16 text frames with ``num_values`` values each."""
+
+	def utf16(values):
+		return b'\x01' + b'\x00\x00'.join(
+			b'\xff\xfe' + value.encode('utf-16-le')
+			for value in values
+		)
+
+	frames = b''.join(
+		[
+			_id3v24_frame(b'TPE1', utf16(f'Artist {i}' for i in range(num_values))),
+			_id3v24_frame(
+				b'TIPL',
+				utf16(
+					value
+					for i in range(num_values // 2)
+					for value in (f'role {i}', f'Person {i}')
+				),
+			),
+		]
+	)
+
+	return b'ID3\x04\x00\x00' + _synchsafe(len(frames)) + frames + _mpeg_frames(100)
+
+
+def mp3_unsync_id3v2(picture_size):
+	"""Build an MP3 file with an unsynchronized ID3v2.3 tag with a cover of ``picture_size`` bytes."""
+
+	return _id3v23_unsync_tag(picture_size) + _mpeg_frames(100)
+
+
+def mp3_vbr(duration):
+	"""Build a VBR MP3 file ``duration`` seconds long whose frames must all be counted."""
+
+	return _id3v24_tag(0, 0) + _mpeg_frames(int(duration * 8000 / 576), xing=True)
+
+
+def wave_huge_id3v2(num_frames, picture_size):
+	"""Build a WAVE file with an ID3v2.4 chunk of ``num_frames`` frames and a cover of ``picture_size`` bytes."""
+
+	fmt = struct.pack('<HHIIHH', 1, 2, 44100, 44100 * 4, 4, 16)
+	audio = bytes(44100 * 4)
+	id3 = _id3v24_tag(num_frames, picture_size)
+
+	chunks = b''.join(
+		[
+			b'fmt ' + struct.pack('<I', len(fmt)) + fmt,
+			b'data' + struct.pack('<I', len(audio)) + audio,
+			b'id3 ' + struct.pack('<I', len(id3)) + id3,
+		]
+	)
+
+	return b'RIFF' + struct.pack('<I', 4 + len(chunks)) + b'WAVE' + chunks
@@ -21,7 +21,7 @@ nox.options.sessions = [
 @nox.session
 def lint(session):
 	session.install('-U', '.[lint]')
-	session.run('flake8', 'src/', 'tests/')
+	session.run('flake8', 'src/', 'tests/', 'benchmarks/')
 
 
 @nox.session
@@ -62,6 +62,12 @@ def unit(session):
 	session.notify('report')
 
 
+@nox.session
+def bench(session):
+	session.install('-U', '.')
+	session.run('python', '-m', 'benchmarks', *session.posargs)
+
+
 @nox.session
 def report(session):
 	session.install('-U', 'coverage[toml]')
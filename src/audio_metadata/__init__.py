@@ -1,13 +1,17 @@
 from .__about__ import *
 from .api import *
+from .cache import *
 from .exceptions import *
 from .formats import *
 from .models import *
+from .readers import *
 
 __all__ = [
 	*__about__.__all__,
 	*api.__all__,
+	*cache.__all__,
 	*exceptions.__all__,
 	*formats.__all__,
 	*models.__all__,
+	*readers.__all__,
 ]
@@ -1,16 +1,37 @@
 __all__ = [
+	'LoadResult',
+	'aload',
+	'aload_many',
 	'determine_format',
 	'load',
+	'load_many',
 	'loads',
 ]
 
+import asyncio
 import os
+from concurrent.futures import (
+	FIRST_COMPLETED,
+	ProcessPoolExecutor,
+	ThreadPoolExecutor,
+	as_completed,
+	wait,
+)
+from functools import partial
 from io import (
 	BufferedReader,
 	FileIO,
 )
 
-from tbm_utils import DataReader
+import more_itertools
+from attr import (
+	attrib,
+	attrs,
+)
+from tbm_utils import (
+	AttrMapping,
+	DataReader,
+)
 
 from .exceptions import (
 	FormatError,
@@ -25,6 +46,184 @@ from .formats import (
 	OggOpus,
 	OggVorbis,
 )
+from .readers import (
+	MmapDataReader,
+	PlannedReader,
+	RangeReader,
+)
+
+
+@attrs(
+	repr=False,
+	kw_only=True,
+)
+class LoadResult(AttrMapping):
+	"""The result of loading a single file with :func:`load_many`.
+
+	Attributes:
+		filepath (str or os.PathLike): The filepath as given to :func:`load_many`.
+		metadata (Format): An audio format object if loading succeeded, else ``None``.
+		error (Exception): The exception raised if loading failed, else ``None``.
+	"""
+
+	filepath = attrib()
+	metadata = attrib(default=None)
+	error = attrib(default=None)
+
+
+async def aload(
+	f,
+	*,
+	executor=None,
+	io='buffered',
+	tags=True,
+	pictures=True,
+	frames=None,
+	lazy=False,
+	io_stats=None,
+):
+	"""Load audio metadata from a filepath or file-like object without blocking the event loop.
+
+	The file is read and parsed by :func:`load` in an executor.
+
+	Parameters:
+		f (str, os.PathLike, or file-like object):
+			A filepath, path-like object or file-like object of an audio file.
+		executor (concurrent.futures.Executor): The executor to load the file in.
+			The number of its workers limits the number of files open at once.
+			Default: The event loop's default executor
+		io (str): The I/O backend to read the file with. Default: ``'buffered'``
+		tags (bool): Parse tags. Default: ``True``
+		pictures (bool): Parse embedded pictures. Default: ``True``
+		frames (set): ID3v2 frame IDs or aliases to parse. Default: All frames
+		lazy (bool): Decode ID3v2 frames when they're first accessed. Default: ``False``
+		io_stats (IOStats): Counts of the reads made are added to this. Default: ``None``
+
+	Returns:
+		Format: An audio format object of the appropriate type.
+
+	Raises:
+		FormatError: If the audio file is not valid.
+		UnsupportedFormat: If the audio file is not of a supported format.
+		ValueError: If ``f`` is not a valid str, path-like object,
+			file-like object, or is unreadable.
+			If ``io`` is not a supported I/O backend.
+	"""
+
+	loop = asyncio.get_event_loop()
+
+	return await loop.run_in_executor(
+		executor,
+		partial(
+			load,
+			f,
+			io=io,
+			tags=tags,
+			pictures=pictures,
+			frames=frames,
+			lazy=lazy,
+			io_stats=io_stats,
+		),
+	)
+
+
+async def _aload_result(filepath, executor, options):
+	try:
+		metadata = await aload(filepath, executor=executor, **options)
+	except Exception as exc:
+		return LoadResult(
+			filepath=filepath,
+			error=exc,
+		)
+	else:
+		return LoadResult(
+			filepath=filepath,
+			metadata=metadata,
+		)
+
+
+async def aload_many(
+	filepaths,
+	*,
+	concurrency=None,
+	executor=None,
+	io='buffered',
+	tags=True,
+	pictures=True,
+	frames=None,
+	lazy=False,
+):
+	"""Load audio metadata from many filepaths without blocking the event loop.
+
+	Results are yielded as they finish, not in the order given.
+	Files that fail to load are reported with the raised exception
+	rather than stopping the batch.
+	Filepaths are only taken from ``filepaths`` as earlier files finish,
+	so no more than ``concurrency`` files are loading or open at once.
+
+	Parameters:
+		filepaths (iterable): Filepaths or path-like objects of audio files.
+		concurrency (int): The maximum number of files to load at once.
+			Default: The number of processors on the machine plus 4, up to 32
+		executor (concurrent.futures.Executor): The executor to load files in.
+			Default: A thread pool with ``concurrency`` workers
+		io (str): The I/O backend to read files with. Default: ``'buffered'``
+		tags (bool): Parse tags. Default: ``True``
+		pictures (bool): Parse embedded pictures. Default: ``True``
+		frames (set): ID3v2 frame IDs or aliases to parse. Default: All frames
+		lazy (bool): Decode ID3v2 frames when they're first accessed. Default: ``False``
+
+	Yields:
+		LoadResult: The result of loading each file.
+
+	Raises:
+		ValueError: If ``concurrency`` is less than 1.
+	"""
+
+	if concurrency is None:
+		# The same default as ``ThreadPoolExecutor`` in Python 3.8+.
+		concurrency = min(32, (os.cpu_count() or 1) + 4)
+
+	if concurrency < 1:
+		raise ValueError("concurrency must be at least 1.")
+
+	options = {
+		'io': io,
+		'tags': tags,
+		'pictures': pictures,
+		'frames': frames,
+		'lazy': lazy,
+	}
+
+	own_executor = executor is None
+	if own_executor:
+		executor = ThreadPoolExecutor(max_workers=concurrency)
+
+	pending = set()
+
+	try:
+		for filepath in filepaths:
+			pending.add(
+				asyncio.ensure_future(_aload_result(filepath, executor, options))
+			)
+
+			if len(pending) >= concurrency:
+				done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+				for future in done:
+					yield future.result()
+
+		while pending:
+			done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+			for future in done:
+				yield future.result()
+	finally:
+		for future in pending:
+			future.cancel()
+
+		if own_executor:
+			executor.shutdown(wait=False)
 
 
 def determine_format(data):
@@ -68,8 +267,9 @@ def determine_format(data):
 	if d.startswith(b'RIFF'):
 		return WAVE
 
+	# Only the size of the tag is needed to skip it.
 	if d.startswith(b'ID3'):
-		ID3v2.parse(data)
+		ID3v2.parse(data, tags=False)
 
 	if data.peek(4) == b'fLaC':
 		return FLAC
@@ -82,12 +282,62 @@ def determine_format(data):
 		return MP3
 
 
-def load(f):
-	"""Load audio metadata from a filepath or file-like object.
+def _open(f):
+	# A new handle, like DataReader opens, so the caller's file position isn't changed.
+	if isinstance(f, BufferedReader):
+		f = f.name
+
+	return FileIO(f, 'rb')
+
+
+def _read_ahead(raw, io_stats):
+	# Pipes, etc. can't be read ahead.
+	if not raw.seekable():
+		return DataReader(raw)
+
+	return DataReader(PlannedReader(raw, io_stats=io_stats))
+
+
+def load(
+	f,
+	*,
+	io='buffered',
+	tags=True,
+	pictures=True,
+	frames=None,
+	lazy=False,
+	io_stats=None,
+):
+	"""Load audio metadata from a filepath, file-like object, or range source.
+
+	Files and range sources are read with a :class:`PlannedReader`,
+	so the metadata at the head and tail of a file is read in bulk once.
+	Range sources are read with a :class:`RangeReader`,
+	fetching only the parts of the file needed.
+	Embedded pictures are fetched unless ``pictures`` is ``False``.
 
 	Parameters:
-		f (str, os.PathLike, or file-like object):
-			A filepath, path-like object or file-like object of an audio file.
+		f (str, os.PathLike, file-like object, or range source):
+			A filepath, path-like object, file-like object,
+			or range source of an audio file.
+		io (str): The I/O backend to read a file with.
+			``'buffered'`` uses buffered reads.
+			``'mmap'`` memory-maps the file, falling back to buffered reads
+			for files that can't be mapped (e.g. pipes or empty files).
+			Default: ``'buffered'``
+		tags (bool): Parse tags. If ``False``, tag regions are skipped
+			and the returned object only has stream information.
+			Default: ``True``
+		pictures (bool): Parse embedded pictures.
+			Default: ``True``
+		frames (set): ID3v2 frame IDs or aliases to parse.
+			Other ID3v2 frames are skipped without being decoded.
+			Default: All frames
+		lazy (bool): Decode ID3v2 frames when they're first accessed
+			instead of while parsing.
+			Default: ``False``
+		io_stats (IOStats): Counts of the reads made are added to this.
+			Default: ``None``
 
 	Returns:
 		Format: An audio format object of the appropriate type.
@@ -96,7 +346,8 @@ def load(f):
 		FormatError: If the audio file is not valid.
 		UnsupportedFormat: If the audio file is not of a supported format.
 		ValueError: If ``f`` is not a valid str, path-like object,
-			file-like object, or is unreadable.
+			file-like object, range source, or is unreadable.
+			If ``io`` is not a supported I/O backend.
 	"""
 
 	if (
@@ -105,26 +356,159 @@ def load(f):
 			isinstance(f, BufferedReader)
 			and isinstance(f.raw, FileIO)
 		)
+		and not hasattr(f, 'read_range')
 	):
-		raise ValueError("Not a valid filepath or file-like object.")
+		raise ValueError("Not a valid filepath, file-like object, or range source.")
 
-	data = DataReader(f)
+	if io not in ['buffered', 'mmap']:
+		raise ValueError(f"Unsupported I/O backend: {io}.")
 
-	parser_cls = determine_format(data)
-
-	if parser_cls is None:
-		raise UnsupportedFormat("Supported format signature not found.")
+	if hasattr(f, 'read_range'):
+		data = _read_ahead(RangeReader(f), io_stats)
+	elif io == 'mmap':
+		try:
+			data = MmapDataReader(f)
+		except ValueError:
+			data = _read_ahead(_open(f), io_stats)
 	else:
-		data.seek(0, os.SEEK_SET)
+		data = _read_ahead(_open(f), io_stats)
 
-	return parser_cls.parse(data)
+	try:
+		parser_cls = determine_format(data)
+
+		if parser_cls is None:
+			raise UnsupportedFormat("Supported format signature not found.")
+		else:
+			data.seek(0, os.SEEK_SET)
+
+		return parser_cls.parse(
+			data,
+			tags=tags,
+			pictures=pictures,
+			frames=frames,
+			lazy=lazy,
+		)
+	except BaseException:
+		# The traceback of a kept error references this frame,
+		# so the file would stay open as long as the error does.
+		data.close()
+		raise
 
 
-def loads(b):
+def _load_chunk(filepaths, tags, pictures, frames, lazy):
+	results = []
+	for filepath in filepaths:
+		# A single bad file shouldn't abort a whole library scan.
+		try:
+			metadata = load(
+				filepath,
+				tags=tags,
+				pictures=pictures,
+				frames=frames,
+				lazy=lazy,
+			)
+		except Exception as exc:
+			results.append(
+				LoadResult(
+					filepath=filepath,
+					error=exc,
+				)
+			)
+		else:
+			results.append(
+				LoadResult(
+					filepath=filepath,
+					metadata=metadata,
+				)
+			)
+
+	return results
+
+
+def load_many(
+	filepaths,
+	*,
+	workers=None,
+	chunksize=1,
+	tags=True,
+	pictures=True,
+	frames=None,
+	lazy=False,
+):
+	"""Load audio metadata from many filepaths using a pool of worker processes.
+
+	Results are yielded as they finish, not in the order given.
+	Files that fail to load are reported with the raised exception
+	rather than stopping the batch.
+
+	Parameters:
+		filepaths (iterable): Filepaths or path-like objects of audio files.
+		workers (int): The number of worker processes.
+			Default: The number of processors on the machine.
+		chunksize (int): The number of files sent to a worker process at a time.
+			Larger chunks reduce inter-process overhead for many small files.
+			Default: ``1``
+		tags (bool): Parse tags. Default: ``True``
+		pictures (bool): Parse embedded pictures. Default: ``True``
+		frames (set): ID3v2 frame IDs or aliases to parse. Default: All frames
+		lazy (bool): Decode ID3v2 frames when they're first accessed. Default: ``False``
+
+	Yields:
+		LoadResult: The result of loading each file.
+
+	Raises:
+		ValueError: If ``workers`` or ``chunksize`` is less than 1.
+	"""
+
+	if workers is None:
+		workers = os.cpu_count() or 1
+
+	if workers < 1:
+		raise ValueError("workers must be at least 1.")
+
+	if chunksize < 1:
+		raise ValueError("chunksize must be at least 1.")
+
+	# Only keep a couple of chunks per worker in flight
+	# so huge libraries aren't queued in memory all at once.
+	max_pending = workers * 2
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		pending = set()
+
+		try:
+			for chunk in more_itertools.chunked(filepaths, chunksize):
+				pending.add(executor.submit(_load_chunk, chunk, tags, pictures, frames, lazy))
+
+				if len(pending) >= max_pending:
+					done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+					for future in done:
+						yield from future.result()
+
+			for future in as_completed(pending):
+				yield from future.result()
+		finally:
+			for future in pending:
+				future.cancel()
+
+
+def loads(b, *, tags=True, pictures=True, frames=None, lazy=False):
 	"""Load audio metadata from a bytes-like object.
 
 	Parameters:
 		b (bytes-like object): A bytes-like object of an audio file.
+		tags (bool): Parse tags. If ``False``, tag regions are skipped
+			and the returned object only has stream information.
+			Default: ``True``
+		pictures (bool): Parse embedded pictures.
+			Default: ``True``
+		frames (set): ID3v2 frame IDs or aliases to parse.
+			Other ID3v2 frames are skipped without being decoded.
+			Default: All frames
+		lazy (bool): Decode ID3v2 frames when they're first accessed
+			instead of while parsing.
+			Default: ``False``
 
 	Returns:
 		Format: An audio format object of the appropriate type.
@@ -142,11 +526,23 @@ def loads(b):
 
 	data = DataReader(b)
 
-	parser_cls = determine_format(data)
-
-	if parser_cls is None:
-		raise UnsupportedFormat("Supported format signature not found.")
-	else:
-		data.seek(0, os.SEEK_SET)
-
-	return parser_cls.parse(data)
+	try:
+		parser_cls = determine_format(data)
+
+		if parser_cls is None:
+			raise UnsupportedFormat("Supported format signature not found.")
+		else:
+			data.seek(0, os.SEEK_SET)
+
+		return parser_cls.parse(
+			data,
+			tags=tags,
+			pictures=pictures,
+			frames=frames,
+			lazy=lazy,
+		)
+	except BaseException:
+		# The traceback of a kept error references this frame,
+		# so the file would stay open as long as the error does.
+		data.close()
+		raise
@@ -0,0 +1,283 @@
+__all__ = ['MetadataCache']
+
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from .api import load
+from .models import Format
+
+# Bump when the stored value format changes to discard old entries.
+_SCHEMA_VERSION = 2
+
+# Last use times of hits are kept in memory and written in batches,
+# so hits only read the database.
+# It's a cache, so losing them on a crash only affects eviction order.
+_FLUSH_INTERVAL = 100
+
+
+class MetadataCache:
+	"""A persistent cache of loaded audio metadata backed by an SQLite database.
+
+	Entries are keyed by absolute filepath and the options passed to :meth:`load`
+	and are only used if the file's size, modification time, and inode are unchanged,
+	so loading an unchanged file costs a single ``stat()`` call and a database lookup.
+	When a limit is set, the least recently used entries are evicted to stay under it.
+
+	Entries are stored with :meth:`Format.to_bytes`.
+	Picture data is still read from the file on first access.
+
+	Writes are made in short transactions,
+	so caches in other threads or processes can share a database.
+
+	Parameters:
+		filepath (str or os.PathLike): The filepath of the database.
+			It's created if it doesn't exist.
+		max_entries (int): The maximum number of entries to keep.
+			Default: No limit
+		max_size (int): The maximum total size in bytes of stored entries.
+			Default: No limit
+		timeout (float): The number of seconds to wait for
+			another connection to finish writing to the database.
+			Default: ``5.0``
+
+	Attributes:
+		hits (int): The number of loads served from the cache.
+		misses (int): The number of loads that had to parse the file.
+	"""
+
+	def __init__(self, filepath, *, max_entries=None, max_size=None, timeout=5.0):
+		self.filepath = filepath
+		self.max_entries = max_entries
+		self.max_size = max_size
+		self.hits = 0
+		self.misses = 0
+
+		# Transactions are begun explicitly, so none are left open between loads.
+		self._connection = sqlite3.connect(
+			os.fspath(filepath),
+			timeout=timeout,
+			isolation_level=None,
+		)
+		self._connection.execute('PRAGMA journal_mode = WAL')
+		self._connection.execute('PRAGMA synchronous = NORMAL')
+
+		with self._transaction():
+			if self._connection.execute('PRAGMA user_version').fetchone()[0] != _SCHEMA_VERSION:
+				self._connection.execute('DROP TABLE IF EXISTS metadata')
+				self._connection.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+
+			self._connection.execute(
+				"""
+				CREATE TABLE IF NOT EXISTS metadata (
+					filepath TEXT NOT NULL,
+					options TEXT NOT NULL,
+					size INTEGER NOT NULL,
+					mtime_ns INTEGER NOT NULL,
+					inode INTEGER NOT NULL,
+					last_used REAL NOT NULL,
+					value BLOB NOT NULL,
+					PRIMARY KEY (filepath, options)
+				)
+				"""
+			)
+			self._connection.execute(
+				'CREATE INDEX IF NOT EXISTS metadata_last_used ON metadata (last_used)'
+			)
+
+		self._last_used = {}
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def __len__(self):
+		return self._connection.execute('SELECT COUNT(*) FROM metadata').fetchone()[0]
+
+	@property
+	def size(self):
+		"""The total size in bytes of stored entries."""
+
+		return int(
+			self._connection.execute('SELECT TOTAL(LENGTH(value)) FROM metadata').fetchone()[0]
+		)
+
+	def clear(self):
+		"""Remove all entries from the cache."""
+
+		self._last_used.clear()
+
+		with self._transaction():
+			self._connection.execute('DELETE FROM metadata')
+
+	def close(self):
+		"""Write pending last use times and close the database."""
+
+		if self._last_used:
+			with self._transaction():
+				self._flush()
+
+		self._connection.close()
+
+	def load(self, f, *, io='buffered', tags=True, pictures=True, frames=None, lazy=False):
+		"""Load audio metadata from a filepath, using the cache if the file is unchanged.
+
+		Entries are stored separately for each combination of
+		``tags``, ``pictures``, and ``frames``.
+
+		Parameters:
+			f (str or os.PathLike): A filepath or path-like object of an audio file.
+			io (str): The I/O backend to read the file with if it isn't cached.
+				Default: ``'buffered'``
+			tags (bool): Parse tags. Default: ``True``
+			pictures (bool): Parse embedded pictures. Default: ``True``
+			frames (set): ID3v2 frame IDs or aliases to parse. Default: All frames
+			lazy (bool): Decode ID3v2 frames when they're first accessed
+				if the file isn't cached.
+				Default: ``False``
+
+		Returns:
+			Format: An audio format object of the appropriate type.
+
+		Raises:
+			FormatError: If the audio file is not valid.
+			UnsupportedFormat: If the audio file is not of a supported format.
+			ValueError: If ``f`` is not a valid str or path-like object.
+		"""
+
+		if not isinstance(f, (os.PathLike, str)):
+			raise ValueError("Not a valid filepath.")
+
+		# ``abspath`` doesn't touch the filesystem, unlike ``realpath``.
+		# The inode check catches a symlink pointing somewhere else.
+		filepath = os.path.abspath(f)
+		stat = os.stat(filepath)
+		options = repr(
+			(
+				tags,
+				pictures,
+				sorted(frames) if frames is not None else None,
+			)
+		)
+
+		row = self._connection.execute(
+			'SELECT size, mtime_ns, inode, value FROM metadata WHERE filepath = ? AND options = ?',
+			(filepath, options),
+		).fetchone()
+
+		if row is not None:
+			size, mtime_ns, inode, value = row
+
+			if (
+				size == stat.st_size
+				and mtime_ns == stat.st_mtime_ns
+				and inode == stat.st_ino
+			):
+				try:
+					metadata = Format.from_bytes(value)
+				except ValueError:
+					# Unreadable entries, e.g. from an incompatible version, are reparsed.
+					pass
+				else:
+					self.hits += 1
+					self._last_used[(filepath, options)] = time.time()
+
+					if len(self._last_used) >= _FLUSH_INTERVAL:
+						with self._transaction():
+							self._flush()
+
+					return metadata
+
+		self.misses += 1
+
+		metadata = load(
+			filepath,
+			io=io,
+			tags=tags,
+			pictures=pictures,
+			frames=frames,
+			lazy=lazy,
+		)
+
+		value = metadata.to_bytes()
+
+		with self._transaction():
+			self._connection.execute(
+				'INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?, ?)',
+				(
+					filepath,
+					options,
+					stat.st_size,
+					stat.st_mtime_ns,
+					stat.st_ino,
+					time.time(),
+					value,
+				),
+			)
+			self._last_used.pop((filepath, options), None)
+
+			self._evict()
+
+		return metadata
+
+	@contextmanager
+	def _transaction(self):
+		# Take the write lock up front so another connection
+		# can't make the transaction fail part way through.
+		self._connection.execute('BEGIN IMMEDIATE')
+
+		try:
+			yield
+		except BaseException:
+			self._connection.execute('ROLLBACK')
+			raise
+		else:
+			self._connection.execute('COMMIT')
+
+	def _evict(self):
+		if (
+			self.max_entries is None
+			and self.max_size is None
+		):
+			return
+
+		# Other caches may share the database, so totals are read in the transaction.
+		self._flush()
+		num_entries, total_size = self._connection.execute(
+			'SELECT COUNT(*), TOTAL(LENGTH(value)) FROM metadata'
+		).fetchone()
+
+		while (
+			(
+				self.max_entries is not None
+				and num_entries > self.max_entries
+			)
+			or (
+				self.max_size is not None
+				and total_size > self.max_size
+			)
+		):
+			row = self._connection.execute(
+				'SELECT rowid, LENGTH(value) FROM metadata ORDER BY last_used, rowid LIMIT 1'
+			).fetchone()
+
+			if row is None:
+				break
+
+			rowid, size = row
+			self._connection.execute('DELETE FROM metadata WHERE rowid = ?', (rowid,))
+			num_entries -= 1
+			total_size -= size
+
+	def _flush(self):
+		self._connection.executemany(
+			'UPDATE metadata SET last_used = ? WHERE filepath = ? AND options = ?',
+			(
+				(last_used, filepath, options)
+				for (filepath, options), last_used in self._last_used.items()
+			),
+		)
+		self._last_used.clear()
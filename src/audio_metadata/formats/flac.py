@@ -16,7 +16,11 @@ __all__ = [
 ]
 
 import binascii
+import os
 import struct
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
 
 from attr import (
 	Factory,
@@ -39,6 +43,7 @@ from ..exceptions import FormatError
 from ..models import (
 	Format,
 	Picture,
+	SlottedAttrMapping,
 	StreamInfo,
 )
 
@@ -81,8 +86,9 @@ class FLACApplication(AttrMapping):
 @attrs(
 	repr=False,
 	kw_only=True,
+	slots=True,
 )
-class FLACCueSheetIndex(AttrMapping):
+class FLACCueSheetIndex(SlottedAttrMapping):
 	"""A FLAC cue sheet track index point.
 
 	Attributes:
@@ -124,8 +130,9 @@ class FLACCueSheetIndex(AttrMapping):
 @attrs(
 	repr=False,
 	kw_only=True,
+	slots=True,
 )
-class FLACCueSheetTrack(AttrMapping):
+class FLACCueSheetTrack(SlottedAttrMapping):
 	"""A FLAC cue sheet track.
 
 	Attributes:
@@ -316,9 +323,8 @@ class FLACPicture(Picture):
 		width, height, bit_depth, colors = struct.unpack('>4I', data.read(16))
 
 		data_length = struct.unpack('>I', data.read(4))[0]
-		data = data.read(data_length)
 
-		return cls(
+		picture = cls(
 			type=ID3PictureType(type_),
 			mime_type=mime_type,
 			description=description,
@@ -326,15 +332,18 @@ class FLACPicture(Picture):
 			height=height,
 			bit_depth=bit_depth,
 			colors=colors,
-			data=data,
 		)
+		picture._read_data(data, data_length)
+
+		return picture
 
 
 @attrs(
 	repr=False,
 	kw_only=True,
+	slots=True,
 )
-class FLACSeekPoint(AttrMapping):
+class FLACSeekPoint(SlottedAttrMapping):
 	first_sample = attrib()
 	offset = attrib()
 	num_samples = attrib()
@@ -351,19 +360,122 @@ class FLACSeekPoint(AttrMapping):
 		)
 
 
-class FLACSeekTable(LabelList):
+class FLACSeekTable(Sequence):
+	"""A FLAC seektable metadata block.
+
+	Seek points are stored in columns of integers
+	and are created as `FLACSeekPoint` objects when accessed.
+
+	Parameters:
+		seekpoints (~collections.abc.Iterable): `FLACSeekPoint` objects.
+	"""
+
+	__slots__ = (
+		'_first_samples',
+		'_offsets',
+		'_num_samples',
+	)
+
 	item_label = ('seekpoint', 'seekpoints')
 
+	def __init__(self, seekpoints=()):
+		self._first_samples = array('Q')
+		self._offsets = array('Q')
+		self._num_samples = array('H')
+
+		for seekpoint in seekpoints:
+			self._first_samples.append(seekpoint.first_sample)
+			self._offsets.append(seekpoint.offset)
+			self._num_samples.append(seekpoint.num_samples)
+
+	def __eq__(self, other):
+		if isinstance(other, FLACSeekTable):
+			return (
+				self._first_samples == other._first_samples
+				and self._offsets == other._offsets
+				and self._num_samples == other._num_samples
+			)
+
+		return self.data == other
+
+	def __getitem__(self, index):
+		if isinstance(index, slice):
+			seektable = self.__class__()
+			seektable._first_samples = self._first_samples[index]
+			seektable._offsets = self._offsets[index]
+			seektable._num_samples = self._num_samples[index]
+
+			return seektable
+
+		return FLACSeekPoint(
+			first_sample=self._first_samples[index],
+			offset=self._offsets[index],
+			num_samples=self._num_samples[index],
+		)
+
+	def __iter__(self):
+		for first_sample, offset, num_samples in zip(
+			self._first_samples,
+			self._offsets,
+			self._num_samples,
+		):
+			yield FLACSeekPoint(
+				first_sample=first_sample,
+				offset=offset,
+				num_samples=num_samples,
+			)
+
+	def __len__(self):
+		return len(self._first_samples)
+
+	def __repr__(self):
+		item_label = self.item_label[1] if len(self) > 1 else self.item_label[0]
+
+		return f"<{self.__class__.__name__} ({len(self)} {item_label})>"
+
+	@property
+	def data(self):
+		"""list: The seek points as `FLACSeekPoint` objects."""
+
+		return list(self)
+
+	items = data
+
+	def lookup(self, sample):
+		"""Find the seek point to start decoding from to reach a sample.
+
+		Parameters:
+			sample (int): A sample number.
+
+		Returns:
+			FLACSeekPoint: The last seek point at or before ``sample``.
+			``None`` if there isn't one.
+		"""
+
+		# Placeholder seek points have the largest possible sample number
+		# and sort last, so they're never found.
+		index = bisect_right(self._first_samples, sample) - 1
+
+		if index < 0:
+			return None
+
+		return self[index]
+
 	@datareader
 	@classmethod
 	def parse(cls, data):
-		seekpoints = []
-		seekpoint = data.read(18)
-		while len(seekpoint) == 18:
-			seekpoints.append(FLACSeekPoint.parse(seekpoint))
-			seekpoint = data.read(18)
+		b = data.read()
+		b = b[:len(b) - len(b) % 18]
+
+		seektable = cls()
 
-		return cls(seekpoints)
+		if b:
+			first_samples, offsets, num_samples = zip(*struct.iter_unpack('>QQH', b))
+			seektable._first_samples.extend(first_samples)
+			seektable._offsets.extend(offsets)
+			seektable._num_samples.extend(num_samples)
+
+		return seektable
 
 
 class FLACVorbisComments(VorbisComments):
@@ -447,7 +559,7 @@ class FLAC(Format):
 
 	@datareader
 	@staticmethod
-	def _parse_metadata_block(data):
+	def _parse_metadata_block(data, *, tags=True, pictures=True):
 		is_last_block, block_type, block_size = bitstruct.unpack(
 			'b1 u7 u24',
 			data.read(4),
@@ -456,6 +568,26 @@ class FLAC(Format):
 		if block_size == 0:
 			raise FormatError("FLAC metadata block size must be greater than 0.")
 
+		if (
+			(not tags and block_type == FLACMetadataBlockType.VORBIS_COMMENT)
+			or (not pictures and block_type == FLACMetadataBlockType.PICTURE)
+		):
+			data.seek(block_size, os.SEEK_CUR)
+
+			return None, is_last_block
+
+		# Parse pictures from the file so their data can be left there.
+		if block_type == FLACMetadataBlockType.PICTURE:
+			block_end = data.tell() + block_size
+			metadata_block = FLACPicture.parse(data)
+
+			if data.tell() > block_end:
+				raise FormatError("FLAC picture data extends past the end of its metadata block.")
+
+			data.seek(block_end, os.SEEK_SET)
+
+			return metadata_block, is_last_block
+
 		# There are examples of tools writing incorrect block sizes.
 		# The FLAC reference implementation unintentionally (I hope?) parses them.
 		# I've chosen not to add special handling for these invalid files.
@@ -474,8 +606,6 @@ class FLAC(Format):
 			metadata_block = FLACVorbisComments.parse(metadata_block_data)
 		elif block_type == FLACMetadataBlockType.CUESHEET:
 			metadata_block = FLACCueSheet.parse(metadata_block_data)
-		elif block_type == FLACMetadataBlockType.PICTURE:
-			metadata_block = FLACPicture.parse(metadata_block_data)
 		elif block_type >= 127:
 			raise FormatError(f"{block_type} is not a valid FLAC metadata block type.")
 		else:
@@ -487,19 +617,29 @@ class FLAC(Format):
 		return metadata_block, is_last_block
 
 	@classmethod
-	def parse(cls, data):
+	def parse(cls, data, *, tags=True, pictures=True, frames=None, lazy=False):
 		self = super()._load(data)
 
 		# Ignore ID3v2 in FLAC.
 		if self._obj.peek(3) == b'ID3':
-			self._id3 = ID3v2.parse(self._obj)
+			self._id3 = ID3v2.parse(
+				self._obj,
+				tags=tags,
+				pictures=pictures,
+				frames=frames,
+				lazy=lazy,
+			)
 
 		if self._obj.read(4) != b'fLaC':
 			raise FormatError("Valid FLAC header not found.")
 
 		is_first = True
 		while True:
-			metadata_block, is_last_block = self._parse_metadata_block(self._obj)
+			metadata_block, is_last_block = self._parse_metadata_block(
+				self._obj,
+				tags=tags,
+				pictures=pictures,
+			)
 
 			if (
 				is_first
@@ -535,7 +675,7 @@ class FLAC(Format):
 				self.cuesheet = metadata_block
 			elif isinstance(metadata_block, FLACPicture):
 				self.pictures.append(metadata_block)
-			else:
+			elif metadata_block is not None:
 				self._blocks.append(metadata_block)
 
 			if is_last_block:
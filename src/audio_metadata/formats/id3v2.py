@@ -8,6 +8,7 @@ __all__ = [
 	'ID3v2Header',
 ]
 
+import os
 import struct
 import warnings
 from collections import defaultdict
@@ -19,6 +20,7 @@ from attr import (
 from bidict import frozenbidict
 from tbm_utils import (
 	AttrMapping,
+	DataReader,
 	datareader,
 )
 
@@ -42,13 +44,20 @@ from ..exceptions import (
 	UnsupportedFormat,
 )
 from ..models import Tags
-from ..utils import decode_synchsafe_int
+from ..readers import SectionReader
+from ..utils import (
+	decode_synchsafe_int,
+	remove_unsynchronization,
+)
 
 try:
 	import bitstruct.c as bitstruct
 except ImportError:
 	import bitstruct
 
+# Tags larger than this are parsed from the file instead of being read whole.
+_STREAM_TAG_SIZE = 64 * 1024
+
 
 ID3v2FrameAliases = {
 	ID3Version.v22: frozenbidict(
@@ -229,9 +238,178 @@ class ID3v2Frames(Tags):
 
 		super().__init__(mapping, **kwargs)
 
+	def __getattr__(self, attr):
+		self._decode_pending(self.FIELD_MAP.get(attr, attr))
+
+		return super().__getattr__(attr)
+
+	def __setattr__(self, attr, value):
+		self._decode_pending(self.FIELD_MAP.get(attr, attr))
+
+		super().__setattr__(attr, value)
+
+	def __delattr__(self, attr):
+		self._decode_pending(self.FIELD_MAP.get(attr, attr))
+
+		super().__delattr__(attr)
+
+	def __missing__(self, key):
+		self._decode_pending(key)
+
+		if key not in self.__dict__:
+			raise KeyError(key)
+
+		return self.__dict__[key]
+
+	def __setitem__(self, key, value):
+		self._decode_pending(self.FIELD_MAP.get(key, key))
+
+		super().__setitem__(key, value)
+
+	def __delitem__(self, key):
+		self._decode_pending(self.FIELD_MAP.get(key, key))
+
+		super().__delitem__(key)
+
+	def __iter__(self):
+		self._decode_all()
+
+		return super().__iter__()
+
+	# Only frames are counted, as with iteration.
+	def __len__(self):
+		return sum(1 for _ in self)
+
+	def __repr__(self, repr_dict=None):
+		self._decode_all()
+
+		return super().__repr__(repr_dict=repr_dict)
+
+	def __getstate__(self):
+		self._decode_all()
+
+		# The alias map is shared and restored from the version.
+		state = dict(self.__dict__)
+		del state['FIELD_MAP']
+
+		return state
+
+	def __setstate__(self, state):
+		self.__dict__.update(state)
+		self.__dict__['FIELD_MAP'] = ID3v2FrameAliases[self._version]
+
+	def _add_frame(self, frames, frame, frame_end=None):
+		# Ignore oddities/bad frames.
+		if frame is None:
+			return
+
+		# Ignore frames not defined in spec for ID3 version.
+		# Allow unofficial frames to load (3 character frames only load for ID3v2.2).
+		# Warn user and encourage reporting.
+		if (
+			frame.name not in ID3v2FrameIDs[self._version]
+			and frame.name not in ID3v2UnofficialFrameIDs[self._version]
+		):
+			warnings.warn(
+				(
+					f"Ignoring ``{frame.name}`` frame with value ``{frame.value}``.\n"
+					f"``{frame.name}`` is not supported in the ID3v2.{self._version.value[1]} specification.\n"
+				),
+				AudioMetadataWarning,
+			)
+			return
+
+		# Leave picture data in the file if it's stored there as-is.
+		# ``frame_end`` is the filepath and position of the end of the frame in the file.
+		if (
+			frame_end is not None
+			and frame.name == self.FIELD_MAP['pictures']
+		):
+			filepath, end = frame_end
+			picture = frame.value
+			picture_size = len(picture.data)
+			picture._defer_data(filepath, end - picture_size, picture_size)
+
+		# TODO: Finish any missing frame types.
+		# TODO: Move representation into frame classes?
+		if isinstance(
+			frame,
+			(
+				ID3v2GenreFrame,
+				ID3v2NumericTextFrame,
+				ID3v2PeopleListFrame,
+				ID3v2TextFrame,
+				ID3v2TimestampFrame,
+			),
+		):
+			frames[frame.name] = frame.value
+		elif isinstance(frame, ID3v2NumberFrame):
+			if frame.value.total is not None:
+				frames[frame.name] = [f"{frame.value.number}/{frame.value.total}"]
+			else:
+				frames[frame.name] = [frame.value.number]
+		else:
+			frames[frame.name].append(frame.value)
+
+	def _decode_all(self):
+		for frame_id in list(self.__dict__.get('_pending', ())):
+			self._decode_pending(frame_id)
+
+	def _decode_pending(self, frame_id):
+		# Use __dict__ to avoid recursing through __getattr__.
+		pending = self.__dict__.get('_pending')
+		if not pending or frame_id not in pending:
+			return
+
+		unsync, filepath = self._source
+
+		frames = defaultdict(list)
+		for frame_start, frame_data, frame_size, frame_flags in pending.pop(frame_id):
+			data = DataReader(frame_data)
+
+			try:
+				frame = ID3v2Frame._parse_frame(data, frame_id, frame_size, frame_flags, unsync)
+			except FormatError:
+				continue
+
+			self._add_frame(
+				frames,
+				frame,
+				self._frame_end(data, frame_flags, unsync, filepath, frame_start),
+			)
+
+		self.__dict__.update(frames)
+
+		if not pending:
+			del self._pending
+			del self._source
+
+	@staticmethod
+	def _frame_end(data, frame_flags, unsync, filepath, offset):
+		if (
+			filepath is None
+			or unsync
+			or frame_flags.unsync
+			or frame_flags.compressed
+		):
+			return None
+
+		return filepath, offset + data.tell()
+
 	@datareader
 	@classmethod
-	def parse(cls, data, id3_version, unsync=False):
+	def parse(
+		cls,
+		data,
+		id3_version,
+		unsync=False,
+		*,
+		pictures=True,
+		frames=None,
+		lazy=False,
+		filepath=None,
+		offset=0,
+	):
 		id3_version = ID3Version(id3_version)
 		if id3_version not in [
 			ID3Version.v22,
@@ -240,58 +418,90 @@ class ID3v2Frames(Tags):
 		]:
 			raise ValueError(f"Unsupported ID3 version: {id3_version}.")  # pragma: nocover
 
+		self = cls(id3_version=id3_version)
+		picture_frame_id = self.FIELD_MAP['pictures']
+
+		# Frames can be given by frame ID or alias.
+		if frames is not None:
+			frame_ids = {
+				self.FIELD_MAP.get(frame, frame)
+				for frame in frames
+			}
+		else:
+			frame_ids = None
+
+		# Before ID3v2.4, unsynchronization covers the whole tag including frame headers,
+		# so it's removed from all of it at once.
+		# Positions in the decoded data don't match the file after that.
+		if (
+			unsync
+			and id3_version is not ID3Version.v24
+		):
+			data = DataReader(remove_unsynchronization(data.read()))
+			unsync = False
+			filepath = None
+
+		# Lazy frames are decoded from a copy of their data when first accessed.
+		if lazy:
+			pending = defaultdict(list)
+
 		frames = defaultdict(list)
 		while True:
 			try:
-				frame = ID3v2Frame.parse(data, id3_version, unsync)
+				frame_id, frame_size, frame_flags = ID3v2Frame._parse_frame_header(data, id3_version)
+
+				if (
+					(not pictures and frame_id == picture_frame_id)
+					or (frame_ids is not None and frame_id not in frame_ids)
+				):
+					ID3v2Frame._skip_frame_data(data, frame_size, frame_flags, unsync)
+					continue
+
+				# Frames not in the spec are decoded now for their warning,
+				# and picture frames so their data can be left in the file instead of copied.
+				if (
+					lazy
+					and frame_id != picture_frame_id
+					and (
+						frame_id in ID3v2FrameIDs[id3_version]
+						or frame_id in ID3v2UnofficialFrameIDs[id3_version]
+					)
+				):
+					if frame_flags.encrypted:
+						raise UnsupportedFormat("ID3v2 frame encryption is not supported.")
+
+					frame_start = data.tell()
+					ID3v2Frame._skip_frame_data(data, frame_size, frame_flags, unsync)
+					frame_end = data.tell()
+
+					data.seek(frame_start, os.SEEK_SET)
+					pending[frame_id].append(
+						(
+							offset + frame_start,
+							data.read(frame_end - frame_start),
+							frame_size,
+							frame_flags,
+						)
+					)
+					continue
+
+				frame = ID3v2Frame._parse_frame(data, frame_id, frame_size, frame_flags, unsync)
 			except FormatError:
 				break
 
-			# Ignore oddities/bad frames.
-			if frame is None:
-				continue
+			self._add_frame(
+				frames,
+				frame,
+				self._frame_end(data, frame_flags, unsync, filepath, offset),
+			)
 
-			# Ignore frames not defined in spec for ID3 version.
-			# Allow unofficial frames to load (3 character frames only load for ID3v2.2).
-			# Warn user and encourage reporting.
-			if (
-				frame.name not in ID3v2FrameIDs[id3_version]
-				and frame.name not in ID3v2UnofficialFrameIDs[id3_version]
-			):
-				warnings.warn(
-					(
-						f"Ignoring ``{frame.name}`` frame with value ``{frame.value}``.\n"
-						f"``{frame.name}`` is not supported in the ID3v2.{id3_version.value[1]} specification.\n"
-					),
-					AudioMetadataWarning,
-				)
-				continue
+		self.__dict__.update(frames)
 
-			# TODO: Finish any missing frame types.
-			# TODO: Move representation into frame classes?
-			if isinstance(
-				frame,
-				(
-					ID3v2GenreFrame,
-					ID3v2NumericTextFrame,
-					ID3v2PeopleListFrame,
-					ID3v2TextFrame,
-					ID3v2TimestampFrame,
-				),
-			):
-				frames[frame.name] = frame.value
-			elif isinstance(frame, ID3v2NumberFrame):
-				if frame.value.total is not None:
-					frames[frame.name] = [f"{frame.value.number}/{frame.value.total}"]
-				else:
-					frames[frame.name] = [frame.value.number]
-			else:
-				frames[frame.name].append(frame.value)
+		if lazy and pending:
+			self._pending = pending
+			self._source = (unsync, filepath)
 
-		return cls(
-			frames,
-			id3_version=id3_version,
-		)
+		return self
 
 
 @attrs(
@@ -389,7 +599,7 @@ class ID3v2(AttrMapping):
 
 	@datareader
 	@classmethod
-	def parse(cls, data):
+	def parse(cls, data, *, tags=True, pictures=True, frames=None, lazy=False):
 		if data.peek(3) != b"ID3":
 			raise FormatError("Valid ID3v2 header not found.")
 
@@ -413,11 +623,35 @@ class ID3v2(AttrMapping):
 			self._size += 10
 			data.read(10)
 
-		self.tags = ID3v2Frames.parse(
-			data.read(self._header._size),
-			self._header.version,
-			self._header.flags.unsync,
-		)
-		self.pictures = self.tags.pop('pictures', [])
+		try:
+			filepath = os.path.abspath(data.name)
+		except AttributeError:
+			filepath = None
+
+		if tags:
+			# Frames of large tags are read from the stream instead of reading the whole tag,
+			# so the data of skipped frames, like large pictures, isn't read.
+			offset = data.tell()
+			if self._header._size > _STREAM_TAG_SIZE:
+				tag_data = DataReader(SectionReader(data, offset, self._header._size))
+			else:
+				tag_data = data.read(self._header._size)
+
+			self.tags = ID3v2Frames.parse(
+				tag_data,
+				self._header.version,
+				self._header.flags.unsync,
+				pictures=pictures,
+				frames=frames,
+				lazy=lazy,
+				filepath=filepath,
+				offset=offset,
+			)
+			self.pictures = self.tags.pop('pictures', [])
+			data.seek(offset + self._header._size, os.SEEK_SET)
+		else:
+			data.seek(self._header._size, os.SEEK_CUR)
+			self.tags = ID3v2Frames(id3_version=self._header.version)
+			self.pictures = []
 
 		return self
@@ -102,10 +102,12 @@ from ..exceptions import (
 )
 from ..models import (
 	Picture,
+	SlottedAttrMapping,
 	Tag,
 )
 from ..utils import (
 	decode_bytestring,
+	decode_split_encoded,
 	decode_synchsafe_int,
 	determine_encoding,
 	get_image_size,
@@ -375,8 +377,9 @@ class ID3v2UserURLLink(AttrMapping):
 @attrs(
 	repr=False,
 	kw_only=True,
+	slots=True,
 )
-class ID3v2FrameFlags(AttrMapping):
+class ID3v2FrameFlags(SlottedAttrMapping):
 	alter_tag = attrib(default=False, converter=bool)
 	alter_file = attrib(default=False, converter=bool)
 	read_only = attrib(default=False, converter=bool)
@@ -500,21 +503,8 @@ class ID3v2Frame(Tag):
 		return frame_id, frame_size, frame_flags
 
 	@datareader
-	@classmethod
-	def parse(cls, data, id3_version, unsync):
-		id3_version = ID3Version(id3_version)
-		if id3_version not in [
-			ID3Version.v22,
-			ID3Version.v23,
-			ID3Version.v24,
-		]:
-			raise ValueError(f"Unsupported ID3 version: {id3_version}.")  # pragma: nocover
-
-		frame_id, frame_size, frame_flags = ID3v2Frame._parse_frame_header(
-			data,
-			id3_version,
-		)
-
+	@staticmethod
+	def _read_frame_data(data, frame_size, frame_flags, unsync):
 		if frame_flags.encrypted:
 			raise UnsupportedFormat("ID3v2 frame encryption is not supported.")
 
@@ -524,24 +514,79 @@ class ID3v2Frame(Tag):
 
 			data.seek(4, os.SEEK_CUR)
 
-		frame_type = ID3v2FrameTypes.get(frame_id, ID3v2Frame)
-
 		if (
 			unsync
 			or frame_flags.unsync
 		):
-			read_size = frame_size
-			frame_data = remove_unsynchronization(data.read(read_size))
+			# The frame size is of the decoded data,
+			# so read the shortfall until there is enough of it.
+			# Each read is at most what's missing, so it never reads past the frame.
+			b = data.read(frame_size)
+			frame_data = remove_unsynchronization(b)
 			while len(frame_data) < frame_size:
-				data.seek(-read_size, os.SEEK_CUR)
-				read_size += 1
-				frame_data = remove_unsynchronization(data.read(read_size))
+				previous = b
+				b = data.read(frame_size - len(frame_data))
+				if not b:
+					break
+
+				# A zero byte after 0xFF at the end of the last read was inserted by unsynchronization.
+				if (
+					previous.endswith(b'\xFF')
+					and b.startswith(b'\x00')
+				):
+					frame_data += remove_unsynchronization(b[1:])
+				else:
+					frame_data += remove_unsynchronization(b)
 		else:
 			frame_data = data.read(frame_size)
 
 		if frame_flags.compressed:
 			frame_data = zlib.decompress(frame_data)
 
+		return frame_data
+
+	@datareader
+	@staticmethod
+	def _skip_frame_data(data, frame_size, frame_flags, unsync):
+		# The stored size of unsynchronized data isn't known without decoding it.
+		if (
+			unsync
+			or frame_flags.unsync
+		):
+			ID3v2Frame._read_frame_data(data, frame_size, frame_flags, unsync)
+		else:
+			if (
+				frame_flags.compressed
+				and frame_flags.data_length_indicator
+			):
+				frame_size += 4
+
+			data.seek(frame_size, os.SEEK_CUR)
+
+	@datareader
+	@classmethod
+	def parse(cls, data, id3_version, unsync):
+		id3_version = ID3Version(id3_version)
+		if id3_version not in [
+			ID3Version.v22,
+			ID3Version.v23,
+			ID3Version.v24,
+		]:
+			raise ValueError(f"Unsupported ID3 version: {id3_version}.")  # pragma: nocover
+
+		frame_id, frame_size, frame_flags = ID3v2Frame._parse_frame_header(
+			data,
+			id3_version,
+		)
+
+		return ID3v2Frame._parse_frame(data, frame_id, frame_size, frame_flags, unsync)
+
+	@datareader
+	@staticmethod
+	def _parse_frame(data, frame_id, frame_size, frame_flags, unsync):
+		frame_type = ID3v2FrameTypes.get(frame_id, ID3v2Frame)
+		frame_data = ID3v2Frame._read_frame_data(data, frame_size, frame_flags, unsync)
+
 		try:
 			frame_value, frame_encoding = frame_type._parse_frame_data(frame_data)
 
@@ -782,8 +827,8 @@ class ID3v2GenreFrame(ID3v2Frame):
 
 		try:
 			values = [
-				decode_bytestring(value, encoding)
-				for value in split_encoded(frame_data[1:], encoding)
+				value
+				for value in decode_split_encoded(frame_data[1:], encoding)
 				if value
 			]
 		except ValueError:
@@ -846,7 +891,7 @@ class ID3v2InvolvedPeopleListFrame(ID3v2PeopleListFrame):
 		try:
 			values = list(
 				more_itertools.sliced(
-					split_encoded(frame_data[1:], encoding),
+					decode_split_encoded(frame_data[1:], encoding),
 					2,
 				)
 			)
@@ -858,8 +903,8 @@ class ID3v2InvolvedPeopleListFrame(ID3v2PeopleListFrame):
 
 		people = [
 			ID3v2InvolvedPerson(
-				involvement=decode_bytestring(involvement, encoding),
-				name=decode_bytestring(name, encoding),
+				involvement=involvement,
+				name=name,
 			)
 			for involvement, name in values
 		]
@@ -913,7 +958,7 @@ class ID3v2TMCLFrame(ID3v2InvolvedPeopleListFrame):
 		try:
 			values = list(
 				more_itertools.sliced(
-					split_encoded(frame_data[1:], encoding),
+					decode_split_encoded(frame_data[1:], encoding),
 					2,
 				)
 			)
@@ -925,8 +970,8 @@ class ID3v2TMCLFrame(ID3v2InvolvedPeopleListFrame):
 
 		performers = [
 			ID3v2Performer(
-				instrument=decode_bytestring(instrument, encoding),
-				name=decode_bytestring(name, encoding),
+				instrument=instrument,
+				name=name,
 			)
 			for instrument, name in values
 		]
@@ -1129,8 +1174,8 @@ class ID3v2NumericTextFrame(ID3v2Frame):
 
 		try:
 			values = [
-				decode_bytestring(value, encoding)
-				for value in split_encoded(frame_data[1:], encoding)
+				value
+				for value in decode_split_encoded(frame_data[1:], encoding)
 				if value
 			]
 		except ValueError:
@@ -1392,8 +1437,8 @@ class ID3v2TextFrame(ID3v2Frame):
 
 		try:
 			values = [
-				decode_bytestring(value, encoding)
-				for value in split_encoded(frame_data[1:], encoding)
+				value
+				for value in decode_split_encoded(frame_data[1:], encoding)
 				if value
 			]
 		except ValueError:
@@ -1432,8 +1477,8 @@ class ID3v2TimestampFrame(ID3v2Frame):
 
 		try:
 			values = [
-				decode_bytestring(value, encoding)
-				for value in split_encoded(frame_data[1:], encoding)
+				value
+				for value in decode_split_encoded(frame_data[1:], encoding)
 				if value
 			]
 		except ValueError:
@@ -1480,12 +1525,12 @@ class ID3v2UserTextFrame(ID3v2Frame):
 		encoding = determine_encoding(frame_data)
 
 		try:
-			description, *remainder = split_encoded(frame_data[1:], encoding)
+			description, *remainder = decode_split_encoded(frame_data[1:], encoding)
 		except ValueError:
 			raise TagError("Missing data in user text frame.") from None
 
 		values = [
-			decode_bytestring(value, encoding)
+			value
 			for value in remainder
 			if value
 		]
@@ -1495,7 +1540,7 @@ class ID3v2UserTextFrame(ID3v2Frame):
 
 		return (
 			ID3v2UserText(
-				description=decode_bytestring(description, encoding),
+				description=description,
 				text=values,
 			),
 			encoding,
@@ -17,7 +17,7 @@ __all__ = [
 import os
 import re
 import struct
-from functools import lru_cache
+import weakref
 
 import more_itertools
 from attr import (
@@ -52,6 +52,7 @@ from .tables import (
 from ..exceptions import FormatError
 from ..models import (
 	Format,
+	SlottedAttrMapping,
 	StreamInfo,
 )
 from ..utils import (
@@ -66,6 +67,56 @@ except ImportError:
 	import bitstruct
 	bitstruct.Error = (bitstruct.Error,)
 
+# Results of ``MP3StreamInfo.find_mpeg_frames`` keyed by reader.
+# This lets ``determine_format`` and ``MP3StreamInfo.parse`` share a scan
+# without keeping readers (and their file handles) alive after a load.
+_mpeg_frames_cache = weakref.WeakKeyDictionary()
+
+
+def _build_mpeg_frame_headers():
+	# Indexed by bits 20-10 of a 4-byte MPEG frame header:
+	# version, layer, protection, bitrate, and sample rate.
+	# Entries are (version, layer, protected, bitrate, sample_rate, slot_size, frame_size),
+	# with frame_size not including padding, or None for invalid headers.
+	# Padding and channel mode are read from bits 9 and 7-6.
+	frame_headers = [None] * 2048
+
+	for version_id, version in enumerate([2.5, None, 2, 1]):
+		if version is None:
+			continue
+
+		for layer_index in range(1, 4):
+			layer = 4 - layer_index
+			samples_per_frame, slot_size = MP3SamplesPerFrame[(version, layer)]
+
+			for protection in range(2):
+				for bitrate_index in range(1, 15):
+					bitrate = MP3Bitrates[(version, layer)][bitrate_index] * 1000
+
+					for sample_rate_index, sample_rate in enumerate(MP3SampleRates[version]):
+						key = (
+							(version_id << 9)
+							| (layer_index << 7)
+							| (protection << 6)
+							| (bitrate_index << 2)
+							| sample_rate_index
+						)
+
+						frame_headers[key] = (
+							version,
+							layer,
+							not protection,
+							bitrate,
+							sample_rate,
+							slot_size,
+							((samples_per_frame // 8 * bitrate) // sample_rate) * slot_size,
+						)
+
+	return frame_headers
+
+
+_mpeg_frame_headers = _build_mpeg_frame_headers()
+
 
 @attrs(
 	repr=False,
@@ -139,8 +190,9 @@ class LAMEEncodingFlags(AttrMapping):
 @attrs(
 	repr=False,
 	kw_only=True,
+	slots=True,
 )
-class LAMEHeader(AttrMapping):
+class LAMEHeader(SlottedAttrMapping):
 	_crc = attrib()
 	version = attrib()
 	revision = attrib()
@@ -175,7 +227,7 @@ class LAMEHeader(AttrMapping):
 			elif not k.startswith('_'):
 				repr_dict[k] = v
 
-		return super().__repr__(repr_dict=repr_dict)
+		return SlottedAttrMapping.__repr__(self, repr_dict=repr_dict)
 
 	@datareader
 	@classmethod
@@ -396,8 +448,9 @@ class VBRIHeader(AttrMapping):
 @attrs(
 	repr=False,
 	kw_only=True,
+	slots=True,
 )
-class MPEGFrameHeader(AttrMapping):
+class MPEGFrameHeader(SlottedAttrMapping):
 	_start = attrib()
 	_size = attrib()
 	_vbri = attrib()
@@ -422,50 +475,37 @@ class MPEGFrameHeader(AttrMapping):
 			elif not k.startswith('_'):
 				repr_dict[k] = v
 
-		return super().__repr__(repr_dict=repr_dict)
+		return SlottedAttrMapping.__repr__(self, repr_dict=repr_dict)
 
 	@datareader
 	@classmethod
 	def parse(cls, data):
 		frame_start = data.tell()
 
-		sync, version_id, layer_index, protection = bitstruct.unpack(
-			'u11 u2 u2 b1',
-			data.read(2),
-		)
-
-		if sync != 2047:
+		try:
+			header = struct.unpack('>I', data.read(4))[0]
+		except struct.error:
+			raise FormatError("Not enough data.") from None
+
+		# Leave the position where reading the header field by field would have stopped,
+		# so frame scans resume from the same place.
+		if header >> 21 != 2047:
+			data.seek(frame_start + 2, os.SEEK_SET)
 			raise FormatError("Invalid MPEG frame sync.")
 
-		version = [2.5, None, 2, 1][version_id]
-
-		layer = 4 - layer_index
-
-		protected = not protection
-
-		bitrate_index, sample_rate_index, padded = bitstruct.unpack(
-			'u4 u2 b1',
-			data.read(1),
-		)
+		frame_header = _mpeg_frame_headers[(header >> 10) & 0x7FF]
 
-		if (
-			version_id == 1
-			or layer_index == 0
-			or bitrate_index == 0
-			or bitrate_index == 15
-			or sample_rate_index == 3
-		):
+		if frame_header is None:
+			data.seek(frame_start + 3, os.SEEK_SET)
 			raise FormatError("Invalid MPEG audio frame.")
 
-		channel_mode = MP3ChannelMode(bitstruct.unpack('u2', data.read(1))[0])
-		channels = 1 if channel_mode == 3 else 2
-
-		bitrate = MP3Bitrates[(version, layer)][bitrate_index] * 1000
-		sample_rate = MP3SampleRates[version][sample_rate_index]
+		version, layer, protected, bitrate, sample_rate, slot_size, frame_size = frame_header
 
-		samples_per_frame, slot_size = MP3SamplesPerFrame[(version, layer)]
+		padded = (header >> 9) & 1
+		frame_size += padded * slot_size
 
-		frame_size = (((samples_per_frame // 8 * bitrate) // sample_rate) + padded) * slot_size
+		channel_mode = MP3ChannelMode((header >> 6) & 3)
+		channels = 1 if channel_mode == 3 else 2
 
 		vbri_header = None
 		xing_header = None
@@ -529,34 +569,76 @@ class MP3StreamInfo(StreamInfo):
 	@datareader
 	@staticmethod
 	def count_mpeg_frames(data):
+		# Walks frames the same way as scanning 128-byte peeks with MPEGFrameHeader.parse,
+		# but sizes frames from a lookup table over large reads
+		# so no objects are created per frame.
 		num_frames = 0
 
-		buffer_size = 128
-		buffer = data.peek(buffer_size)
+		window_size = 128
+		chunk_size = 1024 * 1024
+		unpack_header = struct.Struct('>I').unpack_from
 
-		while len(buffer) >= buffer_size:
-			sync_start = buffer.find(b'\xFF')
+		position = data.tell()
+		end = data.seek(0, os.SEEK_END)
 
-			if sync_start >= 0:  # pragma: nobranch
-				data.seek(sync_start, os.SEEK_CUR)
+		buffer = b''
+		buffer_start = position
 
-				try:
-					frame = MPEGFrameHeader.parse(data)
-					num_frames += 1
-					data.seek(frame._start + frame._size, os.SEEK_SET)
-				except (FormatError, *bitstruct.Error):  # pragma: nocover
-					data.seek(1, os.SEEK_CUR)
-			else:
-				data.seek(buffer_size, os.SEEK_CUR)
+		while end - position >= window_size:
+			index = position - buffer_start
 
-			buffer = data.peek(buffer_size)
+			# Keep a full window plus the rest of a header in the buffer.
+			if (
+				index + window_size + 3 > len(buffer)
+				and buffer_start + len(buffer) < end
+			):
+				data.seek(position, os.SEEK_SET)
+				buffer = data.read(chunk_size)
+				buffer_start = position
+				index = 0
+
+			sync_start = buffer.find(b'\xFF', index, index + window_size)
+
+			if sync_start == -1:
+				position += window_size
+				continue
+
+			# A header cut off by the end of the data can't be a frame,
+			# and there can't be enough data left for another window.
+			if sync_start + 4 > len(buffer):
+				break
+
+			header = unpack_header(buffer, sync_start)[0]
+
+			# On a bad header, resume 1 byte past where MPEGFrameHeader.parse leaves off.
+			if header >> 21 != 2047:
+				position = buffer_start + sync_start + 3
+				continue
+
+			frame_header = _mpeg_frame_headers[(header >> 10) & 0x7FF]
+			if frame_header is None:
+				position = buffer_start + sync_start + 4
+				continue
+
+			num_frames += 1
+			position = buffer_start + sync_start + frame_header[6] + ((header >> 9) & 1) * frame_header[5]
+
+		data.seek(position, os.SEEK_SET)
 
 		return num_frames
 
 	@datareader
 	@staticmethod
-	@lru_cache()
 	def find_mpeg_frames(data):
+		scan_start = data.tell()
+
+		cached = _mpeg_frames_cache.get(data)
+		if (
+			cached is not None
+			and cached[0] == scan_start
+		):
+			return cached[1]
+
 		frames = []
 		cached_frames = None
 		buffer_size = 128
@@ -568,7 +650,7 @@ class MP3StreamInfo(StreamInfo):
 			if sync_start >= 0:
 				data.seek(sync_start, os.SEEK_CUR)
 
-				if bitstruct.unpack('u11', data.peek(2))[0] == 2047:
+				if struct.unpack('>H', data.peek(2))[0] >> 5 == 2047:
 					for _ in range(4):
 						try:
 							frame = MPEGFrameHeader.parse(data)
@@ -615,6 +697,8 @@ class MP3StreamInfo(StreamInfo):
 			else:
 				raise FormatError("No XING header and insufficient MPEG frames.")
 
+		_mpeg_frames_cache[data] = (scan_start, frames)
+
 		return frames
 
 	@datareader
@@ -622,6 +706,9 @@ class MP3StreamInfo(StreamInfo):
 	def parse(cls, data):
 		frames = cls.find_mpeg_frames(data)
 
+		# The scan is only shared with ``determine_format``, so drop it once used.
+		_mpeg_frames_cache.pop(data, None)
+
 		samples_per_frame, _ = MP3SamplesPerFrame[(frames[0].version, frames[0].layer)]
 
 		data.seek(0, os.SEEK_END)
@@ -743,11 +830,17 @@ class MP3(Format):
 	tags_type = ID3v2Frames
 
 	@classmethod
-	def parse(cls, data):
+	def parse(cls, data, *, tags=True, pictures=True, frames=None, lazy=False):
 		self = super()._load(data)
 
 		try:
-			self._id3 = ID3v2.parse(self._obj)
+			self._id3 = ID3v2.parse(
+				self._obj,
+				tags=tags,
+				pictures=pictures,
+				frames=frames,
+				lazy=lazy,
+			)
 			self.pictures = self._id3.pictures
 			self.tags = self._id3.tags
 		except FormatError:
@@ -756,7 +849,10 @@ class MP3(Format):
 		self.streaminfo = MP3StreamInfo.parse(self._obj)
 
 		# Use ID3v1 if present and ID3v2 is not.
-		if '_id3' not in self:
+		if (
+			tags
+			and '_id3' not in self
+		):
 			self._obj.seek(self.streaminfo._start + self.streaminfo._size, os.SEEK_SET)
 
 			end_buffer = self._obj.read()
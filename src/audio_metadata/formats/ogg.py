@@ -7,10 +7,12 @@ __all__ = [
 	'OggPage',
 	'OggPageHeader',
 	'OggPageSegments',
+	'OggStream',
 ]
 
 import os
 import struct
+import zlib
 
 import bitstruct
 from attr import (
@@ -27,15 +29,54 @@ from ..exceptions import (
 	FormatError,
 	UnsupportedFormat,
 )
-from ..models import Format
+from ..models import (
+	Format,
+	SlottedAttrMapping,
+)
+
+_ogg_page_header = struct.Struct('<4sBBqIIIB')
+
+# Header, lacing table of 255 segments, and 255 bytes per segment.
+_max_ogg_page_size = 27 + 255 + 255 * 255
+
+_reversed_bits = bytes(
+	int(f'{i:08b}'[::-1], 2)
+	for i in range(256)
+)
+
+
+# The Ogg CRC is non-reflected with no initial or final XOR.
+# With the bits of each byte reversed, it's the reflected CRC-32 computed by zlib
+# started from 0xFFFFFFFF to cancel zlib's initial XOR.
+# Cancelling zlib's final XOR and reversing the bits of the result gives the Ogg CRC.
+def _reverse_crc(crc):
+	return int(f'{crc ^ 0xFFFFFFFF:032b}'[::-1], 2)
+
+
+def _ogg_page_crc(reversed_page):
+	# The CRC of a page with the bits of each byte reversed.
+	# It's computed with the CRC field set to 0.
+	crc = zlib.crc32(reversed_page[:22], 0xFFFFFFFF)
+	crc = zlib.crc32(b'\x00\x00\x00\x00', crc)
+	crc = zlib.crc32(reversed_page[26:], crc)
+
+	return _reverse_crc(crc)
 
 
 @attrs(
 	repr=False,
 	kw_only=True,
+	slots=True,
 )
-class OggPageHeader(AttrMapping):
+class OggPageHeader(SlottedAttrMapping):
+	"""Ogg page header.
+
+	Includes the segment table, as the sizes of the packets
+	or parts of packets in the page.
+	"""
+
 	_start = attrib()
+	_size = attrib()
 	version = attrib()
 	is_continued = attrib(converter=bool)
 	is_first = attrib(converter=bool)
@@ -45,6 +86,8 @@ class OggPageHeader(AttrMapping):
 	sequence_number = attrib()
 	crc = attrib()
 	num_segments = attrib()
+	is_complete = attrib()
+	segment_sizes = attrib()
 
 	@datareader
 	@classmethod
@@ -68,8 +111,22 @@ class OggPageHeader(AttrMapping):
 
 		is_last, is_first, is_continued = bitstruct.unpack('<p5 b1 b1 b1', flags)
 
+		segment_sizes = []
+		total = 0
+		for segment in data.read(num_segments):
+			total += segment
+			if segment < 255:
+				segment_sizes.append(total)
+				total = 0
+
+		is_complete = True
+		if total:
+			segment_sizes.append(total)
+			is_complete = False
+
 		return cls(
 			start=start,
+			size=27 + num_segments + sum(segment_sizes),
 			version=version,
 			is_continued=is_continued,
 			is_first=is_first,
@@ -79,9 +136,32 @@ class OggPageHeader(AttrMapping):
 			sequence_number=sequence_number,
 			crc=crc,
 			num_segments=num_segments,
+			is_complete=is_complete,
+			segment_sizes=segment_sizes,
 		)
 
 
+@attrs(
+	repr=False,
+	kw_only=True,
+)
+class OggStream(AttrMapping):
+	"""A logical stream in an Ogg file.
+
+	Attributes:
+		first_packet (bytes): The first packet of the stream,
+			which identifies the codec.
+		position (int): The granule position of the last page of the stream.
+		serial_number (int): The serial number of the stream.
+	"""
+
+	_start = attrib()
+	_end = attrib()
+	first_packet = attrib()
+	position = attrib()
+	serial_number = attrib()
+
+
 class OggPageSegments(LabelList):
 	item_label = ('segment', 'segments')
 
@@ -108,27 +188,14 @@ class OggPage(AttrMapping):
 	def parse(cls, data):
 		header = OggPageHeader.parse(data)
 
-		segment_sizes = []
-		total = 0
-		for segment in data.read(header.num_segments):
-			total += segment
-			if segment < 255:
-				segment_sizes.append(total)
-				total = 0
-
-		is_complete = True
-		if total:
-			segment_sizes.append(total)
-			is_complete = False
-
 		segments = [
 			data.read(segment_size)
-			for segment_size in segment_sizes
+			for segment_size in header.segment_sizes
 		]
 
 		return cls(
 			header=header,
-			is_complete=is_complete,
+			is_complete=header.is_complete,
 			is_continued=header.is_continued,
 			is_first=header.is_first,
 			is_last=header.is_last,
@@ -149,60 +216,349 @@ class Ogg(Format):
 	Base class for various formats using an Ogg container.
 	"""
 
-	def find_last_page(self, info_serial):
-		self._obj.seek(0, os.SEEK_END)
-		size = self._obj.tell()
+	@staticmethod
+	def _scan_pages(buffer, start=0, end=None):
+		# Yield (index, serial_number, position, flags, size) for each
+		# valid-looking page header in a buffer starting in [start, end).
+		# Pages must fit in the buffer to be yielded.
+		if end is None:
+			end = len(buffer)
+
+		index = buffer.find(b'OggS', start, end)
+		while index != -1:
+			if index + 27 <= len(buffer):
+				(
+					_, version, flags,
+					position, serial_number,
+					_, _, num_segments
+				) = _ogg_page_header.unpack_from(buffer, index)
+
+				lacing_end = index + 27 + num_segments
+				if (
+					version == 0
+					and flags < 8
+					and lacing_end <= len(buffer)
+				):
+					size = 27 + num_segments + sum(buffer[index + 27 : lacing_end])
+
+					if index + size <= len(buffer):
+						yield index, serial_number, position, flags, size
+
+			index = buffer.find(b'OggS', index + 1, end)
+
+	def _chained_streams(self, codec_id):
+		# The logical streams of a codec in chained links,
+		# skipping any multiplexed with an earlier one.
+		streams = []
+		for stream in self.index_streams().values():
+			if (
+				stream.first_packet.startswith(codec_id)
+				and stream.position is not None
+				and (
+					not streams
+					or stream._start >= streams[-1]._end
+				)
+			):
+				streams.append(stream)
 
-		if size > 65536:
-			self._obj.seek(-65536, os.SEEK_END)
-		else:
-			self._obj.seek(0, os.SEEK_SET)
+		return streams
 
-		data = self._obj.read()
-		try:
-			index = data.rindex(b'OggS')
-		except ValueError:
-			raise Exception  # TODO
+	def _find_link_last_page(self, serial_numbers, link_start):
+		# Find (start, size, position) of the last page of a link with the given logical streams.
+		# Search forward in growing steps for a window past the link,
+		# so the cost depends on the size of the link rather than the file.
+		low = link_start
+		high = self.filesize
+		step = 65536
+		while low + step < high:
+			middle = low + step
 
-		self._obj.seek(-(len(data) - index), os.SEEK_END)
+			self._obj.seek(middle, os.SEEK_SET)
+			buffer = self._obj.read(2 * _max_ogg_page_size)
+
+			# Links don't overlap, so the first page is enough to tell.
+			page = next(self._scan_pages(buffer), None)
 
-		last_page = None
-		try:
-			page = OggPage.parse(self._obj)
-		except Exception:  # TODO
-			pass
-		else:
 			if (
-				page.serial_number == info_serial
+				page is None
+				or page[1] not in serial_numbers
+			):
+				high = middle
+				break
+
+			low = middle + page[0]
+			step *= 2
+
+		return self._find_last_page(
+			serial_numbers,
+			low,
+			min(self.filesize, high + _max_ogg_page_size),
+			granule=False,
+		)
+
+	def _find_last_page(self, serial_numbers, start, end, *, granule=True):
+		# Find (start, size, position) of the last page in [start, end)
+		# of any of the given logical streams, or None.
+		# Pages are searched for in progressively larger windows back from ``end``.
+		# If none are found there, the page is located by bisecting the rest,
+		# which is where chained streams put earlier links.
+		# The streams must have a page at ``start``.
+		def is_stream_page(serial_number, position, flags):
+			# Pages without any packet ending on them have a position of -1.
+			return (
+				serial_number in serial_numbers
 				and (
-					not page.is_continued
-					or page.position != -1
+					not granule
+					or not flags & 1
+					or position != -1
 				)
-			):
-				if page.is_last:
-					last_page = page
+			)
+
+		last_page = None
+
+		# Backward scan of the tail.
+		window_size = 65536
+		window_end = end
+		while (
+			window_end > start
+			and window_size <= 262144
+		):
+			window_start = max(start, window_end - window_size)
+
+			# Overlap into the previous window so pages starting in this one are whole.
+			self._obj.seek(window_start, os.SEEK_SET)
+			buffer = self._obj.read(min(end, window_end + _max_ogg_page_size) - window_start)
+
+			for index, serial_number, position, flags, size in self._scan_pages(buffer, end=window_end - window_start):
+				if is_stream_page(serial_number, position, flags):
+					last_page = (window_start + index, size, position)
+
+			if last_page is not None:
+				return last_page
+
+			window_end = window_start
+			window_size *= 2
+
+		if window_end <= start:
+			return None
+
+		# Bisect the rest for the last window with a page of the streams.
+		low = start
+		high = window_end
+		while high - low > _max_ogg_page_size:
+			middle = (low + high) // 2
+
+			self._obj.seek(middle, os.SEEK_SET)
+			buffer = self._obj.read(min(end - middle, 2 * _max_ogg_page_size))
+
+			pages = [
+				middle + index
+				for index, serial_number, _, _, _ in self._scan_pages(buffer, end=min(len(buffer), high - middle))
+				if serial_number in serial_numbers
+			]
+
+			if pages:
+				low = pages[-1]
+			else:
+				high = middle
+
+		# Walk forward from the last known page of the streams.
+		self._obj.seek(low, os.SEEK_SET)
+		buffer = self._obj.read(min(end, high + _max_ogg_page_size) - low)
+
+		for index, serial_number, position, flags, size in self._scan_pages(buffer, end=high - low):
+			if is_stream_page(serial_number, position, flags):
+				last_page = (low + index, size, position)
+
+		return last_page
+
+	def find_last_page(self, info_serial):
+		"""Find the last page of a logical stream with a granule position.
+
+		The stream must have a page at the start of the file.
+
+		Parameters:
+			info_serial (int): The serial number of the logical stream.
+
+		Returns:
+			OggPage: The last page of the stream, or ``None`` if not found.
+			The file position is left at the end of the page.
+		"""
+
+		last_page = self._find_last_page({info_serial}, 0, self.filesize)
 
 		if last_page is None:
-			self._obj.seek(0, os.SEEK_SET)
+			return None
+
+		self._obj.seek(last_page[0], os.SEEK_SET)
+
+		return OggPage.parse(self._obj)
+
+	def index_streams(self):
+		"""Index the logical streams of the file.
+
+		Chained links are found one after another by their beginning-of-stream pages.
+		Only the first pages of each link and pages near the end of each stream are read.
+
+		Returns:
+			dict: A mapping of serial numbers to :class:`OggStream` objects in file order.
+		"""
+
+		streams = {}
+
+		# The last page of the file, to recognize the last link without searching for its end.
+		self._obj.seek(max(0, self.filesize - _max_ogg_page_size), os.SEEK_SET)
+		buffer = self._obj.read()
+
+		file_last_page = None
+		for index, serial_number, position, _, size in self._scan_pages(buffer):
+			file_last_page = (self.filesize - len(buffer) + index, size, position, serial_number)
+
+		link_start = 0
+		while self.filesize - link_start >= 27:
+			# The beginning-of-stream pages of all streams in a link come first.
+			link_streams = []
+			self._obj.seek(link_start, os.SEEK_SET)
 			try:
-				page = OggPage.parse(self._obj)
-				while True:
-					if page.serial_number == info_serial:
-						if (
-							not page.is_continued
-							or page.position != -1
-						):
-							last_page = page
-
-							if page.is_last:
-								break
-
-					page = OggPage.parse(self._obj)
-			except Exception:
+				for header in self.parse_page_headers():
+					if not header.is_first:
+						break
+
+					link_streams.append(
+						OggStream(
+							start=header._start,
+							end=None,
+							first_packet=b''.join(self.read_page_segments(header, 1)),
+							position=None,
+							serial_number=header.serial_number,
+						)
+					)
+			except FormatError:
 				pass
 
-		return last_page
+			if not link_streams:
+				break
+
+			serial_numbers = {stream.serial_number for stream in link_streams}
+			if (
+				file_last_page is not None
+				and file_last_page[3] in serial_numbers
+			):
+				link_last_page = file_last_page[:3]
+			else:
+				link_last_page = self._find_link_last_page(serial_numbers, link_start)
+
+			link_end = link_last_page[0] + link_last_page[1]
+
+			for stream in link_streams:
+				if (
+					len(link_streams) == 1
+					and link_last_page[2] != -1
+				):
+					last_page = link_last_page
+				else:
+					last_page = self._find_last_page({stream.serial_number}, stream._start, link_end)
+
+				if last_page is not None:
+					stream._end = last_page[0] + last_page[1]
+					stream.position = last_page[2]
+
+				streams.setdefault(stream.serial_number, stream)
+
+			link_start = link_end
+
+		return streams
+
+	def parse_page_headers(self):
+		"""Parse page headers from the current position, skipping page data.
+
+		The file position is left at the end of the last page yielded,
+		and each page is parsed from the end of the previous one
+		even if the position is changed in between.
+
+		Yields:
+			OggPageHeader: The header of the next page.
+		"""
+
+		position = self._obj.tell()
+		while (self.filesize - position) >= 27:
+			self._obj.seek(position, os.SEEK_SET)
+			header = OggPageHeader.parse(self._obj)
+
+			position = header._start + header._size
+			self._obj.seek(position, os.SEEK_SET)
+
+			yield header
 
 	def parse_pages(self):
 		while (self.filesize - self._obj.tell()) >= 27:
 			yield OggPage.parse(self._obj)
+
+	def verify_crc(self):
+		"""Verify the CRC of every page.
+
+		The file position is restored afterwards.
+
+		Raises:
+			FormatError: If a page is invalid, truncated, or has an invalid CRC.
+		"""
+
+		position = self._obj.tell()
+		self._obj.seek(0, os.SEEK_SET)
+
+		chunk_size = 1024 * 1024
+
+		buffer = b''
+		buffer_start = 0
+		index = 0
+		while True:
+			# Keep at least a full page in the buffer.
+			if len(buffer) - index < _max_ogg_page_size:
+				buffer = buffer[index:] + self._obj.read(chunk_size)
+				buffer_start += index
+				index = 0
+
+				reversed_view = memoryview(buffer.translate(_reversed_bits))
+
+			if len(buffer) - index < 27:
+				break
+
+			if buffer[index : index + 4] != b'OggS':
+				raise FormatError(f"Valid Ogg page header not found at offset {buffer_start + index}.")
+
+			header_end = index + 27 + buffer[index + 26]
+			page_end = header_end + sum(buffer[index + 27 : header_end])
+
+			if page_end > len(buffer):
+				raise FormatError(f"Truncated Ogg page at offset {buffer_start + index}.")
+
+			if (
+				_ogg_page_crc(reversed_view[index:page_end])
+				!= struct.unpack_from('<I', buffer, index + 22)[0]
+			):
+				raise FormatError(f"Invalid CRC for Ogg page at offset {buffer_start + index}.")
+
+			index = page_end
+
+		self._obj.seek(position, os.SEEK_SET)
+
+	def read_page_segments(self, header, count=None):
+		"""Read the segments of a page.
+
+		The file position is left at the end of the last segment read.
+
+		Parameters:
+			header (OggPageHeader): The header of the page.
+			count (int): The number of segments to read from the start of the page.
+				Default: All segments
+
+		Returns:
+			list: The segments of the page.
+		"""
+
+		self._obj.seek(header._start + 27 + header.num_segments, os.SEEK_SET)
+
+		return [
+			self._obj.read(segment_size)
+			for segment_size in header.segment_sizes[:count]
+		]
@@ -101,60 +101,98 @@ class OggVorbis(Ogg):
 	tags_type = OggVorbisComments
 
 	@classmethod
-	def parse(cls, data):
+	def parse(
+		cls,
+		data,
+		*,
+		tags=True,
+		pictures=True,
+		frames=None,
+		lazy=False,
+		verify_crc=False,
+	):
 		self = super()._load(data)
 
+		if verify_crc:
+			self.verify_crc()
+
 		self._obj.seek(0, os.SEEK_SET)
 		if self._obj.peek(4) != b'OggS':
 			raise FormatError("Valid Ogg page header not found.")
 
-		page = next(self.parse_pages())
+		pages = self.parse_page_headers()
+
+		header = next(pages)
+		segment = self.read_page_segments(header, 1)[0]
 
-		if not page.segments[0].startswith(b'\x01vorbis'):
+		if not segment.startswith(b'\x01vorbis'):
 			raise FormatError("``\x01vorbis`` must be first page in Ogg Vorbis.")
 		else:
-			self.streaminfo = OggVorbisStreamInfo.parse(page.segments[0])
-			info_serial = page.serial_number
+			self.streaminfo = OggVorbisStreamInfo.parse(segment)
+			info_serial = header.serial_number
 
-		audio_start = self._obj.tell()
+		audio_start = header._start + header._size
 
-		page = next(self.parse_pages())
-		if (
-			page.serial_number == info_serial
-			and page.segments[0].startswith(b'\x03vorbis')
-		):
-			audio_start = self._obj.tell()
+		# Skip the pages of multiplexed streams.
+		header = next(pages)
+		while header.serial_number != info_serial:
+			header = next(pages)
 
-			tag_pages = [page]
+		# Only the headers of any later comment pages are read here,
+		# as their data is only needed to parse tags.
+		tag_data = self.read_page_segments(header, 1)[0]
+		if tag_data.startswith(b'\x03vorbis'):
+			audio_start = header._start + header._size
+
+			tag_pages = [header]
 			while not (
 				tag_pages[-1].is_complete
-				or len(tag_pages[-1].segments) > 1
+				or len(tag_pages[-1].segment_sizes) > 1
 			):
-				page = next(self.parse_pages())
-				if page.serial_number == tag_pages[0].serial_number:
-					tag_pages.append(page)
+				header = next(pages)
+				if header.serial_number == tag_pages[0].serial_number:
+					tag_pages.append(header)
 
-					audio_start = self._obj.tell()
+					audio_start = header._start + header._size
 
-		last_page = self.find_last_page(info_serial)
-		audio_end = self._obj.tell()
+		# Chained links can each have a different sample rate.
+		streams = self._chained_streams(b'\x01vorbis')
+		if not streams:
+			raise FormatError("Valid Ogg Vorbis audio page not found.")
 
-		self.streaminfo._start = audio_start
-		self.streaminfo._size = audio_end - audio_start
-		self.streaminfo.duration = last_page.position / self.streaminfo.sample_rate
-		self.streaminfo.bitrate = (self.streaminfo._size * 8) / self.streaminfo.duration
-
-		tag_data = b''.join(
-			page.segments[0]
-			for page in tag_pages
+		duration = sum(
+			max(0, stream.position) / OggVorbisStreamInfo.parse(stream.first_packet).sample_rate
+			for stream in streams
 		)
-		self.tags = OggVorbisComments.parse(tag_data)
 
-		pictures = self.tags.pop('metadata_block_picture', [])
-		self.pictures = [
-			FLACPicture.parse(b64decode(picture))
-			for picture in pictures
-		]
+		self.streaminfo._start = audio_start
+		self.streaminfo._size = streams[-1]._end - audio_start
+		self.streaminfo.duration = duration
+
+		# A truncated file can end before the first audio page.
+		if self.streaminfo.duration:
+			self.streaminfo.bitrate = (self.streaminfo._size * 8) / self.streaminfo.duration
+		else:
+			self.streaminfo.bitrate = 0
+
+		if tags:
+			tag_data = b''.join(
+				[
+					tag_data,
+					*(
+						self.read_page_segments(page, 1)[0]
+						for page in tag_pages[1:]
+					),
+				]
+			)
+			self.tags = OggVorbisComments.parse(tag_data)
+
+			encoded_pictures = self.tags.pop('metadata_block_picture', [])
+			if pictures:
+				self.pictures = [
+					FLACPicture.parse(b64decode(picture))
+					for picture in encoded_pictures
+				]
 
 		self._obj.close()
 
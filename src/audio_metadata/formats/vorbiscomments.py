@@ -5,6 +5,8 @@ __all__ = [
 	'VorbisComments',
 ]
 
+import os
+import re
 import struct
 from collections import defaultdict
 
@@ -23,6 +25,11 @@ from ..models import (
 	Tags,
 )
 
+# Names are ASCII 0x20 through 0x7D, excluding 0x3D (``=``).
+_invalid_name_char = re.compile(r'[^\x20-\x3C\x3E-\x7D]')
+_invalid_name_byte = re.compile(rb'[^\x20-\x3C\x3E-\x7D]')
+_uint32 = struct.Struct('I')
+
 
 @attrs(
 	repr=False,
@@ -33,14 +40,7 @@ class VorbisComment(Tag):
 
 	@staticmethod
 	def _validate_name(name):
-		return all(
-			(
-				char >= ' '
-				and char <= '}'
-				and char != '='
-			)
-			for char in name
-		)
+		return _invalid_name_char.search(name) is None
 
 	@datareader
 	@classmethod
@@ -80,9 +80,30 @@ class VorbisComments(Tags):
 
 		fields = defaultdict(list)
 
+		# Walk the comments by offset in one buffer
+		# rather than parsing a VorbisComment object for each.
+		buffer = data.read()
+		offset = 0
+
 		for _ in range(num_comments):
-			comment = VorbisComment.parse(data)
-			fields[comment.name].append(comment.value)
+			length = _uint32.unpack_from(buffer, offset)[0]
+			start = offset + 4
+			offset = min(start + length, len(buffer))
+
+			separator = buffer.find(b'=', start, offset)
+			if separator == -1:
+				raise FormatError("Vorbis comment must contain an ``=``.")
+
+			if _invalid_name_byte.search(buffer, start, separator) is not None:
+				name = buffer[start:separator].decode('utf-8', 'replace')
+				raise TagError(f"Invalid character in Vorbis comment name: ``{name}``.")
+
+			fields[buffer[start:separator].lower().decode('ascii')].append(
+				buffer[separator + 1:offset].decode('utf-8', 'replace')
+			)
+
+		# Leave the reader at the end of the last comment.
+		data.seek(offset - len(buffer), os.SEEK_CUR)
 
 		return cls(
 			fields,
@@ -161,13 +161,23 @@ class WAVE(Format):
 
 	@datareader
 	@staticmethod
-	def _parse_subchunk(data):
+	def _parse_subchunk(data, *, tags=True, pictures=True, frames=None, lazy=False):
 		subchunk_id, subchunk_size = struct.unpack(
 			'4sI',
 			data.read(8),
 		)
 
-		if subchunk_id == b'fmt ':
+		if (
+			not tags
+			and (
+				subchunk_id == b'LIST'
+				and data.peek(4) == b'INFO'
+				or subchunk_id.lower() == b'id3 '
+			)
+		):
+			data.seek(subchunk_size, os.SEEK_CUR)
+			subchunk = None
+		elif subchunk_id == b'fmt ':
 			subchunk = WAVEStreamInfo.parse(data)
 			if subchunk_size > 16:
 				subchunk._extension_data = data.read(subchunk_size - 16)  # Add raw extension data if not PCM.
@@ -178,7 +188,12 @@ class WAVE(Format):
 			subchunk = RIFFTags.parse(data.read(subchunk_size))
 		elif subchunk_id.lower() == b'id3 ':
 			try:
-				subchunk = ID3v2.parse(data)
+				subchunk = ID3v2.parse(
+					data,
+					pictures=pictures,
+					frames=frames,
+					lazy=lazy,
+				)
 			except FormatError:
 				raise
 		else:
@@ -190,7 +205,7 @@ class WAVE(Format):
 		return subchunk
 
 	@classmethod
-	def parse(cls, data):
+	def parse(cls, data, *, tags=True, pictures=True, frames=None, lazy=False):
 		self = super()._load(data)
 
 		chunk_id = self._obj.read(4)
@@ -205,22 +220,30 @@ class WAVE(Format):
 
 		subchunk_header = self._obj.peek(8)
 		while len(subchunk_header) == 8:
-			subchunk = self._parse_subchunk(self._obj)
-
-			if (
-				isinstance(subchunk, WAVESubchunk)
-				and subchunk.id == b'data'
-			):
-				audio_size = len(subchunk.data)
-				audio_start = self._obj.tell() - audio_size
-			elif isinstance(subchunk, WAVEStreamInfo):
-				self.streaminfo = subchunk
-			elif isinstance(subchunk, RIFFTags):
-				self._riff = subchunk
-			elif isinstance(subchunk, ID3v2):
-				self._id3 = subchunk
+			# Only the position and size of the audio data are needed,
+			# so it's skipped instead of read.
+			if subchunk_header[:4] == b'data':
+				subchunk_size = struct.unpack('I', subchunk_header[4:])[0]
+				audio_start = self._obj.tell() + 8
+				audio_size = max(0, min(subchunk_size, self.filesize - audio_start))
+				self._obj.seek(8 + audio_size, os.SEEK_CUR)
 			else:
-				self._subchunks.append(subchunk)
+				subchunk = self._parse_subchunk(
+					self._obj,
+					tags=tags,
+					pictures=pictures,
+					frames=frames,
+					lazy=lazy,
+				)
+
+				if isinstance(subchunk, WAVEStreamInfo):
+					self.streaminfo = subchunk
+				elif isinstance(subchunk, RIFFTags):
+					self._riff = subchunk
+				elif isinstance(subchunk, ID3v2):
+					self._id3 = subchunk
+				elif subchunk is not None:
+					self._subchunks.append(subchunk)
 
 			subchunk_header = self._obj.peek(8)
 
@@ -1,12 +1,21 @@
 __all__ = [
 	'Format',
 	'Picture',
+	'SlottedAttrMapping',
 	'StreamInfo',
 	'Tag',
 	'Tags',
 ]
 
 import os
+from collections.abc import (
+	Mapping,
+	MutableMapping,
+)
+from io import (
+	BufferedReader,
+	BytesIO,
+)
 
 from attr import (
 	attrib,
@@ -19,6 +28,11 @@ from tbm_utils import (
 	humanize_filesize,
 )
 
+from .readers import FileSectionReader
+from .serialization import (
+	deserialize,
+	serialize,
+)
 from .utils import (
 	humanize_bitrate,
 	humanize_duration,
@@ -26,6 +40,77 @@ from .utils import (
 )
 
 
+class SlottedAttrMapping(MutableMapping):
+	"""Base class for attrs classes created with ``slots=True``.
+
+	Provides the mapping and attribute interface of :class:`AttrMapping`
+	over the attrs attributes instead of an instance ``__dict__``.
+	Used for record types that can be parsed in large numbers.
+
+	Unlike :class:`AttrMapping`, only attrs attributes can be set.
+	attrs replaces slotted classes, so methods of subclasses
+	call base methods explicitly instead of through bare ``super()``.
+	"""
+
+	__slots__ = ()
+
+	def __init_subclass__(cls, **kwargs):
+		super().__init_subclass__(**kwargs)
+
+		cls._field_names = tuple(
+			attribute.name
+			for attribute in getattr(cls, '__attrs_attrs__', ())
+		)
+
+	def __getitem__(self, key):
+		if key not in self._field_names:
+			raise KeyError(key)
+
+		try:
+			return getattr(self, key)
+		except AttributeError:
+			raise KeyError(key) from None
+
+	def __setitem__(self, key, value):
+		if key not in self._field_names:
+			raise KeyError(key)
+
+		setattr(self, key, value)
+
+	def __delitem__(self, key):
+		if key not in self._field_names:
+			raise KeyError(key)
+
+		try:
+			delattr(self, key)
+		except AttributeError:
+			raise KeyError(key) from None
+
+	def __iter__(self):
+		return (
+			name
+			for name in self._field_names
+			if hasattr(self, name)
+		)
+
+	def __len__(self):
+		return sum(1 for _ in self)
+
+	def __repr__(self, repr_dict=None):
+		if repr_dict is None:
+			repr_dict = dict(self.items())
+
+		return AttrMapping.__repr__(self, repr_dict=repr_dict)
+
+	@classmethod
+	def from_mapping(cls, mapping):
+		return cls(**mapping)
+
+	items = AttrMapping.items
+	keys = AttrMapping.keys
+	values = AttrMapping.values
+
+
 @attrs(
 	repr=False,
 	kw_only=True,
@@ -124,6 +209,48 @@ class Format(AttrMapping):
 
 		return super().__repr__(repr_dict=repr_dict)
 
+	def __getstate__(self):
+		# The reader is only used while parsing and can't be serialized.
+		state = dict(self.__dict__)
+		state.pop('_obj', None)
+
+		return state
+
+	@classmethod
+	def from_bytes(cls, b):
+		"""Load an audio format object serialized with :meth:`to_bytes`.
+
+		Parameters:
+			b (bytes-like object): The serialized audio format object.
+
+		Returns:
+			Format: An audio format object of the serialized type.
+
+		Raises:
+			ValueError: If ``b`` is not a serialized object of this class.
+		"""
+
+		obj = deserialize(b)
+
+		if not isinstance(obj, cls):
+			raise ValueError(f"Serialized object is not {cls.__name__}.")
+
+		return obj
+
+	def to_bytes(self):
+		"""Serialize to a compact binary form.
+
+		Stream information, tags, and other parsed data are kept,
+		with enums stored as their values.
+		Pictures left in the file are stored as their location in the file
+		rather than their data.
+
+		Returns:
+			bytes: The serialized audio format object.
+		"""
+
+		return serialize(self)
+
 	@datareader
 	@classmethod
 	def _load(cls, data):
@@ -135,25 +262,155 @@ class Format(AttrMapping):
 			self.filesize = os.path.getsize(self._obj.name)
 		except AttributeError:
 			self.filepath = None
-			self.filesize = len(self._obj.raw.getbuffer())
+
+			position = self._obj.tell()
+			self.filesize = self._obj.seek(0, os.SEEK_END)
+			self._obj.seek(position, os.SEEK_SET)
 
 		return self
 
 
 class Picture(AttrMapping):
-	"""Base class for picture objects."""
+	"""Base class for picture objects.
+
+	Picture data parsed from a file is left in the file
+	and only read when ``data`` is first accessed.
+	Use :meth:`read` or :meth:`open` to get the data without keeping it.
+	"""
+
+	def __getattr__(self, attr):
+		if (
+			attr == 'data'
+			and '_filepath' in self.__dict__
+		):
+			self.data = self.read()
+
+			return self.data
+
+		return super().__getattr__(attr)
+
+	def __missing__(self, key):
+		if (
+			key == 'data'
+			and '_filepath' in self.__dict__
+		):
+			return self.data
+
+		raise KeyError(key)
+
+	def __contains__(self, key):
+		return (
+			key in self.__dict__
+			or (key == 'data' and self._is_deferred)
+		)
+
+	def __getstate__(self):
+		state = dict(self.__dict__)
+
+		# Data read from the file can be read again.
+		if '_filepath' in state:
+			state.pop('data', None)
+
+		return state
+
+	# The location of data left in the file isn't part of the picture,
+	# so it compares equal to the same picture with its data in memory.
+	def __iter__(self):
+		for k in self.__dict__:
+			if not k.startswith('_'):
+				yield k
+
+		if self._is_deferred:
+			yield 'data'
+
+	def __len__(self):
+		return sum(1 for _ in self)
+
+	# Data left in the file is read to compare it, but isn't kept.
+	def __eq__(self, other):
+		if not isinstance(other, Mapping):
+			return NotImplemented
+
+		if isinstance(other, Picture):
+			return self._to_dict() == other._to_dict()
+
+		return self._to_dict() == dict(other.items())
 
 	def __repr__(self):
 		repr_dict = {}
 
-		for k, v in sorted(self.items()):
+		for k in sorted(self):
 			if k == 'data':
-				repr_dict[k] = humanize_filesize(len(v), precision=2)
+				size = self._size if self._is_deferred else len(self.data)
+				repr_dict[k] = humanize_filesize(size, precision=2)
 			elif not k.startswith('_'):
-				repr_dict[k] = v
+				repr_dict[k] = self[k]
 
 		return super().__repr__(repr_dict=repr_dict)
 
+	@property
+	def _is_deferred(self):
+		return (
+			'_filepath' in self.__dict__
+			and 'data' not in self.__dict__
+		)
+
+	def _to_dict(self):
+		d = {
+			k: v
+			for k, v in self.__dict__.items()
+			if not k.startswith('_')
+		}
+
+		if self._is_deferred:
+			d['data'] = self.read()
+
+		return d
+
+	def _read_data(self, data, size):
+		try:
+			filepath = os.path.abspath(data.name)
+		except AttributeError:
+			self.data = data.read(size)
+		else:
+			self._defer_data(filepath, data.tell(), size)
+			data.seek(size, os.SEEK_CUR)
+
+	def _defer_data(self, filepath, offset, size):
+		self.__dict__.pop('data', None)
+		self._filepath = filepath
+		self._offset = offset
+		self._size = size
+
+	def open(self):  # noqa
+		"""Open the picture data as a binary stream.
+
+		Returns:
+			io.BufferedIOBase: A read-only binary stream of the picture data.
+		"""
+
+		if self._is_deferred:
+			return BufferedReader(FileSectionReader(self._filepath, self._offset, self._size))
+
+		return BytesIO(self.data)
+
+	def read(self):
+		"""Read the picture data.
+
+		Unlike ``data``, data read from the file isn't kept in memory.
+
+		Returns:
+			bytes: The binary picture data.
+		"""
+
+		if not self._is_deferred:
+			return self.data
+
+		with open(self._filepath, 'rb') as f:
+			f.seek(self._offset, os.SEEK_SET)
+
+			return f.read(self._size)
+
 
 class StreamInfo(AttrMapping):
 	"""Base class for stream information objects."""
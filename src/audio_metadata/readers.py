@@ -0,0 +1,527 @@
+__all__ = [
+	'FileRangeSource',
+	'FileSectionReader',
+	'IOStats',
+	'MmapDataReader',
+	'PlannedReader',
+	'RangeReader',
+	'SectionReader',
+]
+
+import mmap
+import os
+import stat
+from collections import OrderedDict
+from io import (
+	DEFAULT_BUFFER_SIZE,
+	BufferedReader,
+	FileIO,
+	RawIOBase,
+)
+
+from attr import (
+	attrib,
+	attrs,
+)
+from tbm_utils import (
+	AttrMapping,
+	DataReader,
+)
+
+from .utils import decode_synchsafe_int
+
+# The size read from the start of a file in one go
+# for the headers, small tags, and first MPEG frames or FLAC metadata blocks.
+# It isn't extended to cover larger tags, as their data may be skipped.
+_HEAD_SIZE = 16 * 1024
+
+# The same size parsers read from the end of a file for end tags and the last Ogg page.
+_TAIL_SIZE = 64 * 1024
+
+
+class FileRangeSource:
+	"""A range source for a local file.
+
+	A stand-in for remote sources to test range reading with
+	and measure how much of a file is fetched.
+
+	Parameters:
+		filepath (str or os.PathLike): A filepath or path-like object.
+
+	Attributes:
+		size (int): The size of the file.
+		num_requests (int): The number of ranges read.
+		num_bytes (int): The number of bytes read.
+	"""
+
+	def __init__(self, filepath):
+		self.filepath = filepath
+		self.size = os.path.getsize(filepath)
+		self.num_requests = 0
+		self.num_bytes = 0
+
+	def read_range(self, offset, length):
+		"""Read a range of the file.
+
+		Parameters:
+			offset (int): The position of the range in the file.
+			length (int): The size of the range.
+
+		Returns:
+			bytes: The data of the range.
+			Shorter than ``length`` if the range extends past the end of the file.
+		"""
+
+		with open(self.filepath, 'rb') as f:
+			f.seek(offset, os.SEEK_SET)
+			data = f.read(length)
+
+		self.num_requests += 1
+		self.num_bytes += len(data)
+
+		return data
+
+
+def _seek_position(position, size, offset, whence):
+	if whence == os.SEEK_SET:
+		new_position = offset
+	elif whence == os.SEEK_CUR:
+		new_position = position + offset
+	elif whence == os.SEEK_END:
+		new_position = size + offset
+	else:
+		raise ValueError(f"Invalid whence ({whence}).")
+
+	if new_position < 0:
+		raise ValueError(f"Negative seek position {new_position}.")
+
+	return new_position
+
+
+class _RawReader(RawIOBase):
+	# A read-only seekable raw stream of ``_size`` bytes.
+	# Subclasses read at ``_position`` into a buffer clamped to the end of the stream.
+
+	def __init__(self):
+		super().__init__()
+
+		self._size = 0
+		self._position = 0
+
+	def readable(self):
+		return True
+
+	def readinto(self, b):
+		self._checkClosed()
+
+		size = max(0, min(len(b), self._size - self._position))
+		if not size:
+			return 0
+
+		num_read = self._readinto(memoryview(b)[:size])
+		self._position += num_read
+
+		return num_read
+
+	# The rest of the stream is read at once instead of in buffer-sized reads.
+	def readall(self):
+		self._checkClosed()
+
+		b = bytearray(max(0, self._size - self._position))
+		num_read = 0
+		with memoryview(b) as view:
+			while num_read < len(b):
+				size = self.readinto(view[num_read:])
+				if not size:
+					break
+
+				num_read += size
+
+		del b[num_read:]
+
+		return bytes(b)
+
+	def seek(self, offset, whence=os.SEEK_SET):
+		self._checkClosed()
+
+		self._position = _seek_position(self._position, self._size, offset, whence)
+
+		return self._position
+
+	def seekable(self):
+		return True
+
+	def tell(self):
+		self._checkClosed()
+
+		return self._position
+
+	def _readinto(self, b):
+		raise NotImplementedError
+
+
+class SectionReader(_RawReader):
+	"""A read-only raw stream of a section of another stream.
+
+	Positions are relative to the start of the section
+	and reads stop at the end of the section.
+	The stream is seeked to the position in the section before each read
+	and isn't closed with the section.
+
+	Parameters:
+		stream (io.RawIOBase or io.BufferedIOBase): A seekable stream.
+		offset (int): The position of the section in the stream.
+		size (int): The size of the section.
+	"""
+
+	def __init__(self, stream, offset, size):
+		super().__init__()
+
+		self.stream = stream
+		self._offset = offset
+		self._size = size
+
+	def _readinto(self, b):
+		self.stream.seek(self._offset + self._position, os.SEEK_SET)
+
+		return self.stream.readinto(b)
+
+
+class FileSectionReader(SectionReader):
+	"""A read-only raw stream of a section of a file.
+
+	Positions are relative to the start of the section
+	and reads stop at the end of the section.
+
+	Parameters:
+		filepath (str or os.PathLike): A filepath or path-like object.
+		offset (int): The position of the section in the file.
+		size (int): The size of the section.
+	"""
+
+	def __init__(self, filepath, offset, size):
+		super().__init__(open(filepath, 'rb', buffering=0), offset, size)
+
+		self.name = filepath
+
+	def close(self):
+		if not self.closed:
+			self.stream.close()
+
+		super().close()
+
+
+class RangeReader(_RawReader):
+	"""A read-only raw stream of a source that reads ranges of a file.
+
+	Used to load metadata from sources like object stores or HTTP servers
+	without fetching whole files.
+	A range source is any object with a ``size`` attribute of the size of the file
+	and a ``read_range(offset, length)`` method returning ``length`` bytes
+	of the file starting at ``offset``, or fewer at the end of the file.
+
+	Ranges are read in aligned blocks and consecutive missing blocks
+	are read with a single request.
+	The most recently used blocks are kept so parsers seeking back
+	to the head or tail of a file don't read it again.
+	Reads larger than two blocks, like picture data, are read directly.
+
+	Parameters:
+		source: A range source.
+		block_size (int): The size of blocks read from the source.
+			Default: 64 KiB
+		max_blocks (int): The number of blocks to keep.
+			Default: ``16``
+	"""
+
+	def __init__(self, source, *, block_size=64 * 1024, max_blocks=16):
+		super().__init__()
+
+		self.source = source
+		self._block_size = block_size
+		self._max_blocks = max_blocks
+		self._blocks = OrderedDict()
+		self._size = source.size
+
+	def _readinto(self, b):
+		size = len(b)
+		if size > self._block_size * 2:
+			data = self.source.read_range(self._position, size)
+		else:
+			data = self._read_blocks(self._position, size)
+
+		num_read = len(data)
+		b[:num_read] = data
+
+		return num_read
+
+	def _read_blocks(self, offset, size):
+		first = offset // self._block_size
+		last = (offset + size - 1) // self._block_size
+
+		blocks = []
+		index = first
+		while index <= last:
+			block = self._blocks.get(index)
+
+			if block is not None:
+				self._blocks.move_to_end(index)
+				blocks.append(block)
+				index += 1
+			else:
+				end = index
+				while (
+					end < last
+					and end + 1 not in self._blocks
+				):
+					end += 1
+
+				blocks.extend(self._fetch_blocks(index, end))
+				index = end + 1
+
+		start = offset - first * self._block_size
+
+		return b''.join(blocks)[start : start + size]
+
+	def _fetch_blocks(self, first, last):
+		offset = first * self._block_size
+		data = self.source.read_range(offset, (last - first + 1) * self._block_size)
+
+		blocks = [
+			data[i : i + self._block_size]
+			for i in range(0, len(data), self._block_size)
+		]
+
+		for index, block in enumerate(blocks, first):
+			self._blocks[index] = block
+
+		while len(self._blocks) > self._max_blocks:
+			self._blocks.popitem(last=False)
+
+		return blocks
+
+
+@attrs(
+	repr=False,
+	kw_only=True,
+)
+class IOStats(AttrMapping):
+	"""Counts of the I/O done while loading a file.
+
+	Pass an instance to :func:`load` to have it filled in.
+	Reads from memory-mapped files aren't counted.
+
+	Attributes:
+		num_reads (int): The number of reads from the file,
+			or from the :class:`RangeReader` of a range source.
+		num_bytes (int): The number of bytes read.
+	"""
+
+	num_reads = attrib(default=0)
+	num_bytes = attrib(default=0)
+
+
+def _has_tail(head):
+	# Whether the tail of a file is needed, as far as can be told from its head.
+	# Only MP3 and Ogg parsers read from the end of a file.
+	if head.startswith(b'RIFF'):
+		return False
+
+	offset = 0
+
+	if (
+		head.startswith(b'ID3')
+		and len(head) >= 10
+	):
+		try:
+			offset = 10 + decode_synchsafe_int(head[6:10], 7)
+		except ValueError:
+			return True
+
+		# ID3v2.4 footer.
+		if (
+			head[3] == 4
+			and head[5] & 0x10
+		):
+			offset += 10
+
+	return head[offset : offset + 4] != b'fLaC'
+
+
+class PlannedReader(_RawReader):
+	"""A read-only raw stream that reads the head and tail of a file in bulk.
+
+	The first 16 KiB of a file are read at once and kept along with
+	the last 64 KiB of MP3 and Ogg files, read the first time they're reached.
+	Parsers seeking around the headers at either end of a file
+	are served from them instead of making many small reads.
+	Other reads, like whole ID3v2 tags, audio data, or late chunks,
+	go to the underlying stream, so the data of skipped tags and pictures isn't read.
+
+	Parameters:
+		raw (io.RawIOBase): A seekable raw stream of a file.
+		io_stats (IOStats): Counts of reads from ``raw`` are added to this.
+			Default: ``None``
+	"""
+
+	def __init__(self, raw, *, io_stats=None):
+		super().__init__()
+
+		self.raw = raw
+		self.io_stats = io_stats
+		self._size = raw.seek(0, os.SEEK_END)
+
+		# Small files are read whole.
+		if self._size <= _HEAD_SIZE + _TAIL_SIZE:
+			self._head = self._read_raw(0, self._size)
+		else:
+			self._head = self._read_raw(0, _HEAD_SIZE)
+
+		self._tail = None
+
+		if (
+			len(self._head) < self._size
+			and _has_tail(self._head.obj)
+		):
+			self._tail_start = max(len(self._head), self._size - _TAIL_SIZE)
+		else:
+			self._tail_start = self._size
+
+	@property
+	def name(self):
+		return self.raw.name
+
+	def close(self):
+		if not self.closed:
+			self.raw.close()
+
+			# Parsed objects keep their closed reader, so don't keep the data with it.
+			self._head = None
+			self._tail = None
+
+		super().close()
+
+	# Reads are short at the ends of the head and tail
+	# so buffered reads don't reach past them unless needed.
+	def _readinto(self, b):
+		size = len(b)
+		if self._position < len(self._head):
+			data = self._head[self._position : self._position + size]
+		elif self._position >= self._tail_start:
+			if self._tail is None:
+				self._tail = self._read_raw(self._tail_start, self._size - self._tail_start)
+
+			offset = self._position - self._tail_start
+			data = self._tail[offset : offset + size]
+		else:
+			return self._readinto_raw(self._position, b[: self._tail_start - self._position])
+
+		num_read = len(data)
+		b[:num_read] = data
+
+		return num_read
+
+	def _read_raw(self, offset, size):
+		# A view so reads are copied once, straight into the caller's buffer.
+		data = bytearray(size)
+		del data[self._readinto_raw(offset, data):]
+
+		return memoryview(data)
+
+	def _readinto_raw(self, offset, b):
+		self.raw.seek(offset, os.SEEK_SET)
+		num_read = self.raw.readinto(b)
+
+		if self.io_stats is not None:
+			self.io_stats.num_reads += 1
+			self.io_stats.num_bytes += num_read
+
+		return num_read
+
+
+class MmapDataReader(DataReader):
+	"""A :class:`DataReader` backed by a memory-mapped file.
+
+	Reads, peeks, and seeks are slices of the mapping,
+	so they don't make system calls or go through a read buffer.
+
+	Parameters:
+		f (str, os.PathLike, or file-like object):
+			A filepath, path-like object or file-like object of a regular file.
+
+	Raises:
+		ValueError: If ``f`` is not a regular file or is empty.
+	"""
+
+	def __init__(self, f):
+		if (
+			isinstance(f, BufferedReader)
+			and isinstance(f.raw, FileIO)
+		):
+			f = f.name
+
+		# Pipes, devices, etc. can't be mapped and may block on open.
+		if not stat.S_ISREG(os.stat(f).st_mode):
+			raise ValueError("Only regular files can be memory-mapped.")
+
+		super().__init__(f)
+
+		try:
+			self._map = mmap.mmap(self.raw.fileno(), 0, access=mmap.ACCESS_READ)
+		except ValueError:
+			super().close()
+			raise ValueError("Empty files can't be memory-mapped.") from None
+
+		self._position = 0
+
+	def close(self):
+		if not self.closed:
+			self._map.close()
+
+		super().close()
+
+	# Slicing a closed mapping raises ValueError,
+	# so reads and peeks don't need their own closed check.
+	def peek(self, size=DEFAULT_BUFFER_SIZE):
+		if size > DEFAULT_BUFFER_SIZE:
+			size = DEFAULT_BUFFER_SIZE
+
+		return self._map[self._position : self._position + size]
+
+	def read(self, size=-1):
+		self.accumulator = 0
+		self.bit_count = 0
+
+		if size is None or size < 0:
+			end = len(self._map)
+		else:
+			end = min(self._position + size, len(self._map))
+
+		b = self._map[self._position : end]
+		self._position = max(self._position, end)
+
+		return b
+
+	read1 = read
+
+	def readinto(self, b):
+		data = self.read(len(b))
+		b[:len(data)] = data
+
+		return len(data)
+
+	def seek(self, offset, whence=os.SEEK_SET):
+		self._check_closed()
+
+		self._position = _seek_position(self._position, len(self._map), offset, whence)
+
+		return self._position
+
+	def tell(self):
+		self._check_closed()
+
+		return self._position
+
+	def _check_closed(self):
+		if self.closed:
+			raise ValueError("I/O operation on closed file.")
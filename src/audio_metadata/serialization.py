@@ -0,0 +1,576 @@
+__all__ = [
+	'deserialize',
+	'serialize',
+]
+
+import enum
+import struct
+import sys
+from array import array
+from functools import lru_cache
+
+# A tagged binary encoding of an object graph.
+# Each value starts with a byte: bytes below ``_SMALL_INT_LIMIT`` are
+# small non-negative integers, the rest are type codes followed by the value.
+# Sizes and counts are unsigned LEB128.
+#
+# Objects of audio_metadata classes are stored as a class name and their state,
+# enum members as a class name and their value.
+# Attribute names, class names, and the attribute names of each class (its shape)
+# are stored once and referenced by index after that,
+# and objects, lists, and dicts seen before are stored as a reference by index.
+_MAGIC = b'AMD\x01'
+
+_SMALL_INT_LIMIT = 0xC0
+
+_NONE = 0xC0
+_FALSE = 0xC1
+_TRUE = 0xC2
+_INT64 = 0xC3
+_BIG_INT = 0xC4
+_FLOAT = 0xC5
+_STR = 0xC6
+_BYTES = 0xC7
+_LIST = 0xC8
+_TUPLE = 0xC9
+_DICT = 0xCA
+_ARRAY = 0xCB
+_ENUM = 0xCC
+_OBJECT = 0xCD
+_NAME = 0xCE
+_NAME_REF = 0xCF
+_REF = 0xD0
+_STR_LIST = 0xD1
+_SHAPE = 0xD2
+_SHAPED_OBJECT = 0xD3
+
+_float = struct.Struct('<d')
+_int64 = struct.Struct('<q')
+
+# ``object.__getstate__`` only exists in Python 3.11+.
+_object_getstate = getattr(object, '__getstate__', None)
+
+
+@lru_cache(maxsize=None)
+def _serializable_classes():
+	# Only the exported classes of parsed audio metadata are stored and created,
+	# looked up by name in this registry rather than imported,
+	# so serialized data can't be used to create other objects or run code like a pickle.
+	# Imported here as the models use this module.
+	from . import (
+		formats,
+		models,
+	)
+
+	classes = {}
+	for module in [formats, models]:
+		for name in module.__all__:
+			obj = getattr(module, name)
+			if isinstance(obj, type):
+				classes[name] = obj
+
+	return classes
+
+
+def _resolve_class(name):
+	try:
+		return _serializable_classes()[name]
+	except KeyError:
+		raise ValueError(f"Not an audio_metadata class: {name}.") from None
+
+
+def _get_state(obj):
+	getstate = getattr(type(obj), '__getstate__', None)
+	if (
+		getstate is not None
+		and getstate is not _object_getstate
+	):
+		return obj.__getstate__()
+
+	try:
+		return obj.__dict__
+	except AttributeError:
+		return {
+			name: getattr(obj, name)
+			for cls in type(obj).__mro__
+			for name in cls.__dict__.get('__slots__', ())
+			if hasattr(obj, name)
+		}
+
+
+def _update_dict(obj, state):
+	obj.__dict__.update(state)
+
+
+def _set_slots(obj, state):
+	for name, value in state.items():
+		object.__setattr__(obj, name, value)
+
+
+def _state_setter(cls):
+	if hasattr(cls, '__setstate__'):
+		return cls.__setstate__
+
+	if cls.__dictoffset__:
+		return _update_dict
+
+	return _set_slots
+
+
+class _Encoder:
+	def __init__(self):
+		self.out = bytearray(_MAGIC)
+		self.names = {}
+		self.memo = {}
+		self.shapes = {}
+		self.class_names = {}
+
+	def encode(self, value):
+		try:
+			encoder = _encoders[type(value)]
+		except KeyError:
+			encoder = _encoders[type(value)] = _find_encoder(type(value))
+
+		encoder(self, value)
+
+	def encode_size(self, size):
+		out = self.out
+		while size >= 0x80:
+			out.append((size & 0x7F) | 0x80)
+			size >>= 7
+
+		out.append(size)
+
+	def encode_name(self, name):
+		index = self.names.get(name)
+		if index is None:
+			self.names[name] = len(self.names)
+
+			b = name.encode('utf-8', 'surrogatepass')
+			self.out.append(_NAME)
+			self.encode_size(len(b))
+			self.out += b
+		else:
+			self.out.append(_NAME_REF)
+			self.encode_size(index)
+
+	def encode_ref(self, value):
+		# The memo keeps a reference to values so their ids aren't reused
+		# by temporary state objects during encoding.
+		entry = self.memo.get(id(value))
+		if entry is not None:
+			self.out.append(_REF)
+			self.encode_size(entry[0])
+
+			return True
+
+		self.memo[id(value)] = (len(self.memo), value)
+
+		return False
+
+	def encode_none(self, value):
+		self.out.append(_NONE)
+
+	def encode_bool(self, value):
+		self.out.append(_TRUE if value else _FALSE)
+
+	def encode_int(self, value):
+		if 0 <= value < _SMALL_INT_LIMIT:
+			self.out.append(value)
+		elif -0x8000000000000000 <= value <= 0x7FFFFFFFFFFFFFFF:
+			self.out.append(_INT64)
+			self.out += _int64.pack(value)
+		else:
+			size = value.bit_length() // 8 + 1
+			self.out.append(_BIG_INT)
+			self.encode_size(size)
+			self.out += value.to_bytes(size, 'little', signed=True)
+
+	def encode_float(self, value):
+		self.out.append(_FLOAT)
+		self.out += _float.pack(value)
+
+	def encode_str(self, value):
+		b = value.encode('utf-8', 'surrogatepass')
+		self.out.append(_STR)
+		self.encode_size(len(b))
+		self.out += b
+
+	def encode_bytes(self, value):
+		self.out.append(_BYTES)
+		self.encode_size(len(value))
+		self.out += value
+
+	def encode_list(self, value):
+		if self.encode_ref(value):
+			return
+
+		# Lists of strings, like multi-value tags, are joined into one string.
+		if (
+			value
+			and all(type(item) is str for item in value)
+		):
+			joined = '\x00'.join(value)
+			if joined.count('\x00') == len(value) - 1:
+				b = joined.encode('utf-8', 'surrogatepass')
+				self.out.append(_STR_LIST)
+				self.encode_size(len(b))
+				self.out += b
+
+				return
+
+		self.out.append(_LIST)
+		self.encode_size(len(value))
+		for item in value:
+			self.encode(item)
+
+	def encode_tuple(self, value):
+		self.out.append(_TUPLE)
+		self.encode_size(len(value))
+		for item in value:
+			self.encode(item)
+
+	def encode_dict(self, value):
+		if self.encode_ref(value):
+			return
+
+		self.out.append(_DICT)
+		self.encode_size(len(value))
+		for k, v in value.items():
+			if type(k) is str:
+				self.encode_name(k)
+			else:
+				self.encode(k)
+
+			self.encode(v)
+
+	def encode_array(self, value):
+		if sys.byteorder == 'big':
+			value = array(value.typecode, value)
+			value.byteswap()
+
+		b = value.tobytes()
+		self.out.append(_ARRAY)
+		self.out += value.typecode.encode('ascii')
+		self.encode_size(len(b))
+		self.out += b
+
+	def encode_enum(self, value):
+		self.out.append(_ENUM)
+		self.encode_class(type(value))
+		self.encode(value.value)
+
+	def encode_object(self, value):
+		if self.encode_ref(value):
+			return
+
+		cls = type(value)
+		state = _get_state(value)
+
+		if type(state) is not dict:
+			self.out.append(_OBJECT)
+			self.encode_class(cls)
+			self.encode(state)
+
+			return
+
+		# Objects of a class with the same attributes share a shape,
+		# so attribute names are only stored with the first one.
+		shape = (cls, tuple(state))
+		index = self.shapes.get(shape)
+		if index is None:
+			self.shapes[shape] = len(self.shapes)
+
+			self.out.append(_SHAPE)
+			self.encode_class(cls)
+			self.encode(shape[1])
+		else:
+			self.out.append(_SHAPED_OBJECT)
+			self.encode_size(index)
+
+		encode = self.encode
+		for v in state.values():
+			encode(v)
+
+	def encode_class(self, cls):
+		name = self.class_names.get(cls)
+		if name is None:
+			name = self.class_names[cls] = cls.__qualname__
+
+		self.encode_name(name)
+
+
+class _Decoder:
+	def __init__(self, data):
+		self.data = data
+		self.position = len(_MAGIC)
+		self.names = []
+		self.memo = []
+		self.shapes = []
+		self.classes = {}
+
+	def decode(self):
+		code = self.data[self.position]
+		self.position += 1
+
+		if code < _SMALL_INT_LIMIT:
+			return code
+
+		return _decoders[code](self)
+
+	def decode_invalid(self):
+		raise ValueError(f"Invalid type code: {self.data[self.position - 1]:#x}.")
+
+	def decode_size(self):
+		data = self.data
+		b = data[self.position]
+		self.position += 1
+
+		if b < 0x80:
+			return b
+
+		size = b & 0x7F
+		shift = 7
+		while True:
+			b = data[self.position]
+			self.position += 1
+			size |= (b & 0x7F) << shift
+
+			if b < 0x80:
+				return size
+
+			shift += 7
+
+	def read(self, size):
+		start = self.position
+		self.position += size
+
+		if self.position > len(self.data):
+			raise ValueError("Serialized data is truncated.")
+
+		return self.data[start:self.position]
+
+	def decode_none(self):
+		return None
+
+	def decode_false(self):
+		return False
+
+	def decode_true(self):
+		return True
+
+	def decode_int64(self):
+		return _int64.unpack(self.read(8))[0]
+
+	def decode_big_int(self):
+		return int.from_bytes(self.read(self.decode_size()), 'little', signed=True)
+
+	def decode_float(self):
+		return _float.unpack(self.read(8))[0]
+
+	def decode_str(self):
+		return self.read(self.decode_size()).decode('utf-8', 'surrogatepass')
+
+	def decode_bytes(self):
+		return self.read(self.decode_size())
+
+	def decode_list(self):
+		value = []
+		self.memo.append(value)
+
+		decode = self.decode
+		for _ in range(self.decode_size()):
+			value.append(decode())
+
+		return value
+
+	def decode_str_list(self):
+		value = self.decode_str().split('\x00')
+		self.memo.append(value)
+
+		return value
+
+	def decode_tuple(self):
+		decode = self.decode
+
+		return tuple(decode() for _ in range(self.decode_size()))
+
+	def decode_dict(self):
+		value = {}
+		self.memo.append(value)
+
+		decode = self.decode
+		for _ in range(self.decode_size()):
+			k = decode()
+			value[k] = decode()
+
+		return value
+
+	def decode_array(self):
+		value = array(self.read(1).decode('ascii'))
+		value.frombytes(self.read(self.decode_size()))
+
+		if sys.byteorder == 'big':
+			value.byteswap()
+
+		return value
+
+	def decode_enum(self):
+		cls = self.decode_class()
+		if not issubclass(cls, enum.Enum):
+			raise ValueError(f"Not an enum: {cls.__name__}.")
+
+		return cls(self.decode())
+
+	def decode_object(self):
+		cls = self.decode_class()
+		value = cls.__new__(cls)
+		self.memo.append(value)
+
+		_state_setter(cls)(value, self.decode())
+
+		return value
+
+	def decode_shape(self):
+		cls = self.decode_class()
+		names = self.decode()
+		self.shapes.append((cls, names, _state_setter(cls)))
+
+		return self.decode_shaped(len(self.shapes) - 1)
+
+	def decode_shaped_object(self):
+		return self.decode_shaped(self.decode_size())
+
+	def decode_shaped(self, index):
+		cls, names, set_state = self.shapes[index]
+		value = cls.__new__(cls)
+		self.memo.append(value)
+
+		decode = self.decode
+		set_state(value, {name: decode() for name in names})
+
+		return value
+
+	def decode_class(self):
+		name = self.decode()
+		cls = self.classes.get(name)
+		if cls is None:
+			cls = self.classes[name] = _resolve_class(name)
+
+		return cls
+
+	def decode_name(self):
+		name = self.read(self.decode_size()).decode('utf-8', 'surrogatepass')
+		self.names.append(name)
+
+		return name
+
+	def decode_name_ref(self):
+		return self.names[self.decode_size()]
+
+	def decode_ref(self):
+		return self.memo[self.decode_size()]
+
+
+# Dispatch tables of plain functions rather than bound methods
+# so encoders and decoders aren't kept alive by reference cycles.
+_encoders = {
+	type(None): _Encoder.encode_none,
+	bool: _Encoder.encode_bool,
+	int: _Encoder.encode_int,
+	float: _Encoder.encode_float,
+	str: _Encoder.encode_str,
+	bytes: _Encoder.encode_bytes,
+	bytearray: _Encoder.encode_bytes,
+	memoryview: _Encoder.encode_bytes,
+	list: _Encoder.encode_list,
+	tuple: _Encoder.encode_tuple,
+	dict: _Encoder.encode_dict,
+	array: _Encoder.encode_array,
+}
+
+
+def _find_encoder(cls):
+	if _serializable_classes().get(cls.__qualname__) is not cls:
+		raise TypeError(f"Can't serialize object of type {cls.__name__}.")
+
+	if issubclass(cls, enum.Enum):
+		return _Encoder.encode_enum
+
+	return _Encoder.encode_object
+
+
+_decoders = [_Decoder.decode_invalid] * 256
+_decoders[_NONE] = _Decoder.decode_none
+_decoders[_FALSE] = _Decoder.decode_false
+_decoders[_TRUE] = _Decoder.decode_true
+_decoders[_INT64] = _Decoder.decode_int64
+_decoders[_BIG_INT] = _Decoder.decode_big_int
+_decoders[_FLOAT] = _Decoder.decode_float
+_decoders[_STR] = _Decoder.decode_str
+_decoders[_BYTES] = _Decoder.decode_bytes
+_decoders[_LIST] = _Decoder.decode_list
+_decoders[_TUPLE] = _Decoder.decode_tuple
+_decoders[_DICT] = _Decoder.decode_dict
+_decoders[_ARRAY] = _Decoder.decode_array
+_decoders[_ENUM] = _Decoder.decode_enum
+_decoders[_OBJECT] = _Decoder.decode_object
+_decoders[_NAME] = _Decoder.decode_name
+_decoders[_NAME_REF] = _Decoder.decode_name_ref
+_decoders[_REF] = _Decoder.decode_ref
+_decoders[_STR_LIST] = _Decoder.decode_str_list
+_decoders[_SHAPE] = _Decoder.decode_shape
+_decoders[_SHAPED_OBJECT] = _Decoder.decode_shaped_object
+
+
+def serialize(obj):
+	"""Serialize an audio_metadata object to a compact binary form.
+
+	Parameters:
+		obj: An audio_metadata object or a builtin value containing them.
+
+	Returns:
+		bytes: The serialized object.
+
+	Raises:
+		TypeError: If ``obj`` contains a value that can't be serialized.
+	"""
+
+	encoder = _Encoder()
+	encoder.encode(obj)
+
+	return bytes(encoder.out)
+
+
+def deserialize(b):
+	"""Deserialize an object serialized with :func:`serialize`.
+
+	Parameters:
+		b (bytes-like object): The serialized object.
+
+	Returns:
+		The deserialized object.
+
+	Raises:
+		ValueError: If ``b`` is not valid serialized data.
+	"""
+
+	try:
+		b = bytes(b)
+	except TypeError:
+		raise ValueError("Not a valid bytes-like object.")
+
+	if not b.startswith(_MAGIC):
+		raise ValueError("Not serialized audio metadata.")
+
+	decoder = _Decoder(b)
+
+	try:
+		obj = decoder.decode()
+	except (AttributeError, ImportError, IndexError, KeyError, TypeError, UnicodeDecodeError, struct.error) as exc:
+		raise ValueError("Invalid serialized data.") from exc
+
+	if decoder.position != len(b):
+		raise ValueError("Unexpected data after serialized object.")
+
+	return obj
@@ -1,4 +1,5 @@
 import os
+import re
 import struct
 from codecs import (
 	BOM_UTF16_BE,
@@ -9,66 +10,23 @@ from functools import reduce
 from tbm_utils import datareader
 from tbm_utils import humanize_duration as tbm_humanize_duration
 
+# 0xFF followed by a byte that would make a false sync or be mistaken for an inserted zero byte.
+# The following byte is only looked at, so a following 0xFF is checked in turn.
+_false_sync = re.compile(rb'\xFF(?=[\x00\xE0-\xFF])')
+
 
 def apply_unsynchronization(data):
 	"""Apply ID3v2 unsynchronization scheme to data."""
 
-	sync_index = data.find(b'\xFF')
-	if sync_index == -1:
-		return data
-
-	data = bytearray(data)
-
-	d = bytearray()
-	while sync_index != -1:
-		d += data[:sync_index + 1]
-
-		b = data[sync_index + 1 : sync_index + 2]
-		if b >= b'\xE0':
-			d += b'\x00'
-			d += b
-		elif b == b'\x00':
-			d += b'\x00\x00'
-		else:
-			d += b
-
-		data = data[sync_index + 2:]
-
-		sync_index = data.find(b'\xFF')
-
-	d += data
-
-	return bytes(d)
+	return _false_sync.sub(b'\xFF\x00', bytes(data))
 
 
 def remove_unsynchronization(data):
 	"""Remove ID3v2 unsynchronization scheme from data."""
 
-	sync_index = data.find(b'\xFF')
-	if sync_index == -1:
-		return data
-
-	data = bytearray(data)
-
-	d = bytearray()
-	while sync_index != -1:
-		d += data[:sync_index]
-
-		if data[sync_index + 1 : sync_index + 3] == b'\x00\x00':
-			d += b'\xFF\x00'
-			data = data[sync_index + 3:]
-		elif data[sync_index + 1 : sync_index + 2] == b'\x00':
-			d += b'\xFF'
-			data = data[sync_index + 2:]
-		else:
-			d += b'\xFF'
-			data = data[sync_index + 1:]
-
-		sync_index = data.find(b'\xFF')
-
-	d += data
-
-	return bytes(d)
+	# Unsynchronization only inserts a zero byte after 0xFF,
+	# so every 0xFF 0x00 pair decodes to 0xFF in one pass.
+	return bytes(data).replace(b'\xFF\x00', b'\xFF')
 
 
 def decode_synchsafe_int(data, per_byte):
@@ -143,43 +101,88 @@ def determine_encoding(b):
 	return encoding
 
 
-def split_encoded(data, encoding, max_split=None):
-	"""Split ID3v2 frame data according to encoding."""
-
-	remainder = data
+def _split_encoded_spans(data, encoding, max_split=None):
+	if encoding in ['iso-8859-1', 'utf-8']:
+		terminator = b'\x00'
+	else:
+		terminator = b'\x00\x00'
 
-	values = []
+	start = 0
 	num_split = 0
 	while True:
-		try:
-			if encoding in ['iso-8859-1', 'utf-8']:
-				head, tail = remainder.split(b'\x00', 1)
-			else:
-				if len(remainder) % 2 != 0:
-					remainder += b'\x00'
-
-				head, tail = remainder.split(b'\x00\x00', 1)
-
-				if len(head) % 2 != 0:
-					head, tail = remainder.split(b'\x00\x00\x00', 1)
-					head += b'\x00'
-		except ValueError:
-			if remainder:
-				values.append(remainder)
+		# UTF-16 terminators are at even offsets from the start of a value.
+		end = data.find(terminator, start)
+		while (
+			end != -1
+			and (end - start) % len(terminator)
+		):
+			end = data.find(terminator, end + 1)
+
+		if end == -1:
 			break
-		else:
-			values.append(head)
-			remainder = tail
-
-			num_split += 1
-			if (
-				max_split
-				and num_split >= max_split
-			):
-				values.append(tail)
-				break
 
-	return values
+		yield start, end
+		start = end + len(terminator)
+
+		num_split += 1
+		if (
+			max_split
+			and num_split >= max_split
+		):
+			yield start, len(data)
+			return
+
+	if start < len(data):
+		yield start, len(data)
+
+
+def _pad_encoded(data, encoding):
+	# Odd-length UTF-16 data is padded so the last value can be decoded.
+	if (
+		encoding.startswith('utf-16')
+		and len(data) % 2 != 0
+	):
+		data += b'\x00'
+
+	return data
+
+
+def split_encoded(data, encoding, max_split=None):
+	"""Split ID3v2 frame data according to encoding."""
+
+	data = _pad_encoded(data, encoding)
+
+	return [
+		data[start:end]
+		for start, end in _split_encoded_spans(data, encoding, max_split)
+	]
+
+
+def decode_split_encoded(data, encoding, max_split=None):
+	"""Split ID3v2 frame data according to encoding and decode the values.
+
+	The same as decoding each value from :func:`split_encoded` with :func:`decode_bytestring`,
+	but the data is decoded at once and split on null characters.
+	Decoding UTF-16 two bytes at a time keeps terminators aligned.
+	"""
+
+	values = _pad_encoded(data, encoding).decode(encoding).split('\x00', max_split or -1)
+
+	# Data ending with a terminator doesn't have an empty last value unless it was split off.
+	if (
+		values[-1] == ''
+		and not (max_split and len(values) > max_split)
+	):
+		values.pop()
+
+	if encoding.startswith('utf-16'):
+		# Each value can start with a byte order mark, decoded as either byte order.
+		values = [
+			value[1:] if value[:1] in ('\ufeff', '\ufffe') else value
+			for value in values
+		]
+
+	return [value.rstrip('\x00') for value in values]
 
 
 @datareader
@@ -1,3 +1,5 @@
+import tempfile
+from io import IOBase
 from pathlib import Path
 
 from ward import (
@@ -8,12 +10,197 @@ from ward import (
 )
 
 import audio_metadata
-from audio_metadata import UnsupportedFormat
+from audio_metadata import (
+	FileRangeSource,
+	IOStats,
+	LoadResult,
+	MmapDataReader,
+	UnsupportedFormat,
+)
+from audio_metadata.utils import encode_synchsafe_int
 from tests.fixtures import id3v2_header
 
 AUDIO_FILEPATHS = list((Path(__file__).parent / 'audio').iterdir())
 
 
+@test(
+	"load range source {filepath.name}",
+	tags=['integration', 'api', 'load'],
+)
+def _(filepath=each(*AUDIO_FILEPATHS)):
+	source = FileRangeSource(filepath)
+	metadata = audio_metadata.load(source)
+	expected = audio_metadata.loads(filepath.read_bytes())
+	del metadata._obj
+	del expected._obj
+
+	assert metadata == expected
+	assert source.num_bytes <= source.size + 64 * 1024
+
+
+@test(
+	"load io_stats {filepath.name}",
+	tags=['integration', 'api', 'load'],
+)
+def _(filepath=each(*AUDIO_FILEPATHS)):
+	io_stats = IOStats()
+	metadata = audio_metadata.load(filepath, io_stats=io_stats)
+	expected = audio_metadata.load(filepath, io='mmap')
+	del metadata._obj
+	del expected._obj
+
+	assert metadata == expected
+	assert 0 < io_stats.num_reads <= 3
+	assert io_stats.num_bytes <= filepath.stat().st_size
+
+
+@test(
+	"load doesn't read skipped tags and pictures",
+	tags=['integration', 'api', 'load'],
+)
+def _():
+	picture_data = b'\x89PNG\r\n\x1A\n' + bytes(2 * 1024 * 1024)
+
+	title = b'\x03Title'
+	picture = b'\x00image/png\x00\x03\x00' + picture_data
+	frames = (
+		b'TIT2' + encode_synchsafe_int(len(title), 7) + b'\x00\x00' + title
+		+ b'APIC' + encode_synchsafe_int(len(picture), 7) + b'\x00\x00' + picture
+	)
+	mp3_data = (
+		b'ID3\x04\x00\x00' + encode_synchsafe_int(len(frames), 7) + frames
+		+ (Path(__file__).parent / 'audio' / 'mp3-lame-cbr.mp3').read_bytes()
+	)
+
+	# A picture block after STREAMINFO.
+	picture = (
+		b'\x00\x00\x00\x03' + b'\x00\x00\x00\x09image/png' + bytes(20)
+		+ len(picture_data).to_bytes(4, 'big') + picture_data
+	)
+	flac_data = (Path(__file__).parent / 'audio' / 'flac-vorbis.flac').read_bytes()
+	flac_data = (
+		flac_data[:42]
+		+ b'\x06' + len(picture).to_bytes(3, 'big') + picture
+		+ flac_data[42:]
+	)
+
+	with tempfile.TemporaryDirectory() as directory:
+		for name, data, options_list in [
+			(
+				'large-picture.mp3',
+				mp3_data,
+				[
+					{'tags': False},
+					{'pictures': False},
+					{'frames': {'TIT2'}},
+				],
+			),
+			(
+				'large-picture.flac',
+				flac_data,
+				[
+					{'pictures': False},
+					{'tags': False, 'pictures': False},
+				],
+			),
+		]:
+			filepath = Path(directory, name)
+			filepath.write_bytes(data)
+
+			for options in options_list:
+				io_stats = IOStats()
+				metadata = audio_metadata.load(filepath, io_stats=io_stats, **options)
+				assert metadata.pictures == []
+				assert io_stats.num_bytes < len(picture_data) // 8
+
+				source = FileRangeSource(filepath)
+				audio_metadata.load(source, **options)
+				assert source.num_bytes < len(picture_data) // 8
+
+
+@test(
+	"aload {filepath.name}",
+	tags=['integration', 'api', 'aload'],
+)
+async def _(filepath=each(*AUDIO_FILEPATHS)):
+	metadata = await audio_metadata.aload(filepath)
+	expected = audio_metadata.load(filepath)
+	del metadata._obj
+	del expected._obj
+
+	assert metadata == expected
+
+
+@test(
+	"aload raises load errors",
+	tags=['integration', 'api', 'aload'],
+)
+async def _():
+	with raises(UnsupportedFormat):
+		await audio_metadata.aload(__file__)
+
+
+@test(
+	"aload_many",
+	tags=['integration', 'api', 'aload_many'],
+)
+async def _(concurrency=each(1, 4)):
+	filepaths = [*AUDIO_FILEPATHS, Path(__file__)]
+	results = [
+		result
+		async for result in audio_metadata.aload_many(filepaths, concurrency=concurrency)
+	]
+
+	assert len(results) == len(filepaths)
+	assert {result.filepath for result in results} == set(filepaths)
+
+	for result in results:
+		if result.filepath == Path(__file__):
+			assert result.metadata is None
+			assert isinstance(result.error, UnsupportedFormat)
+		else:
+			assert result.error is None
+			assert result.metadata.filepath == str(result.filepath)
+
+
+@test(
+	"aload_many closes files that fail to load",
+	tags=['integration', 'api', 'aload_many'],
+)
+async def _():
+	with tempfile.TemporaryDirectory() as directory:
+		filepath = Path(directory, 'invalid.flac')
+		filepath.write_bytes(b'fLaC' + bytes(100))
+
+		results = [
+			result
+			async for result in audio_metadata.aload_many([Path(__file__), filepath])
+		]
+
+	for result in results:
+		assert result.error is not None
+
+		# Readers referenced by the error's traceback are closed.
+		tb = result.error.__traceback__
+		while tb is not None:
+			for value in tb.tb_frame.f_locals.values():
+				if isinstance(value, IOBase):
+					assert value.closed
+
+			tb = tb.tb_next
+
+
+@test(
+	"aload_many invalid arguments raise ValueError",
+	tags=['unit', 'api', 'aload_many'],
+)
+async def _():
+	with raises(ValueError) as exc:
+		async for _ in audio_metadata.aload_many(AUDIO_FILEPATHS, concurrency=0):
+			pass
+	assert str(exc.raised) == "concurrency must be at least 1."
+
+
 @test(
 	"ID3v2-only is None",
 	tags=['unit', 'api', 'determine_format'],
@@ -101,7 +288,7 @@ def _():
 def _():
 	with raises(ValueError) as exc:
 		audio_metadata.load(b'test')
-	assert str(exc.raised) == "Not a valid filepath or file-like object."
+	assert str(exc.raised) == "Not a valid filepath, file-like object, or range source."
 
 
 @test(
@@ -129,6 +316,114 @@ def _(fp=each(*AUDIO_FILEPATHS)):
 	audio_metadata.load(fp)
 
 
+@test(
+	"Memory-mapped I/O ({fp.name})",
+	tags=['integration', 'api', 'load'],
+)
+def _(fp=each(*AUDIO_FILEPATHS)):
+	mapped = audio_metadata.load(fp, io='mmap')
+	buffered = audio_metadata.load(fp)
+
+	assert isinstance(mapped._obj, MmapDataReader)
+	assert mapped._obj.closed
+
+	del mapped._obj
+	del buffered._obj
+	assert mapped == buffered
+
+
+@test(
+	"Invalid I/O backend raises ValueError",
+	tags=['unit', 'api', 'load'],
+)
+def _():
+	with raises(ValueError) as exc:
+		audio_metadata.load(AUDIO_FILEPATHS[0], io='invalid')
+	assert str(exc.raised) == "Unsupported I/O backend: invalid."
+
+
+@test(
+	"Skip tags ({fp.name})",
+	tags=['integration', 'api', 'load'],
+)
+def _(fp=each(*AUDIO_FILEPATHS)):
+	probe = audio_metadata.load(fp, tags=False, pictures=False)
+	full = audio_metadata.load(fp)
+
+	assert probe.streaminfo == full.streaminfo
+	assert dict(probe.tags) == {}
+	assert probe.pictures == []
+
+
+@test(
+	"Skip tags doesn't decode ID3v2 frames",
+	tags=['unit', 'api', 'load'],
+)
+def _():
+	# Flag the title frame as encrypted, which raises if it's decoded.
+	b = bytearray((Path(__file__).parent / 'audio' / 'mp3-id3v24.mp3').read_bytes())
+	index = b.find(b'TIT2')
+	b[index + 8 : index + 10] = b'\x00\x04'
+
+	assert audio_metadata.determine_format(bytes(b)) is audio_metadata.MP3
+	assert dict(audio_metadata.loads(bytes(b), tags=False).tags) == {}
+
+	with raises(UnsupportedFormat):
+		audio_metadata.loads(bytes(b))
+
+
+@test(
+	"Skip pictures ({fp.name})",
+	tags=['integration', 'api', 'load'],
+)
+def _(fp=each(*AUDIO_FILEPATHS)):
+	probe = audio_metadata.load(fp, pictures=False)
+	full = audio_metadata.load(fp)
+
+	assert probe.streaminfo == full.streaminfo
+	assert probe.tags == full.tags
+	assert probe.pictures == []
+
+
+@test(
+	"Filepaths (chunksize={chunksize})",
+	tags=['integration', 'api', 'load_many'],
+)
+def _(chunksize=each(1, 4)):
+	filepaths = [*AUDIO_FILEPATHS, Path(__file__)]
+	results = list(audio_metadata.load_many(filepaths, workers=2, chunksize=chunksize))
+
+	assert len(results) == len(filepaths)
+	assert all(isinstance(result, LoadResult) for result in results)
+	assert {result.filepath for result in results} == set(filepaths)
+
+	for result in results:
+		if result.filepath == Path(__file__):
+			assert result.metadata is None
+			assert isinstance(result.error, UnsupportedFormat)
+		else:
+			assert result.error is None
+			assert isinstance(result.metadata, audio_metadata.Format)
+
+			metadata = audio_metadata.load(result.filepath)
+			del metadata._obj
+			assert result.metadata == metadata
+
+
+@test(
+	"Invalid arguments raise ValueError",
+	tags=['unit', 'api', 'load_many'],
+)
+def _():
+	with raises(ValueError) as exc:
+		list(audio_metadata.load_many(AUDIO_FILEPATHS, workers=0))
+	assert str(exc.raised) == "workers must be at least 1."
+
+	with raises(ValueError) as exc:
+		list(audio_metadata.load_many(AUDIO_FILEPATHS, chunksize=0))
+	assert str(exc.raised) == "chunksize must be at least 1."
+
+
 @test(
 	"Non-audio raises UnsupportedFormat",
 	tags=['unit', 'api', 'loads'],
@@ -0,0 +1,170 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from ward import (
+	fixture,
+	raises,
+	test,
+	using,
+)
+
+import audio_metadata
+from audio_metadata import MetadataCache
+
+AUDIO_DIR = Path(__file__).parent / 'audio'
+
+
+@fixture
+def cache_dir():
+	with tempfile.TemporaryDirectory() as directory:
+		for filename in ['flac-vorbis.flac', 'mp3-id3v24.mp3', 'ogg-opus-vbr.opus']:
+			shutil.copy(AUDIO_DIR / filename, directory)
+
+		yield Path(directory)
+
+
+@test(
+	"Unchanged files are loaded from the cache",
+	tags=['integration', 'cache', 'MetadataCache'],
+)
+@using(cache_dir=cache_dir)
+def _(cache_dir):
+	filepath = cache_dir / 'mp3-id3v24.mp3'
+
+	with MetadataCache(cache_dir / 'cache.db') as cache:
+		first = cache.load(filepath)
+		second = cache.load(str(filepath))
+
+		assert (cache.hits, cache.misses) == (1, 1)
+		assert len(cache) == 1
+
+	with MetadataCache(cache_dir / 'cache.db') as cache:
+		third = cache.load(filepath)
+
+		assert (cache.hits, cache.misses) == (1, 0)
+
+	metadata = audio_metadata.load(filepath)
+	del metadata._obj
+
+	assert second == third == metadata
+	assert first.tags == metadata.tags
+	assert third.pictures[0].data == metadata.pictures[0].data
+
+
+@test(
+	"Changed files are reloaded",
+	tags=['integration', 'cache', 'MetadataCache'],
+)
+@using(cache_dir=cache_dir)
+def _(cache_dir):
+	filepath = cache_dir / 'flac-vorbis.flac'
+
+	with MetadataCache(cache_dir / 'cache.db') as cache:
+		cache.load(filepath)
+
+		stat = os.stat(filepath)
+		os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+		cache.load(filepath)
+
+		assert (cache.hits, cache.misses) == (0, 2)
+		assert len(cache) == 1
+
+
+@test(
+	"Options are cached separately",
+	tags=['integration', 'cache', 'MetadataCache'],
+)
+@using(cache_dir=cache_dir)
+def _(cache_dir):
+	filepath = cache_dir / 'mp3-id3v24.mp3'
+
+	with MetadataCache(cache_dir / 'cache.db') as cache:
+		full = cache.load(filepath)
+		streaminfo = cache.load(filepath, tags=False)
+		cache.load(filepath, tags=False)
+
+		assert (cache.hits, cache.misses) == (1, 2)
+		assert len(cache) == 2
+		assert 'title' in full.tags
+		assert 'title' not in streaminfo.tags
+
+
+@test(
+	"Least recently used entries are evicted",
+	tags=['integration', 'cache', 'MetadataCache'],
+)
+@using(cache_dir=cache_dir)
+def _(cache_dir):
+	flac = cache_dir / 'flac-vorbis.flac'
+	mp3 = cache_dir / 'mp3-id3v24.mp3'
+	opus = cache_dir / 'ogg-opus-vbr.opus'
+
+	with MetadataCache(cache_dir / 'cache.db', max_entries=2) as cache:
+		cache.load(flac)
+		cache.load(mp3)
+		cache.load(flac)
+		cache.load(opus)
+
+		assert len(cache) == 2
+
+		cache.load(flac)
+		cache.load(opus)
+		cache.load(mp3)
+
+		assert (cache.hits, cache.misses) == (3, 4)
+
+	with MetadataCache(cache_dir / 'cache.db') as cache:
+		size = cache.size
+
+		cache.clear()
+
+		assert len(cache) == 0
+		assert cache.size == 0
+
+	with MetadataCache(cache_dir / 'cache.db', max_size=size) as cache:
+		cache.load(flac)
+		cache.load(opus)
+		cache.load(mp3)
+
+		assert len(cache) < 3
+		assert cache.size <= size
+
+
+@test(
+	"Caches can share a database",
+	tags=['integration', 'cache', 'MetadataCache'],
+)
+@using(cache_dir=cache_dir)
+def _(cache_dir):
+	flac = cache_dir / 'flac-vorbis.flac'
+	mp3 = cache_dir / 'mp3-id3v24.mp3'
+
+	# Without a timeout, any lock left held by the other cache raises.
+	with MetadataCache(cache_dir / 'cache.db', timeout=0) as first:
+		with MetadataCache(cache_dir / 'cache.db', timeout=0) as second:
+			first.load(flac)
+			second.load(flac)
+			second.load(mp3)
+			first.load(mp3)
+			first.load(flac)
+			second.clear()
+			first.load(flac)
+
+			assert (first.hits, first.misses) == (2, 2)
+			assert (second.hits, second.misses) == (1, 1)
+			assert len(first) == len(second) == 1
+
+
+@test(
+	"Non-filepath raises ValueError",
+	tags=['unit', 'cache', 'MetadataCache'],
+)
+@using(cache_dir=cache_dir)
+def _(cache_dir):
+	with MetadataCache(cache_dir / 'cache.db') as cache:
+		with raises(ValueError) as exc:
+			with open(cache_dir / 'mp3-id3v24.mp3', 'rb') as f:
+				cache.load(f)
+		assert str(exc.raised) == "Not a valid filepath."
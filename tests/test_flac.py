@@ -302,6 +302,31 @@ def _(flac_seektable_data):
 
 	assert seektable_init == seektable_parse
 	assert seektable_init.data == seektable_parse.data == seekpoints
+	assert list(seektable_parse) == seekpoints
+	assert seektable_parse[1] == seekpoints[1]
+	assert seektable_parse[-1] == seekpoints[-1]
+	assert seektable_parse[1:3] == FLACSeekTable(seekpoints[1:3])
+	assert len(seektable_parse) == 5
+	assert repr(seektable_parse) == "<FLACSeekTable (5 seekpoints)>"
+
+
+@test(
+	"FLACSeekTable.lookup",
+	tags=['unit', 'flac', 'FLACSeekTable'],
+)
+@using(flac_seektable_data=flac_seektable_data)
+def _(flac_seektable_data):
+	placeholder = b'\xff' * 8 + bytes(10)
+	seektable = FLACSeekTable.parse(flac_seektable_data + placeholder)
+
+	assert len(seektable) == 6
+	assert seektable.lookup(0).first_sample == 0
+	assert seektable.lookup(40959).first_sample == 0
+	assert seektable.lookup(40960).offset == 140
+	assert seektable.lookup(100000).offset == 294
+	assert seektable.lookup(10 ** 9).offset == 602
+	assert FLACSeekTable.parse(flac_seektable_data[18:]).lookup(0) is None
+	assert FLACSeekTable().lookup(0) is None
 
 
 @test(
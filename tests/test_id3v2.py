@@ -1,3 +1,5 @@
+import pickle
+
 from ward import (
 	each,
 	raises,
@@ -8,11 +10,13 @@ from ward import (
 from audio_metadata import (
 	FormatError,
 	ID3Version,
+	ID3v2,
 	ID3v2Flags,
 	ID3v2FrameAliases,
 	ID3v2Frames,
 	ID3v2Header,
 )
+from audio_metadata.utils import apply_unsynchronization
 from tests.fixtures import (
 	id3v22,
 	id3v23,
@@ -100,6 +104,106 @@ def _(null, id3v22, id3v23, id3v24):
 	assert v24_frames_parse.FIELD_MAP == ID3v2FrameAliases[ID3Version.v24]
 
 
+@test(
+	"ID3v2Frames frame allow-list",
+	tags=['unit', 'id3', 'id3v2', 'ID3v2Frames'],
+)
+@using(id3v24=id3v24)
+def _(id3v24):
+	all_frames = ID3v2Frames.parse(id3v24[10:], ID3Version.v24)
+	frames = ID3v2Frames.parse(
+		id3v24[10:],
+		ID3Version.v24,
+		frames={'TIT2', 'artist'},
+	)
+
+	assert sorted(frames) == ['artist', 'title']
+	assert frames.title == all_frames.title
+	assert frames.artist == all_frames.artist
+
+	id3v2 = ID3v2.parse(id3v24, frames={'TALB'})
+	assert list(id3v2.tags) == ['album']
+	assert id3v2.pictures == []
+
+	id3v2 = ID3v2.parse(id3v24, frames={'pictures'})
+	assert list(id3v2.tags) == []
+	assert id3v2.pictures == all_frames.pictures
+
+
+@test(
+	"ID3v2Frames lazy decoding",
+	tags=['unit', 'id3', 'id3v2', 'ID3v2Frames'],
+)
+@using(id3v24=id3v24)
+def _(id3v24):
+	all_frames = ID3v2Frames.parse(id3v24[10:], ID3Version.v24)
+	frames = ID3v2Frames.parse(id3v24[10:], ID3Version.v24, lazy=True)
+
+	assert 'TIT2' in frames._pending
+	assert 'TIT2' not in frames.__dict__
+
+	assert frames.title == all_frames.title
+	assert 'TIT2' not in frames._pending
+	assert 'TIT2' in frames.__dict__
+	assert 'TPE1' in frames._pending
+
+	assert frames['TPE1'] == all_frames['TPE1']
+	assert frames.get('notaframe') is None
+
+	frames.album = ['test']
+	assert frames.album == ['test']
+	assert 'TALB' not in frames._pending
+
+	del frames['genre']
+	assert 'TCON' not in frames._pending
+	assert 'genre' not in frames
+
+	all_frames.album = ['test']
+	del all_frames['genre']
+	assert frames == all_frames
+	assert '_pending' not in frames.__dict__
+
+	id3v2 = ID3v2.parse(id3v24, lazy=True)
+	assert pickle.loads(pickle.dumps(id3v2.tags)) == ID3v2.parse(id3v24).tags
+
+	# Only the data of pending frames is kept, and pictures aren't pending.
+	frames = ID3v2Frames.parse(id3v24[10:], ID3Version.v24, lazy=True)
+	all_frames = ID3v2Frames.parse(id3v24[10:], ID3Version.v24)
+	assert 'APIC' not in frames._pending
+	assert frames.__dict__['APIC'] == all_frames.__dict__['APIC']
+	assert sum(
+		len(frame_data)
+		for entries in frames._pending.values()
+		for _, frame_data, _, _ in entries
+	) < len(id3v24) // 2
+
+	# Pending frames are counted and iterated like decoded ones.
+	assert len(frames) == len(all_frames)
+	assert sorted(frames) == sorted(all_frames)
+
+
+@test(
+	"ID3v2Frames tag unsynchronization",
+	tags=['unit', 'id3', 'id3v2', 'ID3v2Frames'],
+)
+def _():
+	# The size of the first frame ends in 0xFF, so unsynchronization
+	# inserts a zero byte in its header.
+	frames_data = (
+		b'TIT2\x00\x00\x00\xFF\x00\x00\x00' + b'a' * 254
+		+ b'TPE1\x00\x00\x00\x07\x00\x00\x00artist'
+	)
+	tag_data = apply_unsynchronization(frames_data)
+
+	assert len(tag_data) == len(frames_data) + 1
+
+	frames = ID3v2Frames.parse(tag_data, ID3Version.v23, True)
+
+	assert frames.title == ['a' * 254]
+	assert frames.artist == ['artist']
+	assert ID3v2Frames.parse(tag_data, ID3Version.v23, True, lazy=True) == frames
+
+
 @test(
 	"ID3v2Flags",
 	tags=['unit', 'id3', 'id3v2', 'ID3v2Flags'],
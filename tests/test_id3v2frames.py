@@ -221,6 +221,28 @@ def _():
 		encoding=None,
 	)
 
+	# Zero bytes inserted after 0xFF at the end of a read are removed.
+	assert ID3v2Frame.parse(
+		b'TEST\x00\x00\x00\x05\x00\x02A\xFF\x00B\xFF\x00C',
+		ID3Version.v24,
+		False,
+	) == ID3v2Frame(
+		name='TEST',
+		value=b'A\xFFB\xFFC',
+		encoding=None,
+	)
+
+	# Truncated frame data.
+	assert ID3v2Frame.parse(
+		b'TEST\x00\x00\x00\x05\x00\x02\xFF\x00\xFF\x00',
+		ID3Version.v24,
+		False,
+	) == ID3v2Frame(
+		name='TEST',
+		value=b'\xFF\xFF',
+		encoding=None,
+	)
+
 
 @test(
 	'ID3v2Frame',
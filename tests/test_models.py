@@ -1,12 +1,23 @@
+import pickle
 from pathlib import Path
 
+from attr import (
+	attrib,
+	attrs,
+)
 from bidict import frozenbidict
 from tbm_utils import DataReader
-from ward import test
+from ward import (
+	each,
+	raises,
+	test,
+)
 
+import audio_metadata
 from audio_metadata.models import (
 	Format,
 	Picture,
+	SlottedAttrMapping,
 	StreamInfo,
 	Tags
 )
@@ -15,6 +26,8 @@ from tests.utils import strip_repr
 
 test_image = (Path(__file__).parent / 'image' / 'test.png').resolve()
 
+AUDIO_FILEPATHS = sorted((Path(__file__).parent / 'audio').iterdir())
+
 
 @test(
 	"Format",
@@ -41,6 +54,46 @@ def _():
 	assert repr(format_fileobj) == repr(format_fileobj_datareader)
 
 
+@test(
+	"Format serialization {filepath.name}",
+	tags=['integration', 'models', 'Format'],
+)
+def _(filepath=each(*AUDIO_FILEPATHS)):
+	metadata = audio_metadata.load(filepath)
+	lazy_metadata = audio_metadata.load(filepath, lazy=True)
+	bytes_metadata = audio_metadata.loads(filepath.read_bytes())
+	del metadata._obj
+	del bytes_metadata._obj
+
+	assert type(metadata).from_bytes(metadata.to_bytes()) == metadata
+	assert Format.from_bytes(lazy_metadata.to_bytes()) == metadata
+	assert Format.from_bytes(bytes_metadata.to_bytes()) == bytes_metadata
+	assert pickle.loads(pickle.dumps(lazy_metadata)) == metadata
+
+	for picture in Format.from_bytes(metadata.to_bytes()).pictures:
+		assert picture.data == bytes_metadata.pictures[0].data
+
+
+@test(
+	"Format.from_bytes",
+	tags=['unit', 'models', 'Format'],
+)
+def _():
+	metadata = audio_metadata.load(AUDIO_FILEPATHS[0])
+	b = metadata.to_bytes()
+
+	with raises(ValueError) as exc:
+		audio_metadata.MP3.from_bytes(b)
+	assert str(exc.raised) == "Serialized object is not MP3."
+
+	with raises(ValueError):
+		Format.from_bytes(b[:-1])
+
+	with raises(ValueError) as exc:
+		Format.from_bytes(pickle.dumps(metadata))
+	assert str(exc.raised) == "Not serialized audio metadata."
+
+
 @test(
 	"Picture",
 	tags=['unit', 'models', 'Picture'],
@@ -56,6 +109,95 @@ def _():
 	assert repr(picture) == "<Picture({'data': '96.00 B', 'height': 16, 'width': 16})>"
 
 
+@test(
+	"Picture deferred data",
+	tags=['unit', 'models', 'Picture'],
+)
+def _():
+	picture = Picture(
+		height=16,
+		width=16,
+	)
+	picture._read_data(DataReader(test_image), 96)
+
+	assert 'data' not in picture.__dict__
+	assert repr(picture) == "<Picture({'data': '96.00 B', 'height': 16, 'width': 16})>"
+	assert 'data' not in picture.__dict__
+	assert 'data' in picture
+	assert len(picture) == 3
+	assert sorted(picture) == ['data', 'height', 'width']
+
+	# Compared on the data, not where it is.
+	loaded_picture = Picture(
+		data=test_image.read_bytes(),
+		height=16,
+		width=16,
+	)
+	assert picture == loaded_picture
+	assert 'data' not in picture.__dict__
+
+	assert picture.read() == test_image.read_bytes()
+	with picture.open() as f:
+		assert f.read() == test_image.read_bytes()
+	assert 'data' not in picture.__dict__
+
+	assert picture['data'] == test_image.read_bytes()
+	assert picture.__dict__['data'] == test_image.read_bytes()
+	assert len(picture) == 3
+	assert dict(picture) == dict(loaded_picture)
+
+	bytes_picture = Picture()
+	bytes_picture._read_data(DataReader(test_image.read_bytes()), 96)
+
+	assert bytes_picture.__dict__ == {'data': test_image.read_bytes()}
+	with bytes_picture.open() as f:
+		assert f.read() == test_image.read_bytes()
+
+
+@attrs(
+	repr=False,
+	kw_only=True,
+	slots=True,
+)
+class SlottedRecord(SlottedAttrMapping):
+	_start = attrib()
+	name = attrib()
+	value = attrib(default=None)
+
+
+@test(
+	"SlottedAttrMapping",
+	tags=['unit', 'models', 'SlottedAttrMapping'],
+)
+def _():
+	record = SlottedRecord(start=0, name='name')
+
+	assert not hasattr(record, '__dict__')
+	assert record['name'] == record.name == 'name'
+	assert list(record) == ['_start', 'name', 'value']
+	assert len(record) == 3
+	assert dict(record.items()) == {'_start': 0, 'name': 'name', 'value': None}
+	assert SlottedRecord.from_mapping({'start': 0, 'name': 'name'}) == record
+
+	record['value'] = 'value'
+	assert record.value == 'value'
+
+	del record['value']
+	assert 'value' not in record
+	assert list(record) == ['_start', 'name']
+
+	with raises(KeyError):
+		record['value']
+
+	with raises(KeyError):
+		record['key'] = 'value'
+
+	with raises(AttributeError):
+		record.key = 'value'
+
+	assert repr(record) == "<SlottedRecord({'_start': 0, 'name': 'name'})>"
+
+
 @test(
 	"StreamInfo",
 	tags=['unit', 'models', 'StreamInfo'],
@@ -1,5 +1,8 @@
+import gc
 import struct
+import weakref
 
+from tbm_utils import DataReader
 from ward import (
 	each,
 	raises,
@@ -8,6 +11,7 @@ from ward import (
 )
 
 from audio_metadata import (
+	MP3,
 	FormatError,
 	LAMEBitrateMode,
 	LAMEChannelMode,
@@ -26,6 +30,7 @@ from audio_metadata import (
 	XingHeader,
 	XingToC,
 )
+from audio_metadata.formats.mp3 import _mpeg_frames_cache
 from tests.fixtures import (
 	flac_vorbis,
 	lame_header,
@@ -359,6 +364,10 @@ def _(mpeg_frame, xing_toc):
 		MPEGFrameHeader.parse(mpeg_frame[0:1] + b'\xEE' + mpeg_frame[2:])
 	assert str(exc.raised) == "Invalid MPEG audio frame."
 
+	with raises(FormatError) as exc:
+		MPEGFrameHeader.parse(mpeg_frame[0:3])
+	assert str(exc.raised) == "Not enough data."
+
 	mpeg_frame_parse = MPEGFrameHeader.parse(mpeg_frame)
 	mpeg_frame_init = MPEGFrameHeader(
 		start=0,
@@ -454,6 +463,16 @@ def _(
 	assert MP3StreamInfo.count_mpeg_frames(flac_vorbis) == 0
 
 
+@test(
+	"MP3StreamInfo.count_mpeg_frames across read chunks",
+	tags=['unit', 'mp3', 'MP3StreamInfo', 'count_mpeg_frames'],
+)
+@using(mp3_cbr_2_frames=mp3_cbr_2_frames)
+def _(mp3_cbr_2_frames):
+	# Large enough to need several reads.
+	assert MP3StreamInfo.count_mpeg_frames(mp3_cbr_2_frames * 1000) == 2000
+
+
 @test(
 	"MP3StreamInfo.find_mpeg_frames",
 	tags=['unit', 'mp3', 'MP3StreamInfo', 'find_mpeg_frames'],
@@ -485,3 +504,42 @@ def _(
 	with raises(FormatError) as exc:
 		MP3StreamInfo.find_mpeg_frames(flac_vorbis)
 	assert str(exc.raised) == "No XING header and insufficient MPEG frames."
+
+
+@test(
+	"MP3StreamInfo.find_mpeg_frames reuses scan for the same reader",
+	tags=['unit', 'mp3', 'MP3StreamInfo', 'find_mpeg_frames'],
+)
+@using(mp3_lame_vbr=mp3_lame_vbr)
+def _(mp3_lame_vbr):
+	data = DataReader(mp3_lame_vbr)
+
+	frames = MP3StreamInfo.find_mpeg_frames(data)
+	data.seek(0)
+	assert MP3StreamInfo.find_mpeg_frames(data) is frames
+
+	# A scan from a different position isn't reused.
+	data.seek(1)
+	assert MP3StreamInfo.find_mpeg_frames(data) is not frames
+
+	assert MP3StreamInfo.find_mpeg_frames(DataReader(mp3_lame_vbr)) is not frames
+
+
+@test(
+	"MP3StreamInfo.find_mpeg_frames doesn't keep readers alive",
+	tags=['unit', 'mp3', 'MP3StreamInfo', 'find_mpeg_frames'],
+)
+@using(mp3_lame_vbr=mp3_lame_vbr)
+def _(mp3_lame_vbr):
+	data = DataReader(mp3_lame_vbr)
+	MP3StreamInfo.find_mpeg_frames(data)
+	assert data in _mpeg_frames_cache
+
+	data_ref = weakref.ref(data)
+	del data
+	gc.collect()
+	assert data_ref() is None
+
+	data = DataReader(mp3_lame_vbr)
+	MP3.parse(data)
+	assert data not in _mpeg_frames_cache
@@ -0,0 +1,264 @@
+import random
+import struct
+from pathlib import Path
+
+from ward import (
+	each,
+	raises,
+	test,
+)
+
+from audio_metadata import (
+	FormatError,
+	Ogg,
+	OggOpus,
+	OggVorbis,
+)
+from audio_metadata.formats.ogg import (
+	_ogg_page_crc,
+	_reversed_bits,
+)
+
+AUDIO_DIR = Path(__file__).parent / 'audio'
+
+
+def ogg_pages(data):
+	pages = []
+
+	offset = 0
+	while offset < len(data):
+		num_segments = data[offset + 26]
+		size = 27 + num_segments + sum(data[offset + 27 : offset + 27 + num_segments])
+		pages.append(data[offset : offset + size])
+		offset += size
+
+	return pages
+
+
+def with_serial_number(data, serial_number):
+	return b''.join(
+		page[:14] + struct.pack('<I', serial_number) + page[18:]
+		for page in ogg_pages(data)
+	)
+
+
+@test(
+	"Ogg.find_last_page",
+	tags=['unit', 'ogg', 'Ogg'],
+)
+def _():
+	opus_cbr = (AUDIO_DIR / 'ogg-opus-cbr.opus').read_bytes()
+	opus_vbr = (AUDIO_DIR / 'ogg-opus-vbr.opus').read_bytes()
+	serial_number, = struct.unpack_from('<I', opus_vbr, 14)
+	position, = struct.unpack_from('<q', ogg_pages(opus_vbr)[-1], 6)
+
+	# Last page of the stream near the end of the file.
+	ogg = Ogg._load(opus_vbr + opus_cbr)
+	assert ogg.find_last_page(serial_number).position == position
+	assert ogg._obj.tell() == len(opus_vbr)
+
+	# Last page of the stream found by bisection.
+	ogg = Ogg._load(opus_vbr + opus_cbr * 16)
+	assert ogg.find_last_page(serial_number).position == position
+	assert ogg._obj.tell() == len(opus_vbr)
+
+	assert ogg.find_last_page(0) is None
+
+
+@test(
+	"Ogg.index_streams",
+	tags=['unit', 'ogg', 'Ogg'],
+)
+def _():
+	opus_cbr = (AUDIO_DIR / 'ogg-opus-cbr.opus').read_bytes()
+	opus_vbr = (AUDIO_DIR / 'ogg-opus-vbr.opus').read_bytes()
+	links = [opus_vbr] + [
+		with_serial_number(opus_cbr, serial_number)
+		for serial_number in range(1, 17)
+	]
+
+	streams = Ogg._load(b''.join(links)).index_streams()
+	assert list(streams) == [335048352, *range(1, 17)]
+
+	start = 0
+	for stream, link in zip(streams.values(), links):
+		assert stream._start == start
+		assert stream._end == start + len(link)
+		assert stream.first_packet == ogg_pages(link)[0][28:]
+		assert stream.position == struct.unpack_from('<q', ogg_pages(link)[-1], 6)[0]
+
+		start += len(link)
+
+
+@test(
+	"{format_cls.__name__} chained streams",
+	tags=['unit', 'ogg', 'Ogg'],
+)
+def _(
+	format_cls=each(OggOpus, OggVorbis),
+	filenames=each(
+		['ogg-opus-vbr.opus', 'ogg-opus-cbr.opus'],
+		['ogg-vorbis-vbr.ogg', 'ogg-vorbis-abr.ogg'],
+	),
+):
+	first, second = [
+		(AUDIO_DIR / filename).read_bytes()
+		for filename in filenames
+	]
+
+	links = [first] + [
+		with_serial_number(second, serial_number)
+		for serial_number in range(1, 17)
+	]
+	ogg = format_cls.parse(b''.join(links))
+	single = format_cls.parse(first)
+
+	assert ogg.streaminfo.duration == 17 * 5.0
+	assert ogg.streaminfo._start == single.streaminfo._start
+	assert ogg.streaminfo._size == sum(map(len, links)) - single.streaminfo._start
+	assert ogg.tags == single.tags
+
+
+@test(
+	"{format_cls.__name__} truncated before the first audio page",
+	tags=['unit', 'ogg', 'Ogg'],
+)
+def _(
+	format_cls=each(OggOpus, OggVorbis),
+	filename=each('ogg-opus-vbr.opus', 'ogg-vorbis-vbr.ogg'),
+):
+	pages = ogg_pages((AUDIO_DIR / filename).read_bytes())
+
+	# The header pages and part of the first page with a granule position.
+	index = next(
+		index
+		for index, page in enumerate(pages)
+		if struct.unpack('<q', page[6:14])[0] > 0
+	)
+	data = b''.join(pages[:index]) + pages[index][: len(pages[index]) // 2]
+
+	ogg = format_cls.parse(data)
+	assert ogg.streaminfo.duration == 0
+	assert ogg.streaminfo.bitrate == 0
+
+	# Pages without a granule position.
+	data = pages[0] + b''.join(
+		page[:6] + struct.pack('<q', -1) + page[14:]
+		for page in pages[1:index]
+	)
+
+	ogg = format_cls.parse(data)
+	assert ogg.streaminfo.duration == 0
+	assert ogg.streaminfo.bitrate == 0
+
+
+@test(
+	"OggOpus multiplexed streams",
+	tags=['unit', 'ogg', 'Ogg'],
+)
+def _():
+	opus_pages = ogg_pages((AUDIO_DIR / 'ogg-opus-vbr.opus').read_bytes())
+	vorbis_pages = ogg_pages((AUDIO_DIR / 'ogg-vorbis-vbr.ogg').read_bytes())
+
+	# Beginning-of-stream pages first, then the rest interleaved.
+	pages = [opus_pages[0], vorbis_pages[0]]
+	for i in range(1, max(len(opus_pages), len(vorbis_pages))):
+		pages.extend(opus_pages[i : i + 1] + vorbis_pages[i : i + 1])
+
+	opus_stream, vorbis_stream = Ogg._load(b''.join(pages)).index_streams().values()
+	assert opus_stream.first_packet.startswith(b'OpusHead')
+	assert opus_stream.position == struct.unpack_from('<q', opus_pages[-1], 6)[0]
+	assert vorbis_stream.first_packet.startswith(b'\x01vorbis')
+	assert vorbis_stream.position == struct.unpack_from('<q', vorbis_pages[-1], 6)[0]
+
+	opus = OggOpus.parse(b''.join(pages))
+	assert opus.streaminfo.duration == 5.0
+
+
+@test(
+	"Ogg.parse_page_headers/Ogg.read_page_segments",
+	tags=['unit', 'ogg', 'Ogg'],
+)
+def _():
+	data = (AUDIO_DIR / 'ogg-vorbis-multi-page-comments.ogg').read_bytes()
+
+	pages = list(Ogg._load(data).parse_pages())
+
+	ogg = Ogg._load(data)
+	headers = list(ogg.parse_page_headers())
+
+	assert ogg._obj.tell() == len(data)
+	assert len(headers) == len(pages)
+
+	for header, page in zip(headers, pages):
+		assert header == page._header
+		assert header.is_complete is page.is_complete
+		assert header._size == 27 + header.num_segments + sum(map(len, page.segments))
+		assert ogg.read_page_segments(header) == list(page.segments)
+		assert ogg.read_page_segments(header, 1) == list(page.segments[:1])
+
+	assert sum(header._size for header in headers) == len(data)
+
+	# Pages are parsed from the end of the previous page even if the position changes.
+	ogg._obj.seek(0)
+	page_headers = ogg.parse_page_headers()
+	first = next(page_headers)
+	ogg.read_page_segments(first, 1)
+	assert next(page_headers) == headers[1]
+
+
+@test(
+	"Ogg CRC",
+	tags=['unit', 'ogg', 'Ogg'],
+)
+def _():
+	def reference_crc(data):
+		crc = 0
+		for b in data:
+			crc ^= b << 24
+			for _ in range(8):
+				crc = ((crc << 1) ^ (0x04C11DB7 if crc & 0x80000000 else 0)) & 0xFFFFFFFF
+
+		return crc
+
+	rng = random.Random(0)
+	for size in [26, 27, 28, 31, 255, 1000]:
+		page = bytes(rng.getrandbits(8) for _ in range(size))
+
+		# The CRC field is set to 0 to compute the CRC.
+		assert (
+			_ogg_page_crc(memoryview(page.translate(_reversed_bits)))
+			== reference_crc(page[:22] + b'\x00\x00\x00\x00' + page[26:])
+		)
+
+
+@test(
+	"{format_cls.__name__}.parse verify_crc ({filename})",
+	tags=['unit', 'ogg', 'Ogg'],
+)
+def _(
+	format_cls=each(OggOpus, OggOpus, OggVorbis, OggVorbis),
+	filename=each(
+		'ogg-opus-cbr.opus',
+		'ogg-opus-multi-page-comments.opus',
+		'ogg-vorbis-vbr.ogg',
+		'ogg-vorbis-multi-page-comments.ogg',
+	),
+):
+	data = bytearray((AUDIO_DIR / filename).read_bytes())
+
+	ogg = format_cls.parse(data, verify_crc=True)
+	assert ogg.streaminfo == format_cls.parse(data).streaminfo
+	assert ogg.tags == format_cls.parse(data).tags
+
+	# Corrupt audio data of the last page.
+	data[-1] ^= 0xFF
+	format_cls.parse(data)
+
+	with raises(FormatError) as exc:
+		format_cls.parse(data, verify_crc=True)
+	assert str(exc.raised).startswith("Invalid CRC for Ogg page at offset ")
+
+	with raises(FormatError) as exc:
+		format_cls.parse(data[:-1], verify_crc=True)
+	assert str(exc.raised).startswith("Truncated Ogg page at offset ")
@@ -0,0 +1,296 @@
+import os
+from io import (
+	BytesIO,
+	FileIO,
+)
+from pathlib import Path
+
+from tbm_utils import DataReader
+from ward import (
+	raises,
+	test,
+)
+
+from audio_metadata import (
+	FileRangeSource,
+	FileSectionReader,
+	IOStats,
+	MmapDataReader,
+	PlannedReader,
+	RangeReader,
+	SectionReader,
+)
+
+AUDIO_FILEPATH = Path(__file__).parent / 'audio' / 'mp3-id3v24.mp3'
+
+
+@test(
+	"FileSectionReader",
+	tags=['unit', 'readers', 'FileSectionReader'],
+)
+def _():
+	file_data = AUDIO_FILEPATH.read_bytes()
+
+	with FileSectionReader(AUDIO_FILEPATH, 10, 100) as section:
+		assert section.read(20) == file_data[10:30]
+		assert section.tell() == 20
+		assert section.read() == file_data[30:110]
+		assert section.read() == b''
+		assert section.seek(-10, os.SEEK_END) == 90
+		assert section.read(20) == file_data[100:110]
+		assert section.seek(5, os.SEEK_SET) == 5
+		assert section.seek(5, os.SEEK_CUR) == 10
+		assert section.read(1) == file_data[20:21]
+
+		with raises(ValueError):
+			section.seek(-1, os.SEEK_SET)
+
+	assert section.closed
+
+
+@test(
+	"SectionReader",
+	tags=['unit', 'readers', 'SectionReader'],
+)
+def _():
+	stream = BytesIO(bytes(range(256)))
+
+	with SectionReader(stream, 10, 100) as section:
+		assert section.read(20) == bytes(range(10, 30))
+		stream.seek(0, os.SEEK_SET)
+		assert section.read(20) == bytes(range(30, 50))
+		assert section.readall() == bytes(range(50, 110))
+		assert section.read() == b''
+
+	assert not stream.closed
+
+
+@test(
+	"MmapDataReader matches DataReader",
+	tags=['unit', 'readers', 'MmapDataReader'],
+)
+def _():
+	mapped = MmapDataReader(AUDIO_FILEPATH)
+	buffered = DataReader(AUDIO_FILEPATH)
+
+	for reader in (mapped, buffered):
+		reader.seek(10, os.SEEK_SET)
+
+	assert mapped.peek(4) == buffered.peek(4)
+	assert mapped.read(100) == buffered.read(100)
+	assert mapped.tell() == buffered.tell() == 110
+	assert mapped.seek(-100, os.SEEK_END) == buffered.seek(-100, os.SEEK_END)
+	assert mapped.peek() == buffered.peek()
+	assert mapped.read() == buffered.read()
+	assert mapped.read(10) == buffered.read(10) == b''
+	assert mapped.seek(0, os.SEEK_SET) == buffered.seek(0, os.SEEK_SET) == 0
+	assert mapped.find(b'Xing') == buffered.find(b'Xing')
+	assert mapped.name == buffered.name
+
+	with raises(ValueError):
+		mapped.seek(-1, os.SEEK_SET)
+
+	mapped.close()
+	assert mapped.closed
+
+	with raises(ValueError):
+		mapped.read()
+
+
+@test(
+	"MmapDataReader file-like object",
+	tags=['unit', 'readers', 'MmapDataReader'],
+)
+def _():
+	with open(AUDIO_FILEPATH, 'rb') as f:
+		assert MmapDataReader(f).read() == AUDIO_FILEPATH.read_bytes()
+
+
+@test(
+	"MmapDataReader non-regular file raises ValueError",
+	tags=['unit', 'readers', 'MmapDataReader'],
+)
+def _():
+	with raises(ValueError) as exc:
+		MmapDataReader(Path(__file__).parent)
+	assert str(exc.raised) == "Only regular files can be memory-mapped."
+
+
+@test(
+	"FileRangeSource",
+	tags=['unit', 'readers', 'FileRangeSource'],
+)
+def _():
+	file_data = AUDIO_FILEPATH.read_bytes()
+	source = FileRangeSource(AUDIO_FILEPATH)
+
+	assert source.size == len(file_data)
+	assert source.read_range(10, 100) == file_data[10:110]
+	assert source.read_range(len(file_data) - 10, 100) == file_data[-10:]
+	assert source.num_requests == 2
+	assert source.num_bytes == 110
+
+
+@test(
+	"RangeReader",
+	tags=['unit', 'readers', 'RangeReader'],
+)
+def _():
+	file_data = AUDIO_FILEPATH.read_bytes()
+	source = FileRangeSource(AUDIO_FILEPATH)
+
+	with RangeReader(source, block_size=1024, max_blocks=4) as reader:
+		reader.seek(1000, os.SEEK_SET)
+		assert reader.read(100) == file_data[1000:1100]
+		assert (source.num_requests, source.num_bytes) == (1, 2048)
+
+		# Cached blocks aren't read again.
+		reader.seek(0, os.SEEK_SET)
+		assert reader.read(2048) == file_data[:2048]
+		assert source.num_requests == 1
+
+		# Consecutive missing blocks are read at once.
+		assert reader.read(2048) == file_data[2048:4096]
+		assert (source.num_requests, source.num_bytes) == (2, 4096)
+
+		# Large reads are read directly.
+		reader.seek(-5000, os.SEEK_END)
+		assert reader.read() == file_data[-5000:]
+		assert (source.num_requests, source.num_bytes) == (3, 9096)
+		assert reader.read() == b''
+
+		# Least recently used blocks are discarded.
+		reader.seek(6 * 1024, os.SEEK_SET)
+		reader.read(1)
+		reader.seek(0, os.SEEK_SET)
+		reader.read(1)
+		assert source.num_requests == 5
+
+		with raises(ValueError):
+			reader.seek(-1, os.SEEK_SET)
+
+	assert reader.closed
+
+
+@test(
+	"RangeReader with DataReader matches DataReader",
+	tags=['unit', 'readers', 'RangeReader'],
+)
+def _():
+	ranged = DataReader(RangeReader(FileRangeSource(AUDIO_FILEPATH)))
+	buffered = DataReader(AUDIO_FILEPATH)
+
+	assert ranged.peek(4) == buffered.peek(4)
+	assert ranged.read(100) == buffered.read(100)
+	assert ranged.seek(-100, os.SEEK_END) == buffered.seek(-100, os.SEEK_END)
+	assert ranged.read() == buffered.read()
+	assert ranged.seek(0, os.SEEK_SET) == buffered.seek(0, os.SEEK_SET) == 0
+	assert ranged.find(b'Xing') == buffered.find(b'Xing')
+
+
+@test(
+	"PlannedReader reads the head and tail once",
+	tags=['unit', 'readers', 'PlannedReader'],
+)
+def _():
+	# An ID3v2.4 tag with a 100000 byte body followed by 300000 bytes of audio.
+	file_data = b'ID3\x04\x00\x00\x00\x06\x0D\x20' + bytes(100000) + bytes(range(256)) * 1200
+	head_size = 16 * 1024
+	io_stats = IOStats()
+
+	with PlannedReader(BytesIO(file_data), io_stats=io_stats) as reader:
+		# The head isn't extended over the tag.
+		assert (io_stats.num_reads, io_stats.num_bytes) == (1, head_size)
+
+		assert reader.read(10) == file_data[:10]
+		reader.seek(head_size - 100, os.SEEK_SET)
+		assert reader.read(200) == file_data[head_size - 100 : head_size]
+		assert io_stats.num_reads == 1
+
+		reader.seek(-100, os.SEEK_END)
+		assert reader.read() == file_data[-100:]
+		reader.seek(-64 * 1024, os.SEEK_END)
+		assert reader.read(100) == file_data[-64 * 1024 : -64 * 1024 + 100]
+		assert (io_stats.num_reads, io_stats.num_bytes) == (2, head_size + 64 * 1024)
+
+		# Reads between the head and tail go to the file.
+		reader.seek(200000, os.SEEK_SET)
+		assert reader.read(100) == file_data[200000:200100]
+		assert (io_stats.num_reads, io_stats.num_bytes) == (3, head_size + 64 * 1024 + 100)
+
+		# Up to the start of the tail.
+		reader.seek(-64 * 1024 - 100, os.SEEK_END)
+		assert reader.read(200) == file_data[-64 * 1024 - 100 : -64 * 1024]
+
+		with raises(ValueError):
+			reader.seek(-1, os.SEEK_SET)
+
+	assert reader.closed
+
+
+@test(
+	"PlannedReader doesn't read the tail of FLAC files",
+	tags=['unit', 'readers', 'PlannedReader'],
+)
+def _():
+	streaminfo = b'\x00\x00\x00\x22' + bytes(34)
+	comments = b'\x84\x01\x86\xA0' + bytes(100000)
+	file_data = b'fLaC' + streaminfo + comments + bytes(300000)
+	io_stats = IOStats()
+
+	with PlannedReader(BytesIO(file_data), io_stats=io_stats) as reader:
+		assert (io_stats.num_reads, io_stats.num_bytes) == (1, 16 * 1024)
+
+		reader.seek(-100, os.SEEK_END)
+		assert reader.read() == file_data[-100:]
+		assert (io_stats.num_reads, io_stats.num_bytes) == (2, 16 * 1024 + 100)
+
+		reader.seek(0, os.SEEK_SET)
+		assert reader.readall() == file_data
+
+
+@test(
+	"PlannedReader reads small files whole",
+	tags=['unit', 'readers', 'PlannedReader'],
+)
+def _():
+	io_stats = IOStats()
+
+	with PlannedReader(FileIO(AUDIO_FILEPATH), io_stats=io_stats) as reader:
+		assert reader.name == AUDIO_FILEPATH
+		assert reader.read() == AUDIO_FILEPATH.read_bytes()
+		assert (io_stats.num_reads, io_stats.num_bytes) == (1, AUDIO_FILEPATH.stat().st_size)
+
+
+@test(
+	"Readers seek relative to the start, position, or end",
+	tags=['unit', 'readers'],
+)
+def _():
+	file_data = AUDIO_FILEPATH.read_bytes()
+	size = len(file_data)
+
+	for reader in [
+		FileSectionReader(AUDIO_FILEPATH, 0, size),
+		RangeReader(FileRangeSource(AUDIO_FILEPATH)),
+		PlannedReader(FileIO(AUDIO_FILEPATH)),
+		MmapDataReader(AUDIO_FILEPATH),
+	]:
+		with reader:
+			assert reader.seekable()
+			assert reader.seek(10) == 10
+			assert reader.seek(5, os.SEEK_CUR) == 15
+			assert reader.tell() == 15
+			assert reader.seek(-10, os.SEEK_END) == size - 10
+			assert reader.read() == file_data[-10:]
+			assert reader.seek(10, os.SEEK_END) == size + 10
+			assert reader.read() == b''
+
+			with raises(ValueError):
+				reader.seek(-1, os.SEEK_SET)
+
+			with raises(ValueError):
+				reader.seek(0, 3)
+
+		with raises(ValueError):
+			reader.tell()
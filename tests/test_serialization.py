@@ -0,0 +1,150 @@
+import enum
+from array import array
+
+from ward import (
+	raises,
+	test,
+)
+
+from audio_metadata import (
+	FLACSeekPoint,
+	ID3PictureType,
+	ID3Version,
+	Picture,
+)
+from audio_metadata.serialization import (
+	deserialize,
+	serialize,
+)
+
+
+class Color(enum.Enum):
+	RED = 1
+
+
+@test(
+	"serialize/deserialize builtin values",
+	tags=['unit', 'serialization'],
+)
+def _():
+	values = [
+		None,
+		True,
+		False,
+		0,
+		191,
+		192,
+		-1,
+		2 ** 63,
+		-2 ** 100,
+		1.5,
+		'',
+		'text',
+		'\udc80',
+		b'\x00\xFF',
+		[],
+		[''],
+		['a', 'b'],
+		['a\x00b', 'c'],
+		['a', 1],
+		(1, (2, 'b')),
+		{'key': 'value', 1: [2]},
+		array('Q', [1, 2 ** 64 - 1]),
+	]
+
+	assert deserialize(serialize(values)) == values
+	assert type(deserialize(serialize(values))[-1]) is array
+
+
+@test(
+	"serialize/deserialize audio_metadata objects",
+	tags=['unit', 'serialization'],
+)
+def _():
+	picture = Picture(type=ID3PictureType.COVER_FRONT, data=b'data')
+	shared = ['shared']
+	value = {
+		'pictures': [picture, picture, Picture(type=ID3PictureType.OTHER, data=b'')],
+		'seek_point': FLACSeekPoint(first_sample=1, offset=2, num_samples=3),
+		'version': ID3Version.v24,
+		'a': shared,
+		'b': shared,
+	}
+
+	result = deserialize(serialize(value))
+
+	assert result == value
+	assert result['pictures'][0] is result['pictures'][1]
+	assert result['a'] is result['b']
+	assert result['version'] is ID3Version.v24
+
+
+@test(
+	"Objects outside of audio_metadata raise TypeError",
+	tags=['unit', 'serialization'],
+)
+def _():
+	with raises(TypeError):
+		serialize(Color.RED)
+
+	with raises(TypeError):
+		serialize({1, 2})
+
+
+@test(
+	"Invalid data raises ValueError",
+	tags=['unit', 'serialization'],
+)
+def _():
+	b = serialize(['text', 1])
+
+	with raises(ValueError) as exc:
+		deserialize('text')
+	assert str(exc.raised) == "Not a valid bytes-like object."
+
+	with raises(ValueError) as exc:
+		deserialize(b'\x80\x04')
+	assert str(exc.raised) == "Not serialized audio metadata."
+
+	with raises(ValueError) as exc:
+		deserialize(b[:-2])
+	assert str(exc.raised) == "Serialized data is truncated."
+
+	with raises(ValueError) as exc:
+		deserialize(b[:-1])
+	assert str(exc.raised) == "Invalid serialized data."
+
+	with raises(ValueError) as exc:
+		deserialize(b + b'\x00')
+	assert str(exc.raised) == "Unexpected data after serialized object."
+
+	with raises(ValueError) as exc:
+		deserialize(b[:4] + b'\xFF')
+	assert str(exc.raised) == "Invalid type code: 0xff."
+
+	# Only audio_metadata classes can be created.
+	with raises(ValueError) as exc:
+		deserialize(b[:4] + b'\xCD\xCE\x0Eos:_wrap_close\xC0')
+	assert str(exc.raised) == "Not an audio_metadata class: os:_wrap_close."
+
+
+@test(
+	"Classes reachable from audio_metadata modules can't be created",
+	tags=['unit', 'serialization'],
+)
+def _():
+	b = serialize(None)
+
+	for name in [
+		'audio_metadata.api:asyncio.subprocess.subprocess.Popen',
+		'audio_metadata.cache:sqlite3.Connection',
+		'audio_metadata.api:ThreadPoolExecutor',
+		'subprocess',
+		'MetadataCache',
+		'PlannedReader',
+	]:
+		encoded = name.encode()
+
+		with raises(ValueError) as exc:
+			deserialize(b[:4] + b'\xCD\xCE' + bytes([len(encoded)]) + encoded + b'\xC0')
+		assert str(exc.raised) == f"Not an audio_metadata class: {name}."
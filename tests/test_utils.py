@@ -1,3 +1,4 @@
+import random
 from pathlib import Path
 
 from ward import (
@@ -9,6 +10,7 @@ from ward import (
 from audio_metadata.utils import (
 	apply_unsynchronization,
 	decode_bytestring,
+	decode_split_encoded,
 	decode_synchsafe_int,
 	determine_encoding,
 	encode_synchsafe_int,
@@ -37,6 +39,8 @@ def _(
 		b'\xFF\x00\xFF',
 		b'\xFF\x00\x00',
 		b'\xFF\x00\xFF\xFE',
+		b'\xFF\xFF\x00',
+		b'\xFF\xFF\xE0',
 	),
 	expected=each(
 		b'TEST',
@@ -47,11 +51,68 @@ def _(
 		b'\xFF\x00\x00\xFF',
 		b'\xFF\x00\x00\x00',
 		b'\xFF\x00\x00\xFF\x00\xFE',
+		b'\xFF\x00\xFF\x00\x00',
+		b'\xFF\x00\xFF\x00\xE0',
 	),
 ):
 	assert apply_unsynchronization(b) == expected
 
 
+def _apply_unsynchronization_reference(data):
+	# The slice-and-copy implementation that apply_unsynchronization replaced.
+	# It skipped the byte after each 0xFF, so it was only correct without consecutive 0xFF bytes.
+	sync_index = data.find(b'\xFF')
+	if sync_index == -1:
+		return data
+
+	data = bytearray(data)
+
+	d = bytearray()
+	while sync_index != -1:
+		d += data[:sync_index + 1]
+
+		b = data[sync_index + 1 : sync_index + 2]
+		if b >= b'\xE0':
+			d += b'\x00'
+			d += b
+		elif b == b'\x00':
+			d += b'\x00\x00'
+		else:
+			d += b
+
+		data = data[sync_index + 2:]
+
+		sync_index = data.find(b'\xFF')
+
+	d += data
+
+	return bytes(d)
+
+
+@test(
+	"apply_unsynchronization properties",
+	tags=['unit', 'utils', 'apply_unsynchronization', 'remove_unsynchronization'],
+)
+def _():
+	rng = random.Random(0)
+
+	# Mostly bytes that matter to unsynchronization, with runs of 0xFF.
+	alphabet = b'\x00\x00\x01\x7F\xDF\xE0\xFE\xFF\xFF\xFF'
+
+	for _ in range(2000):
+		b = bytes(rng.choice(alphabet) for _ in range(rng.randrange(20)))
+		unsync = apply_unsynchronization(b)
+
+		assert remove_unsynchronization(unsync) == b
+		assert not any(
+			unsync[i] == 0xFF and unsync[i + 1] >= 0xE0
+			for i in range(len(unsync) - 1)
+		)
+
+		if b'\xFF\xFF' not in b:
+			assert unsync == _apply_unsynchronization_reference(b)
+
+
 @test(
 	"remove_unsynchronization",
 	tags=['unit', 'utils', 'remove_unsynchronization'],
@@ -310,6 +371,8 @@ def _(
 		b'\xfe\xff\x00t\x00e\x00s\x00t\x00',
 		b'test\x00',
 		b'test',
+		b'a\x00\x00\x01\x00\x00b\x00',
+		b'\x00a\x01\x00\x00\x00\x00b',
 	),
 	encoding=each(
 		'iso-8859-1',
@@ -320,6 +383,8 @@ def _(
 		'utf-16-be',
 		'utf-8',
 		'iso-9959-1',
+		'utf-16-le',
+		'utf-16-be',
 	),
 	expected=each(
 		[b'test'],
@@ -330,6 +395,55 @@ def _(
 		[b'\xfe\xff\x00t\x00e\x00s\x00t'],
 		[b'test'],
 		[b'test'],
+		[b'a\x00\x00\x01', b'b\x00'],
+		[b'\x00a\x01\x00', b'\x00b'],
 	),
 ):
 	assert split_encoded(b, encoding) == expected
+
+
+@test(
+	"split_encoded with max_split",
+	tags=['unit', 'utils', 'split_encoded'],
+)
+def _():
+	assert split_encoded(b'a\x00b\x00c\x00', 'iso-8859-1', 1) == [b'a', b'b\x00c\x00']
+	assert split_encoded(b'a\x00', 'iso-8859-1', 1) == [b'a', b'']
+	assert split_encoded(b'a\x00\x00\x00b\x00\x00\x00', 'utf-16-le', 1) == [b'a\x00', b'b\x00\x00\x00']
+
+
+@test(
+	"decode_split_encoded",
+	tags=['unit', 'utils', 'decode_split_encoded'],
+)
+def _():
+	values = ['value {}'.format(i) for i in range(1000)]
+
+	for encoding, data in [
+		('iso-8859-1', '\x00'.join(values).encode('iso-8859-1')),
+		('utf-8', '\x00'.join(values).encode('utf-8')),
+		('utf-16-le', b'\x00\x00'.join(b'\xff\xfe' + value.encode('utf-16-le') for value in values)),
+		('utf-16-be', '\x00'.join(values).encode('utf-16-be')),
+	]:
+		assert decode_split_encoded(data, encoding) == values
+		assert decode_split_encoded(data, encoding) == [
+			decode_bytestring(value, encoding)
+			for value in split_encoded(data, encoding)
+		]
+
+	assert decode_split_encoded(b'a\x00\x00\x01\x00\x00b', 'utf-16-le') == ['a\u0100', 'b']
+
+	rng = random.Random(0)
+	alphabet = b'\x00\x00\x00\x01aZ\xfe\xff'
+
+	for encoding in ['iso-8859-1', 'utf-8', 'utf-16-le', 'utf-16-be']:
+		for _ in range(500):
+			data = bytes(rng.choice(alphabet) for _ in range(rng.randrange(16)))
+			if encoding == 'utf-8':
+				data = data.replace(b'\xfe', b'').replace(b'\xff', b'')
+
+			for max_split in [None, 1, 2]:
+				assert decode_split_encoded(data, encoding, max_split) == [
+					decode_bytestring(value, encoding)
+					for value in split_encoded(data, encoding, max_split)
+				]
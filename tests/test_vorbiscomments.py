@@ -1,3 +1,6 @@
+import struct
+
+from tbm_utils import DataReader
 from ward import (
 	each,
 	raises,
@@ -119,3 +122,66 @@ def _():
 	with raises(TagError) as exc:
 		VorbisComments({'albu~': 'test-album'})
 	assert str(exc.raised) == "Invalid character in Vorbis comment name: ``albu~``."
+
+
+@test(
+	"VorbisComments.parse matches VorbisComment.parse",
+	tags=['unit', 'vorbis', 'comment', 'comments', 'VorbisComments'],
+)
+@using(data=vorbis_comments)
+def _(data):
+	reader = DataReader(data)
+	reader.seek(struct.unpack('I', reader.read(4))[0], 1)
+	num_comments = struct.unpack('I', reader.read(4))[0]
+
+	expected = {}
+	for _ in range(num_comments):
+		comment = VorbisComment.parse(reader)
+		expected.setdefault(comment.name, []).append(comment.value)
+
+	vorbis_comments = VorbisComments.parse(data + b'\x01')
+
+	assert dict(vorbis_comments.items()) == expected
+
+
+@test(
+	"VorbisComments.parse leaves reader after the last comment",
+	tags=['unit', 'vorbis', 'comment', 'comments', 'VorbisComments'],
+)
+def _():
+	data = DataReader(
+		b'\x00\x00\x00\x00\x02\x00\x00\x00'
+		b'\x0b\x00\x00\x00TITLE=t\xc3\xa9st'
+		b'\x0e\x00\x00\x00title=test=ing'
+		b'\x01'
+	)
+	vorbis_comments = VorbisComments.parse(data)
+
+	assert vorbis_comments.title == ['tést', 'test=ing']
+	assert data.read() == b'\x01'
+
+
+@test(
+	"Invalid comments raise errors in VorbisComments.parse",
+	tags=['unit', 'vorbis', 'comment', 'comments', 'VorbisComments'],
+)
+def _(
+	data=each(
+		b'\x00\x00\x00\x00\x01\x00\x00\x00\x09\x00\x00\x00albumtest-album',
+		b'\x00\x00\x00\x00\x01\x00\x00\x00\x10\x00\x00\x00albu~=test-album',
+		b'\x00\x00\x00\x00\x01\x00\x00\x00\x11\x00\x00\x00alb\xc3\xa9=test-album',
+	),
+	exception=each(
+		FormatError,
+		TagError,
+		TagError,
+	),
+	message=each(
+		"Vorbis comment must contain an ``=``.",
+		"Invalid character in Vorbis comment name: ``albu~``.",
+		"Invalid character in Vorbis comment name: ``albé``.",
+	),
+):
+	with raises(exception) as exc:
+		VorbisComments.parse(data)
+	assert str(exc.raised) == message